@@ -0,0 +1,308 @@
+import random
+import time
+from position_cache import SymmetricZobrist
+
+WIN_SCORE = 1000  # Value of a won Simple game, larger than any General score difference
+EXACT, LOWER, UPPER = 0, 1, 2  # Transposition table bound types
+MODE_SALT = {"Simple": 0, "General": 0x9E3779B97F4A7C15}  # Keeps the modes apart in the table and position cache
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move's time budget runs out."""
+
+
+class TranspositionTable:
+    """Fixed-size table of search results indexed by Zobrist hash.
+
+    Each hash maps to one slot. A new result replaces the slot when the slot is
+    empty, holds the same position, was stored by an earlier search, or was
+    searched to a smaller depth; otherwise the deeper result is kept.
+    """
+
+    def __init__(self, size=1 << 18):
+        self.size = size
+        self.slots = [None] * size
+        self.generation = 0  # Incremented for every new root search
+        self.probes = 0
+        self.hits = 0
+
+    def new_search(self):
+        """Marks the entries stored so far as belonging to an older search."""
+        self.generation += 1
+
+    def clear(self):
+        """Removes every entry and resets the statistics."""
+        self.slots = [None] * self.size
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key):
+        """Returns the (key, depth, value, bound, move, generation) entry for key, or None."""
+        self.probes += 1
+        entry = self.slots[key % self.size]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, value, bound, move):
+        """Stores a search result, following the replacement policy."""
+        index = key % self.size
+        entry = self.slots[index]
+        if entry is None or entry[0] == key or entry[5] != self.generation or entry[1] <= depth:
+            self.slots[index] = (key, depth, value, bound, move, self.generation)
+
+    def hit_rate(self):
+        """Returns the fraction of probes that found their position."""
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class AlphaBetaPlayer:
+    """Computer player using iterative-deepening alpha-beta search over GameManager positions.
+
+    Values are the future score difference for the side to move (or WIN_SCORE
+    in Simple mode), so they depend only on the board and the transposition
+    table can be shared between both colours and across moves of one game.
+
+    With a position_cache (a position_cache.PositionCache), results are stored
+    there under symmetry-canonical hashes instead of in the transposition
+    table, so each result also serves the seven symmetric boards. This pays
+    off on small boards, where symmetric positions are common.
+    """
+
+    def __init__(self, time_limit=1.0, max_depth=None, table_size=1 << 18, seed=None, position_cache=None):
+        self.time_limit = time_limit  # Wall-clock budget per move, in seconds
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_size)
+        self.rng = random.Random(seed)
+        self.zobrist_keys = {}  # Board size -> per-cell {'S': key, 'O': key}
+        self.position_cache = position_cache
+        self.symmetric_hashers = {}  # Board size -> SymmetricZobrist, used with a position cache
+        self.symmetric = None  # SymmetricZobrist of the position being searched
+        self.mode_salt = 0
+        self.last_stats = {}
+        self.cancel_event = None
+
+    def get_zobrist_keys(self, board_size):
+        """Returns the random 64-bit keys for every cell and character of the given board size."""
+        keys = self.zobrist_keys.get(board_size)
+        if keys is None:
+            key_rng = random.Random(board_size)  # Same keys for a size in every player
+            keys = [{'S': key_rng.getrandbits(64), 'O': key_rng.getrandbits(64)}
+                    for _ in range(board_size * board_size)]
+            self.zobrist_keys[board_size] = keys
+        return keys
+
+    def position_hash(self, game_manager):
+        """Computes the Zobrist hash of the current board from scratch."""
+        keys = self.get_zobrist_keys(game_manager.board_size)
+        size = game_manager.board_size
+        position_hash = 0
+        for row, board_row in enumerate(game_manager.board):
+            for col, cell in enumerate(board_row):
+                if cell != ' ':
+                    position_hash ^= keys[row * size + col][cell]
+        return position_hash
+
+    def get_symmetric_hasher(self, board_size):
+        """Returns the SymmetricZobrist of the given board size, built on the same keys as position_hash."""
+        hasher = self.symmetric_hashers.get(board_size)
+        if hasher is None:
+            hasher = SymmetricZobrist(board_size, self.get_zobrist_keys(board_size))
+            self.symmetric_hashers[board_size] = hasher
+        return hasher
+
+    def choose_move(self, game_manager, cancel_event=None):
+        """Returns the (row, col, character) the current player should play.
+
+        The game manager is searched in place with make_move/unmake_move and is
+        left exactly as it was passed in. Setting cancel_event (a
+        threading.Event) stops the search early with the best move found so far.
+        """
+        self.deadline = time.perf_counter() + self.time_limit
+        self.cancel_event = cancel_event
+        self.nodes = 0
+        self.table.new_search()
+        probes, hits = self.table.probes, self.table.hits
+        if self.position_cache is not None:
+            cache_lookups = self.position_cache.hits + self.position_cache.misses
+            cache_hits = self.position_cache.hits
+        start = time.perf_counter()
+        log_length = len(game_manager.move_log)
+        if self.position_cache is None:
+            # Values differ between modes for the same board, so the modes must not share entries
+            root_hash = self.position_hash(game_manager) ^ MODE_SALT[game_manager.game_mode]
+        else:
+            # With a position cache, the hash passed down the search is the tuple of symmetric hashes
+            self.symmetric = self.get_symmetric_hasher(game_manager.board_size)
+            self.mode_salt = MODE_SALT[game_manager.game_mode]
+            root_hash = self.symmetric.hashes(game_manager.board)
+
+        moves = self.ordered_moves(game_manager, None)
+        quiet_start = next((i for i, move in enumerate(moves) if move[3] == 0), len(moves))
+        quiet = moves[quiet_start:]
+        self.rng.shuffle(quiet)  # Vary play between equally good quiet moves
+        moves[quiet_start:] = quiet
+        best_move = moves[0][:3]
+
+        max_depth = game_manager.empty_count
+        if self.max_depth is not None:
+            max_depth = min(max_depth, self.max_depth)
+
+        completed_depth = 0
+        try:
+            for depth in range(1, max_depth + 1):
+                value, move = self.search_root(game_manager, moves, depth, root_hash)
+                best_move = move
+                completed_depth = depth
+                # Search the previous best move first at the next depth
+                moves.sort(key=lambda candidate: candidate[:3] != move)
+                if abs(value) >= WIN_SCORE:
+                    break  # Forced result found
+        except SearchTimeout:
+            while len(game_manager.move_log) > log_length:
+                game_manager.unmake_move()
+
+        elapsed = time.perf_counter() - start
+        probes = self.table.probes - probes
+        self.last_stats = {
+            "depth": completed_depth,
+            "nodes": self.nodes,
+            "elapsed": elapsed,
+            "nodes_per_second": self.nodes / elapsed if elapsed else 0.0,
+            "tt_hit_rate": (self.table.hits - hits) / probes if probes else 0.0,
+        }
+        if self.position_cache is not None:
+            cache_lookups = self.position_cache.hits + self.position_cache.misses - cache_lookups
+            cache_hits = self.position_cache.hits - cache_hits
+            self.last_stats["cache_hit_rate"] = cache_hits / cache_lookups if cache_lookups else 0.0
+        return best_move
+
+    def search_root(self, game_manager, moves, depth, root_hash):
+        """Searches every root move to the given depth and returns the best (value, move)."""
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0][:3]
+        for row, col, character, gain in moves:
+            value = self.search_move(game_manager, row, col, character, gain, depth, alpha, WIN_SCORE + 1, root_hash)
+            if value > alpha:
+                alpha = value
+                best_move = (row, col, character)
+        return alpha, best_move
+
+    def search_move(self, game_manager, row, col, character, gain, depth, alpha, beta, position_hash):
+        """Makes one move, searches the reply, unmakes it and returns the value for the mover."""
+        if self.position_cache is None:
+            keys = self.get_zobrist_keys(game_manager.board_size)
+            child_hash = position_hash ^ keys[row * game_manager.board_size + col][character]
+        else:
+            child_hash = self.symmetric.update(position_hash, row * game_manager.board_size + col, character)
+        result = game_manager.make_move(row, col, character)["result"]
+
+        if result == "win":
+            value = WIN_SCORE
+        elif result in ("draw", "end"):
+            value = gain
+        elif result == "continue":
+            # The mover scored and moves again, so the child value is on the same side
+            value = gain + self.negamax(game_manager, depth - 1, alpha - gain, beta - gain, child_hash)
+        else:
+            game_manager.switch_turn()
+            value = -self.negamax(game_manager, depth - 1, -beta, -alpha, child_hash)
+
+        game_manager.unmake_move()
+        return value
+
+    def negamax(self, game_manager, depth, alpha, beta, position_hash):
+        """Returns the value of the position for the side to move, within the (alpha, beta) window."""
+        self.nodes += 1
+        if self.nodes & 127 == 0 and (time.perf_counter() > self.deadline or (
+                self.cancel_event is not None and self.cancel_event.is_set())):
+            raise SearchTimeout()
+
+        if depth == 0:
+            return 0
+
+        original_alpha = alpha
+        best_move = None
+        if self.position_cache is None:
+            entry = self.table.probe(position_hash)
+        else:
+            entry = self.probe_cache(position_hash, game_manager.board_size)
+        if entry is not None:
+            best_move = entry[4]
+            if entry[1] >= depth:
+                value, bound = entry[2], entry[3]
+                if bound == EXACT:
+                    return value
+                if bound == LOWER and value >= beta:
+                    return value
+                if bound == UPPER and value <= alpha:
+                    return value
+
+        best_value = -WIN_SCORE - 1
+        for row, col, character, gain in self.ordered_moves(game_manager, best_move):
+            value = self.search_move(game_manager, row, col, character, gain, depth, alpha, beta, position_hash)
+            if value > best_value:
+                best_value = value
+                best_move = (row, col, character)
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        if self.position_cache is None:
+            self.table.store(position_hash, depth, best_value, bound, best_move)
+        else:
+            self.store_cache(position_hash, game_manager.board_size, depth, best_value, bound, best_move)
+        return best_value
+
+    def probe_cache(self, hashes, board_size):
+        """Looks a position up in the position cache, in the same entry layout as TranspositionTable.probe."""
+        key, symmetry_index = self.symmetric.canonical(hashes)
+        entry = self.position_cache.get(key ^ self.mode_salt)
+        if entry is None:
+            return None
+        depth, value, bound, move = entry
+        if move is not None:
+            # The cached move is on the canonical board; map it back onto this one
+            row, col = divmod(self.symmetric.inverses[symmetry_index][move[0]], board_size)
+            move = (row, col, move[1])
+        return key, depth, value, bound, move, None
+
+    def store_cache(self, hashes, board_size, depth, value, bound, move):
+        """Stores a search result in the position cache, with its move mapped onto the canonical board."""
+        key, symmetry_index = self.symmetric.canonical(hashes)
+        if move is not None:
+            move = (self.symmetric.symmetries[symmetry_index][move[0] * board_size + move[1]], move[2])
+        self.position_cache.put(key ^ self.mode_salt, (depth, value, bound, move))
+
+    def ordered_moves(self, game_manager, first_move):
+        """Returns (row, col, character, sos_gain) for every legal move, SOS-completing moves first.
+
+        Scoring moves come from the game manager's threat maps and are sorted by
+        how many lines they complete; first_move, usually the transposition
+        table's best move, goes ahead of the quiet moves.
+        """
+        s_threats = game_manager.scoring_cells('S')
+        o_threats = game_manager.scoring_cells('O')
+        scoring = [(row, col, 'S', gain) for (row, col), gain in s_threats.items()]
+        scoring += [(row, col, 'O', gain) for (row, col), gain in o_threats.items()]
+        scoring.sort(key=lambda move: -move[3])
+
+        quiet = []
+        for cell in game_manager.legal_moves():
+            if cell not in s_threats:
+                quiet.append((cell[0], cell[1], 'S', 0))
+            if cell not in o_threats:
+                quiet.append((cell[0], cell[1], 'O', 0))
+        if (first_move is not None and first_move[:2] in game_manager.legal_moves()
+                and first_move[:2] not in (s_threats if first_move[2] == 'S' else o_threats)):
+            quiet.remove((first_move[0], first_move[1], first_move[2], 0))
+            quiet.insert(0, (first_move[0], first_move[1], first_move[2], 0))
+        return scoring + quiet
@@ -0,0 +1,186 @@
+import numpy as np
+from game_manager import GameManager
+
+# Cell codes of the int8 board arrays
+EMPTY, S, O = 0, 1, 2
+CHARACTER_CODES = {' ': EMPTY, 'S': S, 'O': O}
+CODE_CHARACTERS = {EMPTY: ' ', S: 'S', O: 'O'}
+
+# Player and winner codes
+BLUE, RED, DRAW, NO_WINNER = 0, 1, 2, -1
+PLAYER_NAMES = {BLUE: "Blue", RED: "Red", DRAW: "Draw"}
+
+PADDING = 2  # Empty border around each board so neighbour lookups never leave the array
+DIRECTIONS = np.array([(0, 1), (1, 0), (1, 1), (1, -1)])
+OFFSETS = np.arange(-2, 3)  # Window of five cells centred on the move along each direction
+
+
+def mix64(values):
+    """Applies the SplitMix64 finaliser to a uint64 array; overflow wraps by design."""
+    with np.errstate(over="ignore"):
+        values = values + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def random_move_order(seeds, cell_count):
+    """Returns (cell order, character codes), both (games, cells), for seeded random games.
+
+    Move k of a game is order[k] and it places characters[order[k]]. Both depend
+    only on the seed, so a game draws the same moves whether it is played alone
+    or in a batch.
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64)[:, None]
+    cells = np.arange(cell_count, dtype=np.uint64)[None, :]
+    keys = mix64(mix64(seeds) ^ cells)
+    order = np.argsort(keys, axis=1, kind="stable")
+    characters = np.where(mix64(keys) & np.uint64(1), O, S).astype(np.int8)
+    return order, characters
+
+
+class RandomPolicy:
+    """Plays every game in a uniformly random order of cells with random characters, from its seed."""
+
+    def __init__(self, simulator):
+        self.order, self.characters = random_move_order(simulator.seeds, simulator.board_size ** 2)
+
+    def __call__(self, simulator):
+        """Returns the next (cells, characters) of every game."""
+        games = np.arange(simulator.num_games)
+        cells = self.order[games, np.minimum(simulator.move_counts, self.order.shape[1] - 1)]
+        return cells, self.characters[games, cells]
+
+
+class BatchSimulator:
+    """Plays many SOS games in lockstep on an (N, size, size) int8 array.
+
+    Each step applies one move to every game still in progress and detects new
+    SOS lines by comparing the five-cell window around each move in all four
+    directions at once. Scoring, extra turns and game endings follow GameManager.
+    """
+
+    def __init__(self, num_games, board_size=3, game_mode="Simple", seeds=None):
+        self.num_games = num_games
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.seeds = np.arange(num_games, dtype=np.uint64) if seeds is None else np.asarray(seeds, dtype=np.uint64)
+
+        padded_size = board_size + 2 * PADDING
+        self.padded_boards = np.zeros((num_games, padded_size, padded_size), dtype=np.int8)
+        self.boards = self.padded_boards[:, PADDING:-PADDING, PADDING:-PADDING]  # View of the real cells
+        self.scores = np.zeros((num_games, 2), dtype=np.int32)  # Blue and Red SOS counts
+        self.current_players = np.full(num_games, BLUE, dtype=np.int8)
+        self.active = np.ones(num_games, dtype=bool)
+        self.winners = np.full(num_games, NO_WINNER, dtype=np.int8)
+        self.move_counts = np.zeros(num_games, dtype=np.int32)
+
+    def count_new_sos(self, games, rows, cols):
+        """Returns how many SOS lines pass through the given cells of the given games."""
+        # (games, 4 directions, 5 offsets) windows of cell codes around each move
+        window_rows = rows[:, None, None] + PADDING + DIRECTIONS[None, :, 0, None] * OFFSETS
+        window_cols = cols[:, None, None] + PADDING + DIRECTIONS[None, :, 1, None] * OFFSETS
+        windows = self.padded_boards[games[:, None, None], window_rows, window_cols]
+
+        is_s = windows == S
+        is_o = windows == O
+        centre_first = is_s[..., 2] & is_o[..., 3] & is_s[..., 4]
+        centre_middle = is_s[..., 1] & is_o[..., 2] & is_s[..., 3]
+        centre_last = is_s[..., 0] & is_o[..., 1] & is_s[..., 2]
+        return (centre_first.astype(np.int32) + centre_middle + centre_last).sum(axis=1)
+
+    def step(self, cells, characters):
+        """Applies one move, given as a flat cell index and a character code, to every active game."""
+        games = np.flatnonzero(self.active)
+        if games.size == 0:
+            return
+        cells = np.asarray(cells)[games]
+        characters = np.asarray(characters, dtype=np.int8)[games]
+        rows, cols = np.divmod(cells, self.board_size)
+
+        if (self.boards[games, rows, cols] != EMPTY).any():
+            raise ValueError("A move targets an occupied cell")
+
+        self.boards[games, rows, cols] = characters
+        self.move_counts[games] += 1
+        sos_created = self.count_new_sos(games, rows, cols)
+        scored = sos_created > 0
+        players = self.current_players[games]
+        board_full = self.move_counts[games] == self.board_size ** 2
+
+        if self.game_mode == "Simple":
+            won = games[scored]
+            self.winners[won] = players[scored]
+            drawn = games[~scored & board_full]
+            self.winners[drawn] = DRAW
+            finished = scored | board_full
+        else:
+            self.scores[games[scored], players[scored]] += sos_created[scored]
+            ended = games[board_full]
+            blue, red = self.scores[ended, BLUE], self.scores[ended, RED]
+            self.winners[ended] = np.where(blue > red, BLUE, np.where(red > blue, RED, DRAW))
+            finished = board_full
+
+        self.active[games[finished]] = False
+        # The turn passes only after a move that scores nothing and does not end the game
+        passing = games[~scored & ~finished]
+        self.current_players[passing] = 1 - self.current_players[passing]
+
+    def run(self, policy=None):
+        """Plays every game to the end, asking policy(simulator) for (cells, characters) each step.
+
+        Without a policy the games are played by RandomPolicy.
+        """
+        if policy is None:
+            policy = RandomPolicy(self)
+        while self.active.any():
+            cells, characters = policy(self)
+            self.step(cells, characters)
+        return self.results()
+
+    def results(self):
+        """Returns the per-game outcome as a dict of arrays: winner codes, scores and moves played."""
+        return {
+            "winners": self.winners.copy(),
+            "blue_scores": self.scores[:, BLUE].copy(),
+            "red_scores": self.scores[:, RED].copy(),
+            "move_counts": self.move_counts.copy(),
+        }
+
+
+def play_reference_game(board_size, game_mode, seed):
+    """Plays one game with GameManager using the same seeded random moves as BatchSimulator.
+
+    Returns the final board as an int8 array and a dict of the winner code,
+    scores and move count, for cross-checking one game of BatchSimulator.
+    """
+    game_manager = GameManager(board_size, game_mode)
+    game_manager.reset_game(board_size, game_mode)
+    winner = NO_WINNER
+    move_number = 0
+    order, characters = random_move_order([seed], board_size * board_size)
+
+    while winner == NO_WINNER:
+        cell = int(order[0, move_number])
+        character = CODE_CHARACTERS[int(characters[0, cell])]
+        mover = game_manager.get_current_player()
+
+        result = game_manager.make_move(cell // board_size, cell % board_size, character)
+        move_number += 1
+        if result["result"] == "win":
+            winner = BLUE if mover == "Blue" else RED
+        elif result["result"] == "draw":
+            winner = DRAW
+        elif result["result"] == "end":
+            winner = {"Blue": BLUE, "Red": RED, "Draw": DRAW}[result["winner"]]
+        elif result["result"] == "next_turn":
+            game_manager.switch_turn()
+
+    board = np.array([[CHARACTER_CODES[cell] for cell in row] for row in game_manager.board], dtype=np.int8)
+    result = {
+        "winner": winner,
+        "blue_score": game_manager.sos_count["Blue"],
+        "red_score": game_manager.sos_count["Red"],
+        "move_count": move_number,
+    }
+    return board, result
@@ -0,0 +1,425 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from alphabeta_player import AlphaBetaPlayer
+from bitboard_engine import BitboardGameManager
+from compact_state import CompactGameState
+from game_manager import GameManager
+from mcts_player import MCTSPlayer
+from position_cache import PositionCache
+
+ENGINES = {"list": GameManager, "bitboard": BitboardGameManager}
+SUITE_SIZES = (3, 5, 10, 20, 50, 100)
+SUITE_THROUGHPUT_SIZES = (3, 8, 15)
+SUITE_RENDER_SIZES = (3, 10, 30, 100)
+BUTTON_BOARD_MAX_SIZE = 30  # The original one-button-per-cell board gets too slow to time beyond this
+MOVES_PER_MEASUREMENT = 20000  # Random moves timed per board size in the latency benchmarks
+
+
+def random_move_sequence(board_size, rng):
+    """Returns every cell of the board in random order, each paired with a random character."""
+    cells = [(row, col) for row in range(board_size) for col in range(board_size)]
+    rng.shuffle(cells)
+    return [(row, col, rng.choice("SO")) for row, col in cells]
+
+
+def play_sequence(manager, moves):
+    """Plays moves on a reset manager until the game ends and returns the number of moves made."""
+    made = 0
+    for row, col, character in moves:
+        result = manager.make_move(row, col, character)
+        made += 1
+        if result["result"] in ("win", "draw", "end"):
+            break
+        if result["result"] == "next_turn":
+            manager.switch_turn()
+    return made
+
+
+def bench_make_move(engine_cls, board_size, game_mode, games, seed=0):
+    """Returns the average time per make_move call over random games, in microseconds."""
+    rng = random.Random(seed)
+    sequences = [random_move_sequence(board_size, rng) for _ in range(games)]
+    manager = engine_cls(board_size, game_mode)
+
+    total_moves = 0
+    elapsed = 0.0
+    for moves in sequences:
+        manager.reset_game(board_size, game_mode)
+        start = time.perf_counter()
+        total_moves += play_sequence(manager, moves)
+        elapsed += time.perf_counter() - start
+    return elapsed / total_moves * 1e6
+
+
+def random_position(board_size, game_mode, plies, rng):
+    """Returns a GameManager after up to plies random moves that do not end the game."""
+    manager = GameManager(board_size, game_mode)
+    manager.reset_game(board_size, game_mode)
+    for row, col, character in random_move_sequence(board_size, rng)[:plies]:
+        result = manager.make_move(row, col, character)
+        if result["result"] in ("win", "draw", "end"):
+            manager.unmake_move()
+            break
+        if result["result"] == "next_turn":
+            manager.switch_turn()
+    return manager
+
+
+def bench_alphabeta(board_size, game_mode, time_limit, positions, seed=0):
+    """Searches random positions and returns the summed search statistics of AlphaBetaPlayer."""
+    rng = random.Random(seed)
+    player = AlphaBetaPlayer(time_limit=time_limit, seed=seed)
+    totals = {"nodes": 0, "elapsed": 0.0, "depth": 0}
+    probes, hits = player.table.probes, player.table.hits
+    for _ in range(positions):
+        manager = random_position(board_size, game_mode, board_size, rng)
+        player.choose_move(manager)
+        totals["nodes"] += player.last_stats["nodes"]
+        totals["elapsed"] += player.last_stats["elapsed"]
+        totals["depth"] += player.last_stats["depth"]
+    probes = player.table.probes - probes
+    totals["nodes_per_second"] = totals["nodes"] / totals["elapsed"]
+    totals["tt_hit_rate"] = (player.table.hits - hits) / probes if probes else 0.0
+    totals["depth"] /= positions
+    return totals
+
+
+def bench_mcts(board_size, game_mode, time_limit, positions, workers, seed=0):
+    """Searches random positions with MCTSPlayer and returns the playouts per second."""
+    rng = random.Random(seed)
+    player = MCTSPlayer(time_limit=time_limit, workers=workers, seed=seed)
+    playouts = 0
+    elapsed = 0.0
+    try:
+        for _ in range(positions):
+            manager = random_position(board_size, game_mode, board_size, rng)
+            player.choose_move(manager)
+            playouts += player.last_stats["playouts"]
+            elapsed += player.last_stats["elapsed"]
+    finally:
+        player.close()
+    return playouts / elapsed
+
+
+def new_game_manager(board_size, game_mode, moves):
+    """Returns a GameManager, as the GUI and server create them, after playing moves."""
+    manager = GameManager(board_size, game_mode)
+    manager.reset_game(board_size, game_mode)
+    play_sequence(manager, moves)
+    return manager
+
+
+def new_compact_state(board_size, game_mode, moves):
+    """Returns a CompactGameState after playing moves."""
+    state = CompactGameState(board_size, game_mode)
+    play_sequence(state, moves)
+    return state
+
+
+# Each layout plays the same moves, so every one holds the same position
+MEMORY_LAYOUTS = {
+    "GameManager": new_game_manager,
+    "CompactGameState": new_compact_state,
+    "snapshot": lambda board_size, game_mode, moves: new_compact_state(board_size, game_mode, moves).snapshot(),
+}
+
+
+def bench_memory(layout, board_size, game_mode, games):
+    """Returns the bytes allocated per game when holding many games at once, half-way through random play."""
+    rng = random.Random(0)
+    sequences = [random_move_sequence(board_size, rng)[:board_size * board_size // 2] for _ in range(games)]
+    layout(board_size, game_mode, [])  # Build shared per-size tables before measuring
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        held = [layout(board_size, game_mode, moves) for moves in sequences]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return used / games
+
+
+def bench_symmetry(board_size, game_mode, depth, positions, use_cache, seed=0):
+    """Searches random positions to a fixed depth and returns the total nodes and seconds."""
+    rng = random.Random(seed)
+    position_cache = PositionCache(1 << 18) if use_cache else None
+    player = AlphaBetaPlayer(time_limit=3600.0, max_depth=depth, seed=seed, position_cache=position_cache)
+    nodes = 0
+    elapsed = 0.0
+    for _ in range(positions):
+        manager = random_position(board_size, game_mode, rng.randrange(board_size), rng)
+        player.choose_move(manager)
+        nodes += player.last_stats["nodes"]
+        elapsed += player.last_stats["elapsed"]
+    return nodes, elapsed
+
+
+def bench_check_sos(board_size, calls, seed=0):
+    """Returns the average time of one check_sos call on a half-filled random board, in microseconds."""
+    rng = random.Random(seed)
+    manager = GameManager(board_size, "General")
+    manager.reset_game(board_size, "General")
+    for row, col, character in random_move_sequence(board_size, rng)[:board_size * board_size // 2]:
+        manager.make_move(row, col, character)
+    cells = [(rng.randrange(board_size), rng.randrange(board_size)) for _ in range(calls)]
+
+    check_sos = manager.check_sos
+    start = time.perf_counter()
+    for row, col in cells:
+        check_sos(row, col)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_game_throughput(board_size, game_mode, games, seed=0):
+    """Returns complete random games per second, each on a new GameManager."""
+    rng = random.Random(seed)
+    sequences = [random_move_sequence(board_size, rng) for _ in range(games)]
+    start = time.perf_counter()
+    for moves in sequences:
+        manager = GameManager(board_size, game_mode)
+        manager.reset_game(board_size, game_mode)
+        play_sequence(manager, moves)
+    return games / (time.perf_counter() - start)
+
+
+def bench_board_rendering(sizes, repeat):
+    """Times creating and destroying the canvas and button boards under a hidden Tk root.
+
+    Returns {(board kind, size): (create ms, teardown ms)}, or None when Tk
+    cannot open a display.
+    """
+    import tkinter as tk
+    from game_board import CanvasGameBoard, GameBoard
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    timings = {}
+    try:
+        for size in sizes:
+            kinds = [("canvas", lambda frame, size=size: CanvasGameBoard(tk.Canvas(frame), size, lambda row, col: None))]
+            if size <= BUTTON_BOARD_MAX_SIZE:
+                kinds.append(("buttons", lambda frame, size=size: GameBoard(frame, size, lambda row, col: None)))
+            for kind, create in kinds:
+                create_times, teardown_times = [], []
+                for _ in range(repeat):
+                    frame = tk.Frame(root)
+                    start = time.perf_counter()
+                    create(frame)
+                    root.update_idletasks()
+                    create_times.append(time.perf_counter() - start)
+                    start = time.perf_counter()
+                    frame.destroy()
+                    root.update_idletasks()
+                    teardown_times.append(time.perf_counter() - start)
+                timings[(kind, size)] = (statistics.median(create_times) * 1e3, statistics.median(teardown_times) * 1e3)
+    finally:
+        root.destroy()
+    return timings
+
+
+def metric(value, unit, better="lower"):
+    """Returns one suite measurement as stored in the JSON results."""
+    return {"value": value, "unit": unit, "better": better}
+
+
+def run_benchmark_suite(sizes=SUITE_SIZES, throughput_sizes=SUITE_THROUGHPUT_SIZES,
+                        render_sizes=SUITE_RENDER_SIZES, repeat=3, seed=0):
+    """Runs every suite benchmark and returns {metric name: metric}, each value the median of repeat runs."""
+    results = {}
+
+    def median_of(benchmark):
+        return statistics.median(benchmark() for _ in range(repeat))
+
+    for mode in ("Simple", "General"):
+        for size in sizes:
+            games = max(1, MOVES_PER_MEASUREMENT // (size * size))
+            results[f"make_move/{mode}/{size}"] = metric(
+                median_of(lambda: bench_make_move(GameManager, size, mode, games, seed)), "us")
+        for size in throughput_sizes:
+            games = max(5, 2 * MOVES_PER_MEASUREMENT // (size * size))
+            results[f"game_throughput/{mode}/{size}"] = metric(
+                median_of(lambda: bench_game_throughput(size, mode, games, seed)), "games/s", "higher")
+    for size in sizes:
+        results[f"check_sos/{size}"] = metric(median_of(lambda: bench_check_sos(size, MOVES_PER_MEASUREMENT, seed)), "us")
+
+    rendering = bench_board_rendering(render_sizes, repeat) if render_sizes else None
+    for (kind, size), (create_ms, teardown_ms) in (rendering or {}).items():
+        results[f"board_create/{kind}/{size}"] = metric(create_ms, "ms")
+        results[f"board_teardown/{kind}/{size}"] = metric(teardown_ms, "ms")
+    return results
+
+
+def compare_results(baseline, current):
+    """Compares the metrics present in both result sets.
+
+    Returns a list of (name, baseline value, current value, change) sorted by
+    name, where change is the relative slowdown: positive when the current run
+    is slower (higher time or lower throughput) than the baseline.
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        old, new = baseline[name]["value"], current[name]["value"]
+        if current[name]["better"] == "lower":
+            change = new / old - 1 if old else 0.0
+        else:
+            change = old / new - 1 if new else float("inf")
+        rows.append((name, old, new, change))
+    return rows
+
+
+def run_engines(args):
+    """Compares make_move latency of the list and bitboard engines."""
+    print(f"make_move latency, {args.mode} mode, {args.games} random games per size")
+    print(f"{'size':>5} {'list us':>10} {'bitboard us':>12} {'speedup':>8}")
+    for size in args.sizes:
+        timings = {name: bench_make_move(cls, size, args.mode, args.games, args.seed)
+                   for name, cls in ENGINES.items()}
+        speedup = timings["list"] / timings["bitboard"]
+        print(f"{size:>5} {timings['list']:>10.2f} {timings['bitboard']:>12.2f} {speedup:>7.2f}x")
+
+
+def run_alphabeta(args):
+    """Reports alpha-beta search speed and transposition table hit rate."""
+    print(f"alpha-beta search, {args.mode} mode, {args.time_limit}s per move, {args.positions} positions per size")
+    print(f"{'size':>5} {'depth':>6} {'nodes':>9} {'nodes/s':>9} {'tt hits':>8}")
+    for size in args.sizes:
+        stats = bench_alphabeta(size, args.mode, args.time_limit, args.positions, args.seed)
+        print(f"{size:>5} {stats['depth']:>6.1f} {stats['nodes']:>9} "
+              f"{stats['nodes_per_second']:>9.0f} {stats['tt_hit_rate']:>7.1%}")
+
+
+def run_mcts(args):
+    """Reports MCTS playouts per second for each board size and worker count."""
+    print(f"MCTS playouts per second, {args.mode} mode, {args.time_limit}s per move, {args.positions} positions per size")
+    print(f"{'size':>5} " + " ".join(f"{f'{workers} workers':>11}" for workers in args.workers))
+    for size in args.sizes:
+        rates = [bench_mcts(size, args.mode, args.time_limit, args.positions, workers, args.seed)
+                 for workers in args.workers]
+        print(f"{size:>5} " + " ".join(f"{rate:>11.0f}" for rate in rates))
+
+
+def run_memory(args):
+    """Reports the memory held per live game by each state layout."""
+    print(f"bytes per game, {args.mode} mode, {args.games} games held at once, half-filled boards")
+    print(f"{'size':>5} " + " ".join(f"{name:>16}" for name in MEMORY_LAYOUTS))
+    for size in args.sizes:
+        sizes = [bench_memory(layout, size, args.mode, args.games) for layout in MEMORY_LAYOUTS.values()]
+        print(f"{size:>5} " + " ".join(f"{bytes_per_game:>16.0f}" for bytes_per_game in sizes))
+
+
+def run_symmetry(args):
+    """Compares alpha-beta nodes searched with the transposition table and with the symmetry-aware position cache."""
+    print(f"alpha-beta to depth {args.depth}, {args.mode} mode, {args.positions} positions per size")
+    print(f"{'size':>5} {'tt nodes':>10} {'cache nodes':>12} {'saved':>7} {'tt s':>7} {'cache s':>8}")
+    for size in args.sizes:
+        tt_nodes, tt_elapsed = bench_symmetry(size, args.mode, args.depth, args.positions, False, args.seed)
+        cache_nodes, cache_elapsed = bench_symmetry(size, args.mode, args.depth, args.positions, True, args.seed)
+        print(f"{size:>5} {tt_nodes:>10} {cache_nodes:>12} {1 - cache_nodes / tt_nodes:>6.1%} "
+              f"{tt_elapsed:>7.2f} {cache_elapsed:>8.2f}")
+
+
+def run_suite(args):
+    """Runs the benchmark suite, writes the results as JSON and optionally checks them against a baseline."""
+    if args.quick:
+        sizes, throughput_sizes, render_sizes, repeat = (3, 10, 30), (3, 8), (3, 10), 1
+    else:
+        sizes, throughput_sizes, render_sizes, repeat = SUITE_SIZES, SUITE_THROUGHPUT_SIZES, SUITE_RENDER_SIZES, args.repeat
+    if args.no_render:
+        render_sizes = ()
+
+    results = run_benchmark_suite(sizes, throughput_sizes, render_sizes, repeat, args.seed)
+    if render_sizes and not any(name.startswith("board_create/") for name in results):
+        print("board rendering skipped: Tk could not open a display")
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": args.seed,
+        "results": results,
+    }
+    for name, result in results.items():
+        print(f"{name:<32} {result['value']:>12.3f} {result['unit']}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        rows = compare_results(baseline, results)
+        slowdowns = [row for row in rows if row[3] > args.tolerance]
+        print(f"\ncomparison with {args.baseline} (slowdowns above {args.tolerance:.0%} are flagged)")
+        for name, old, new, change in rows:
+            flag = "  SLOWER" if change > args.tolerance else ""
+            print(f"{name:<32} {old:>12.3f} {new:>12.3f} {change:>+8.1%}{flag}")
+        if slowdowns:
+            print(f"{len(slowdowns)} of {len(rows)} benchmarks slowed down")
+            sys.exit(1)
+
+
+def main(argv=None):
+    """Runs the selected benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the SOS rules engines and computer players.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    engines = subparsers.add_parser("engines", help="make_move latency of the list and bitboard engines")
+    engines.add_argument("--sizes", type=int, nargs="+", default=[3, 5, 8, 12, 16, 20])
+    engines.add_argument("--games", type=int, default=200)
+    engines.set_defaults(run=run_engines)
+
+    alphabeta = subparsers.add_parser("alphabeta", help="alpha-beta nodes per second and table hit rate")
+    alphabeta.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 6, 10, 15, 20])
+    alphabeta.add_argument("--time-limit", type=float, default=0.5)
+    alphabeta.add_argument("--positions", type=int, default=3)
+    alphabeta.set_defaults(run=run_alphabeta)
+
+    mcts = subparsers.add_parser("mcts", help="MCTS playouts per second by worker count")
+    mcts.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 15, 20])
+    mcts.add_argument("--time-limit", type=float, default=1.0)
+    mcts.add_argument("--positions", type=int, default=2)
+    mcts.add_argument("--workers", type=int, nargs="+", default=[0, os.cpu_count() or 1])
+    mcts.set_defaults(run=run_mcts)
+
+    memory = subparsers.add_parser("memory", help="bytes per live game of GameManager and CompactGameState")
+    memory.add_argument("--sizes", type=int, nargs="+", default=[3, 8, 20])
+    memory.add_argument("--games", type=int, default=2000)
+    memory.set_defaults(run=run_memory)
+
+    symmetry = subparsers.add_parser("symmetry", help="alpha-beta nodes with and without the symmetry cache")
+    symmetry.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 5])
+    symmetry.add_argument("--depth", type=int, default=5)
+    symmetry.add_argument("--positions", type=int, default=5)
+    symmetry.set_defaults(run=run_symmetry)
+
+    suite = subparsers.add_parser("suite", help="rules engine, game throughput and board rendering, as JSON")
+    suite.add_argument("--output", help="write the results to this JSON file")
+    suite.add_argument("--baseline", help="compare against results stored by an earlier --output")
+    suite.add_argument("--tolerance", type=float, default=0.10, help="relative slowdown to flag, default 0.10")
+    suite.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the median is reported")
+    suite.add_argument("--quick", action="store_true", help="fewer sizes and a single run, for smoke tests")
+    suite.add_argument("--no-render", action="store_true", help="skip the Tk board rendering benchmarks")
+    suite.add_argument("--seed", type=int, default=0)
+    suite.set_defaults(run=run_suite)
+
+    for subparser in (engines, alphabeta, mcts, memory, symmetry):
+        subparser.add_argument("--mode", choices=["Simple", "General"], default="General")
+        subparser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
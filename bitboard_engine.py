@@ -0,0 +1,251 @@
+from game_manager import MoveRecord
+from sos_lines import build_all_lines
+
+
+class BitboardGeometry:
+    """Precomputed bit layout and SOS masks for one board size.
+
+    Cells are stored row-major with one always-empty guard column at the end of
+    each row, so shifting a layer by a direction offset never wraps a pattern
+    onto the next row.
+    """
+
+    def __init__(self, board_size):
+        self.board_size = board_size
+        self.width = board_size + 1  # Real columns plus the guard column
+
+        # Bit offsets for horizontal, vertical, diagonal and anti-diagonal lines
+        self.shifts = (1, self.width, self.width + 1, self.width - 1)
+
+        self.cell_bits = []
+        self.full_mask = 0
+        for row in range(board_size):
+            for col in range(board_size):
+                bit = 1 << (row * self.width + col)
+                self.cell_bits.append(bit)
+                self.full_mask |= bit
+
+        def bit_at(cell):
+            return 1 << (cell[0] * self.width + cell[1])
+
+        # For every cell, the masks to test when an S or an O lands on it
+        s_patterns = [[] for _ in range(board_size * board_size)]  # (other S end, middle O) pairs
+        o_patterns = [[] for _ in range(board_size * board_size)]  # Both S ends around a middle O
+        for first, middle, last in build_all_lines(board_size):
+            s_patterns[first[0] * board_size + first[1]].append((bit_at(last), bit_at(middle)))
+            s_patterns[last[0] * board_size + last[1]].append((bit_at(first), bit_at(middle)))
+            o_patterns[middle[0] * board_size + middle[1]].append(bit_at(first) | bit_at(last))
+        self.s_patterns = tuple(tuple(patterns) for patterns in s_patterns)
+        self.o_patterns = tuple(tuple(patterns) for patterns in o_patterns)
+
+
+_GEOMETRY_CACHE = {}
+
+
+def get_geometry(board_size):
+    """Returns the cached BitboardGeometry for the given board size."""
+    geometry = _GEOMETRY_CACHE.get(board_size)
+    if geometry is None:
+        geometry = _GEOMETRY_CACHE[board_size] = BitboardGeometry(board_size)
+    return geometry
+
+
+class BitboardGameManager:
+    """Drop-in alternative to GameManager that keeps the S and O layers as integer bitmasks.
+
+    Placing a character is a couple of bitwise operations and checking for SOS
+    tests a handful of precomputed masks, instead of indexing a list of lists.
+    It does not maintain GameManager's scoring-cell threat maps, so on random
+    games its make_move is about 1.3-2.5x faster on 3x3 to 20x20 boards (run
+    ``python benchmarks.py engines`` for current figures).
+    """
+
+    def __init__(self, board_size=3, game_mode="Simple"):
+        """Initializes the bitboard game manager with players, board, and game mode."""
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.geometry = get_geometry(board_size)
+        self.current_player = "Blue"  # Start with Blue player
+        self.s_layer = 0  # Bit set for every cell holding an S
+        self.o_layer = 0  # Bit set for every cell holding an O
+        self.occupied = 0  # Union of the S and O layers
+        self.free_cells = {(row, col) for row in range(board_size) for col in range(board_size)}  # Empty cells
+        self.empty_count = board_size * board_size  # Number of empty cells
+        self.is_game_active = False  # Game active flag
+        self.sos_count = {"Blue": 0, "Red": 0}  # Track SOS counts for each player in General mode
+        self.sos_occurred = False  # Track if any SOS has occurred
+        self.move_log = []  # MoveRecord for every move made, newest last
+
+    def reset_game(self, board_size, game_mode):
+        """Resets the game with a new board size and game mode."""
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.geometry = get_geometry(board_size)
+        self.s_layer = 0
+        self.o_layer = 0
+        self.occupied = 0
+        self.free_cells = {(row, col) for row in range(board_size) for col in range(board_size)}
+        self.empty_count = board_size * board_size
+        self.current_player = "Blue"
+        self.is_game_active = True
+        self.sos_count = {"Blue": 0, "Red": 0}
+        self.sos_occurred = False
+        self.move_log = []
+
+    @property
+    def board(self):
+        """Returns the board as a list of lists of ' ', 'S' and 'O', like GameManager.board."""
+        board = []
+        bits = self.geometry.cell_bits
+        for row in range(self.board_size):
+            board_row = []
+            for col in range(self.board_size):
+                bit = bits[row * self.board_size + col]
+                if self.s_layer & bit:
+                    board_row.append('S')
+                elif self.o_layer & bit:
+                    board_row.append('O')
+                else:
+                    board_row.append(' ')
+            board.append(board_row)
+        return board
+
+    def is_board_full(self):
+        """Checks if the entire board is filled."""
+        return self.empty_count == 0
+
+    def legal_moves(self):
+        """Returns the live set of empty (row, col) cells; copy it before moving while iterating."""
+        return self.free_cells
+
+    def make_move(self, row, col, character):
+        """Attempts to place the selected character on the board, checks for SOS, and determines the game result."""
+        geometry = self.geometry
+        index = row * self.board_size + col
+        bit = geometry.cell_bits[index]
+        if self.occupied & bit or not self.is_game_active or character not in ('S', 'O'):
+            return False  # Invalid move: occupied cell, finished game or a character other than S and O
+
+        # Place the selected character and test only the masks around it
+        self.occupied |= bit
+        self.free_cells.remove((row, col))
+        self.empty_count -= 1
+        sos_created = 0
+        if character == 'S':
+            s_layer = self.s_layer = self.s_layer | bit
+            o_layer = self.o_layer
+            for far_end, middle in geometry.s_patterns[index]:
+                if s_layer & far_end and o_layer & middle:
+                    sos_created += 1
+        else:
+            self.o_layer |= bit
+            s_layer = self.s_layer
+            for ends in geometry.o_patterns[index]:
+                if s_layer & ends == ends:
+                    sos_created += 1
+
+        sos_delta = sos_created if self.game_mode == "General" else 0
+        self.move_log.append(MoveRecord(row, col, character, sos_delta, self.current_player, self.is_game_active))
+
+        # Check for Simple Game Mode win condition
+        if self.game_mode == "Simple" and sos_created:
+            self.is_game_active = False
+            return {"result": "win", "winner": self.current_player}
+
+        # General Game Mode: Update SOS count if an SOS is created
+        if self.game_mode == "General" and sos_created:
+            self.sos_count[self.current_player] += sos_created
+            if self.empty_count:
+                return {"result": "continue"}
+
+        # Check if board is full to determine end game result
+        if not self.empty_count:
+            blue_score = self.sos_count["Blue"]
+            red_score = self.sos_count["Red"]
+
+            if self.game_mode == "General":
+                if blue_score > red_score:
+                    winner = "Blue"
+                elif red_score > blue_score:
+                    winner = "Red"
+                else:
+                    winner = "Draw"
+                return {"result": "end", "winner": winner, "blue_score": blue_score, "red_score": red_score}
+            else:
+                return {"result": "draw"}
+
+        # Pass turn to the next player if no SOS created
+        return {"result": "next_turn"}
+
+    def unmake_move(self):
+        """Reverts the last move in constant time and returns its MoveRecord, or None if no move was made."""
+        if not self.move_log:
+            return None
+
+        record = self.move_log.pop()
+        clear = ~self.geometry.cell_bits[record.row * self.board_size + record.col]
+        self.s_layer &= clear
+        self.o_layer &= clear
+        self.occupied &= clear
+        self.free_cells.add((record.row, record.col))
+        self.empty_count += 1
+        self.sos_count[record.player] -= record.sos_delta
+        self.current_player = record.player
+        self.is_game_active = record.was_active
+        return record
+
+    def switch_turn(self):
+        """Switches the turn between players."""
+        self.current_player = "Red" if self.current_player == "Blue" else "Blue"
+
+    def check_sos(self, row, col):
+        """Returns the number of SOS lines completed by the character at the given row and col."""
+        index = row * self.board_size + col
+        s_layer = self.s_layer
+        sos_count = 0
+
+        if s_layer & self.geometry.cell_bits[index]:
+            o_layer = self.o_layer
+            for far_end, middle in self.geometry.s_patterns[index]:
+                if s_layer & far_end and o_layer & middle:
+                    sos_count += 1
+        else:
+            for ends in self.geometry.o_patterns[index]:
+                if s_layer & ends == ends:
+                    sos_count += 1
+
+        return sos_count
+
+    def count_sos(self):
+        """Counts every SOS line on the board using one shift per direction."""
+        s_layer = self.s_layer
+        o_layer = self.o_layer
+        total = 0
+        for shift in self.geometry.shifts:
+            total += (s_layer & (o_layer >> shift) & (s_layer >> (2 * shift))).bit_count()
+        return total
+
+    def is_board_filled(self):
+        """Checks if the entire board is filled."""
+        return self.empty_count == 0
+
+    def end_game(self):
+        """Ends the game by determining the winner based on game mode and returning the result."""
+        self.is_game_active = False
+        blue_score = self.sos_count["Blue"]
+        red_score = self.sos_count["Red"]
+        result = {"winner": None, "blue_score": blue_score, "red_score": red_score}
+
+        if self.game_mode == "General" and self.is_board_full():
+            if blue_score > red_score:
+                result["winner"] = "Blue"
+            elif red_score > blue_score:
+                result["winner"] = "Red"
+            else:
+                result["winner"] = "Draw"
+
+        return result
+
+    def get_current_player(self):
+        """Returns the current player."""
+        return self.current_player
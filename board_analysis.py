@@ -0,0 +1,84 @@
+import numpy as np
+from batch_simulator import CHARACTER_CODES, O, S
+
+DIRECTION_NAMES = ("horizontal", "vertical", "diagonal", "anti_diagonal")
+# Row/column step from the first S to the O of a line, matching sos_lines.DIRECTIONS
+DIRECTION_STEPS = {"horizontal": (0, 1), "vertical": (1, 0), "diagonal": (1, 1), "anti_diagonal": (1, -1)}
+
+
+def encode_board(board):
+    """Converts a GameManager-style list of lists of ' ', 'S' and 'O' into an int8 array."""
+    return np.array([[CHARACTER_CODES[cell] for cell in row] for row in board], dtype=np.int8)
+
+
+def line_masks(boards):
+    """Returns, per direction, a boolean array marking the first S of every S-O-S line.
+
+    The masks are two cells shorter than the board along each axis the
+    direction moves in, so position (row, col) of a mask is the line starting there.
+    """
+    is_s = boards == S
+    is_o = boards == O
+    return {
+        "horizontal": is_s[..., :, :-2] & is_o[..., :, 1:-1] & is_s[..., :, 2:],
+        "vertical": is_s[..., :-2, :] & is_o[..., 1:-1, :] & is_s[..., 2:, :],
+        "diagonal": is_s[..., :-2, :-2] & is_o[..., 1:-1, 1:-1] & is_s[..., 2:, 2:],
+        # Anti-diagonal lines run down and to the left, so their first S is in a later column
+        "anti_diagonal": is_s[..., :-2, 2:] & is_o[..., 1:-1, 1:-1] & is_s[..., 2:, :-2],
+    }
+
+
+def start_cells(direction, starts):
+    """Converts (k, 2) mask positions of one direction into (k, 3, 2) line cells."""
+    starts = starts.copy()
+    if direction == "anti_diagonal":
+        starts[:, 1] += 2  # Undo the column offset of the anti-diagonal mask
+    step = np.array(DIRECTION_STEPS[direction])
+    return starts[:, None, :] + np.arange(3)[None, :, None] * step
+
+
+def count_sos_lines(boards, return_lines=False):
+    """Counts every S-O-S line of one board or of a stacked batch of boards.
+
+    boards is a GameManager board (list of lists of characters), a (size, size)
+    int8 array, or an (N, size, size) int8 array using the batch_simulator cell
+    codes. Returns a dict of per-direction counts plus "total"; the counts are
+    ints for one board and (N,) arrays for a batch.
+
+    With return_lines, also returns a dict of per-direction line coordinates:
+    a (k, 3, 2) array of (row, col) cells for one board, or for a batch a list
+    holding one such array per board.
+    """
+    if not isinstance(boards, np.ndarray):
+        boards = encode_board(boards)
+    single = boards.ndim == 2
+
+    masks = line_masks(boards)
+    counts = {direction: masks[direction].sum(axis=(-2, -1)) for direction in DIRECTION_NAMES}
+    counts["total"] = sum(counts[direction] for direction in DIRECTION_NAMES)
+    if single:
+        counts = {name: int(count) for name, count in counts.items()}
+
+    if not return_lines:
+        return counts
+
+    lines = {}
+    for direction in DIRECTION_NAMES:
+        positions = np.argwhere(masks[direction])
+        if single:
+            lines[direction] = start_cells(direction, positions)
+        else:
+            cells = start_cells(direction, positions[:, 1:])
+            boundaries = np.cumsum(counts[direction])[:-1]
+            lines[direction] = np.split(cells, boundaries)
+    return counts, lines
+
+
+def verify_general_scores(game_manager):
+    """Checks that a General game's SOS counts add up to the lines on its board.
+
+    Every line on the board is scored exactly once, by the move that completed
+    it, so at any point the two counts must sum to the board's total.
+    """
+    total = count_sos_lines(game_manager.board)["total"]
+    return total == game_manager.sos_count["Blue"] + game_manager.sos_count["Red"]
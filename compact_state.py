@@ -0,0 +1,177 @@
+import struct
+from game_manager import GameManager
+from sos_lines import get_line_index
+
+# Cell codes of the bytearray board, matching batch_simulator
+EMPTY, S, O = 0, 1, 2
+CHARACTER_CODES = {' ': EMPTY, 'S': S, 'O': O}
+CODE_CHARACTERS = " SO"
+_CODE_TRANSLATION = str.maketrans({chr(code): character for code, character in enumerate(CODE_CHARACTERS)})
+
+# Player and mode codes
+BLUE, RED = 0, 1
+PLAYER_NAMES = ("Blue", "Red")
+SIMPLE, GENERAL = 0, 1
+MODE_NAMES = ("Simple", "General")
+
+# Snapshot header: board size, mode, player, active flag, Blue score, Red score
+SNAPSHOT_HEADER = struct.Struct("<BBBBHH")
+
+_FLAT_LINE_CACHE = {}
+
+
+def get_flat_line_index(board_size):
+    """Returns get_line_index(board_size) with every cell given as a flat row * size + col index."""
+    flat_index = _FLAT_LINE_CACHE.get(board_size)
+    if flat_index is None:
+        flat_index = tuple(
+            tuple(tuple(row * board_size + col for row, col in line) for line in lines)
+            for lines in get_line_index(board_size))
+        _FLAT_LINE_CACHE[board_size] = flat_index
+    return flat_index
+
+
+class CompactGameState:
+    """Memory-lean SOS game for holding many live games at once, e.g. in the game server.
+
+    The board is a bytearray of cell codes and the player and mode are small
+    ints, with no per-instance __dict__. It plays by the same rules and returns
+    the same make_move results as GameManager, but keeps no move log, so moves
+    cannot be undone. Unlike GameManager, a new state is active right away.
+    """
+
+    __slots__ = ("board_size", "mode", "player", "is_game_active", "blue_score", "red_score", "empty_count", "board")
+
+    def __init__(self, board_size=3, game_mode="Simple"):
+        self.board_size = board_size
+        self.mode = MODE_NAMES.index(game_mode)
+        self.player = BLUE
+        self.is_game_active = True
+        self.blue_score = 0
+        self.red_score = 0
+        self.empty_count = board_size * board_size
+        self.board = bytearray(board_size * board_size)
+
+    @property
+    def game_mode(self):
+        return MODE_NAMES[self.mode]
+
+    @property
+    def sos_count(self):
+        return {"Blue": self.blue_score, "Red": self.red_score}
+
+    def get_current_player(self):
+        """Returns the current player."""
+        return PLAYER_NAMES[self.player]
+
+    def get_cell(self, row, col):
+        """Returns the character at the given cell, ' ' when empty."""
+        return CODE_CHARACTERS[self.board[row * self.board_size + col]]
+
+    def board_rows(self):
+        """Returns the board as one string of ' ', 'S' and 'O' per row."""
+        size = self.board_size
+        characters = self.board.decode("latin-1").translate(_CODE_TRANSLATION)
+        return [characters[start:start + size] for start in range(0, size * size, size)]
+
+    def make_move(self, row, col, character):
+        """Places a character and returns the same result dict as GameManager.make_move, or False if invalid."""
+        cell = row * self.board_size + col
+        board = self.board
+        if board[cell] != EMPTY or not self.is_game_active:
+            return False
+
+        board[cell] = CHARACTER_CODES[character]
+        self.empty_count -= 1
+        sos_created = 0
+        for first, middle, last in get_flat_line_index(self.board_size)[cell]:
+            if board[first] == S and board[middle] == O and board[last] == S:
+                sos_created += 1
+
+        if self.mode == SIMPLE and sos_created:
+            self.is_game_active = False
+            return {"result": "win", "winner": PLAYER_NAMES[self.player]}
+
+        if self.mode == GENERAL and sos_created:
+            if self.player == BLUE:
+                self.blue_score += sos_created
+            else:
+                self.red_score += sos_created
+            if self.empty_count:
+                return {"result": "continue"}
+
+        if self.empty_count == 0:
+            if self.mode == SIMPLE:
+                return {"result": "draw"}
+            return {"result": "end", "winner": self.score_winner(),
+                    "blue_score": self.blue_score, "red_score": self.red_score}
+
+        return {"result": "next_turn"}
+
+    def score_winner(self):
+        """Returns "Blue", "Red" or "Draw" by comparing the SOS counts."""
+        if self.blue_score > self.red_score:
+            return "Blue"
+        if self.red_score > self.blue_score:
+            return "Red"
+        return "Draw"
+
+    def switch_turn(self):
+        """Switches the turn between players."""
+        self.player = RED if self.player == BLUE else BLUE
+
+    def end_game(self):
+        """Ends the game and returns the same result dict as GameManager.end_game."""
+        self.is_game_active = False
+        result = {"winner": None, "blue_score": self.blue_score, "red_score": self.red_score}
+        if self.mode == GENERAL and self.empty_count == 0:
+            result["winner"] = self.score_winner()
+        return result
+
+    def snapshot(self):
+        """Returns the whole state as bytes: an 8-byte header followed by one byte per cell."""
+        header = SNAPSHOT_HEADER.pack(self.board_size, self.mode, self.player, self.is_game_active,
+                                      self.blue_score, self.red_score)
+        return header + self.board
+
+    @classmethod
+    def restore(cls, data):
+        """Rebuilds a state from the bytes returned by snapshot."""
+        state = cls.__new__(cls)
+        (state.board_size, state.mode, state.player, active,
+         state.blue_score, state.red_score) = SNAPSHOT_HEADER.unpack_from(data)
+        state.is_game_active = bool(active)
+        state.board = bytearray(data[SNAPSHOT_HEADER.size:])
+        if len(state.board) != state.board_size * state.board_size:
+            raise ValueError("Snapshot board does not match its board size")
+        state.empty_count = state.board.count(EMPTY)
+        return state
+
+    @classmethod
+    def from_game_manager(cls, game_manager):
+        """Returns a compact copy of a GameManager's position."""
+        state = cls(game_manager.board_size, game_manager.game_mode)
+        state.player = PLAYER_NAMES.index(game_manager.current_player)
+        state.is_game_active = game_manager.is_game_active
+        state.blue_score = game_manager.sos_count["Blue"]
+        state.red_score = game_manager.sos_count["Red"]
+        state.board = bytearray(CHARACTER_CODES[cell] for row in game_manager.board for cell in row)
+        state.empty_count = state.board.count(EMPTY)
+        return state
+
+    def to_game_manager(self):
+        """Returns a GameManager in the same position, e.g. to hand it to a computer player."""
+        game_manager = GameManager(self.board_size, self.game_mode)
+        game_manager.reset_game(self.board_size, self.game_mode)
+        size = self.board_size
+        for cell, code in enumerate(self.board):
+            if code != EMPTY:
+                # set_cell keeps the threat maps, which make_move scores from, in step with the board
+                game_manager.set_cell(cell // size, cell % size, CODE_CHARACTERS[code])
+                game_manager.free_cells.discard((cell // size, cell % size))
+        game_manager.empty_count = self.empty_count
+        game_manager.current_player = PLAYER_NAMES[self.player]
+        game_manager.sos_count = self.sos_count
+        game_manager.is_game_active = self.is_game_active
+        return game_manager
+
@@ -0,0 +1,103 @@
+import queue
+import threading
+import time
+
+POLL_INTERVAL = 50  # Milliseconds between checks for a finished computation
+
+
+class EngineWorker:
+    """Runs engine calls on a background thread and hands their results back to the Tk main loop.
+
+    Tasks run one at a time on a single daemon thread, so a task that is still
+    winding down after a cancel never overlaps the next one. Results travel
+    through a queue that the main loop polls with root.after; callbacks are
+    therefore always called on the Tk thread.
+    """
+
+    def __init__(self, root, poll_interval=POLL_INTERVAL):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+        self.generation = 0  # Identifies the latest submitted task
+        self.pending = None  # (generation, on_done, on_tick, on_error, start time) of the awaited task
+        self.cancel_event = None
+        self.is_polling = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, task, on_done, on_tick=None, on_error=None):
+        """Starts task(cancel_event) in the background, cancelling any task still awaited.
+
+        on_done(result) is called with the task's return value, on_error(error)
+        if it raises, and on_tick(elapsed_seconds) at every poll while it runs.
+        """
+        self.cancel()
+        self.generation += 1
+        self.cancel_event = threading.Event()
+        self.pending = (self.generation, on_done, on_tick, on_error, time.perf_counter())
+        self.tasks.put((self.generation, task, self.cancel_event))
+        if not self.is_polling:
+            self.is_polling = True
+            self.root.after(self.poll_interval, self.poll)
+
+    def is_busy(self):
+        """Returns True while a submitted task's result is still awaited."""
+        return self.pending is not None
+
+    def finish_early(self):
+        """Asks the running task to stop and return what it has; its result is still delivered."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+
+    def cancel(self):
+        """Asks the running task to stop and discards its result."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.pending = None
+
+    def shutdown(self):
+        """Cancels any task and stops the worker thread once it is idle."""
+        self.cancel()
+        self.tasks.put((None, None, None))
+
+    def run(self):
+        """Worker thread loop: runs queued tasks and queues their results."""
+        while True:
+            generation, task, cancel_event = self.tasks.get()
+            if task is None:
+                return
+            if cancel_event.is_set() and generation != self.generation:
+                continue  # Cancelled before it started
+            try:
+                self.results.put((generation, task(cancel_event), None))
+            except Exception as error:
+                self.results.put((generation, None, error))
+
+    def poll(self):
+        """Delivers a finished result on the Tk thread, or reports progress and polls again."""
+        while True:
+            try:
+                generation, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if self.pending is None or generation != self.pending[0]:
+                continue  # Result of a cancelled task
+
+            _, on_done, _, on_error, _ = self.pending
+            self.pending = None
+            if error is None:
+                on_done(result)
+            elif on_error is not None:
+                on_error(error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+        if self.pending is None:
+            self.is_polling = False
+            return
+
+        _, _, on_tick, _, start = self.pending
+        if on_tick is not None:
+            on_tick(time.perf_counter() - start)
+        self.root.after(self.poll_interval, self.poll)
@@ -0,0 +1,177 @@
+import mmap
+import os
+import struct
+import numpy as np
+from game_manager import MAX_BOARD_SIZE, GameManager
+from game_records import (MODE_CODES, MODE_NAMES, WINNER_CODES, WINNER_NAMES, GameRecord, decode_move,
+                          encode_move, read_game_words)
+
+INDEX_MAGIC = b"SOSI\x01\x00\x00\x00"  # Index signature and format version, padded to 8 bytes
+# Per game: byte offset of its moves in the data file, move count, board size, mode, winner, Blue score, Red score
+INDEX_ENTRY = struct.Struct("<QHBBBxHH")
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("move_count", "<u2"), ("board_size", "u1"), ("mode", "u1"),
+                        ("winner", "u1"), ("padding", "u1"), ("blue_score", "<u2"), ("red_score", "<u2")])
+MOVE_DTYPE = np.dtype("<u2")  # Moves are packed as in game_records
+
+
+def archive_paths(path):
+    """Returns the (data file, index file) paths of an archive."""
+    return path + ".moves", path + ".index"
+
+
+class ArchiveWriter:
+    """Appends games to an archive: packed moves to the data file and one fixed-width entry to the index."""
+
+    def __init__(self, path):
+        data_path, index_path = archive_paths(path)
+        self.data_file = open(data_path, "ab")
+        self.index_file = open(index_path, "ab")
+        if self.index_file.tell() == 0:
+            self.index_file.write(INDEX_MAGIC)
+        else:
+            # Appending to anything but an index of this version would corrupt the archive
+            with open(index_path, "rb") as existing:
+                magic = existing.read(len(INDEX_MAGIC))
+            error = None
+            if magic != INDEX_MAGIC:
+                if magic[:4] == INDEX_MAGIC[:4] and len(magic) == len(INDEX_MAGIC):
+                    error = (f"{index_path} is a version {magic[4]} game archive index; "
+                             f"only version {INDEX_MAGIC[4]} can be appended to")
+                else:
+                    error = f"{index_path} is not an SOS game archive index"
+            elif (self.index_file.tell() - len(INDEX_MAGIC)) % INDEX_ENTRY.size:
+                error = f"{index_path} ends in a partial entry"
+            if error is not None:
+                self.close()
+                raise ValueError(error)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flushes and closes both files."""
+        self.data_file.close()
+        self.index_file.close()
+
+    def add_game(self, board_size, game_mode, move_words, winner=None, blue_score=0, red_score=0):
+        """Appends a game given as a sequence of 16-bit packed moves."""
+        if board_size > MAX_BOARD_SIZE:
+            raise ValueError(f"Boards larger than {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE} cannot be archived")
+        offset = self.data_file.tell()
+        self.data_file.write(np.asarray(move_words, dtype=MOVE_DTYPE).tobytes())
+        self.index_file.write(INDEX_ENTRY.pack(offset, len(move_words), board_size, MODE_CODES[game_mode],
+                                               WINNER_CODES[winner], blue_score, red_score))
+
+    def write_game(self, game_manager, winner=None):
+        """Appends a whole game from a GameManager's move log."""
+        words = [encode_move(game_manager.board_size, move.row, move.col, move.character, move.player)
+                 for move in game_manager.move_log]
+        self.add_game(game_manager.board_size, game_manager.game_mode, words, winner,
+                      game_manager.sos_count["Blue"], game_manager.sos_count["Red"])
+
+
+def build_archive(record_path, path):
+    """Appends every game of a game_records file to an archive and returns how many were added."""
+    added = 0
+    with open(record_path, "rb") as record_file, ArchiveWriter(path) as writer:
+        for (board_size, mode, _, winner, blue_score, red_score), words in read_game_words(record_file):
+            writer.add_game(board_size, MODE_NAMES[mode], words, WINNER_NAMES[winner], blue_score, red_score)
+            added += 1
+    return added
+
+
+def map_file(path):
+    """Memory-maps a whole file read-only; an empty file maps to empty bytes."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class GameArchive:
+    """Read-only, memory-mapped view of an archive written by ArchiveWriter.
+
+    The index is a NumPy structured array over the mapped index file, so
+    finding game N is a single lookup and filters run over the index alone
+    without touching the move data. Moves are read straight from the mapped
+    data file, one game at a time.
+    """
+
+    def __init__(self, path):
+        data_path, index_path = archive_paths(path)
+        self.data = map_file(data_path)
+        self.index_map = map_file(index_path)
+        if self.index_map[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError("Not an SOS game archive index")
+        self.index = np.frombuffer(self.index_map, dtype=INDEX_DTYPE, offset=len(INDEX_MAGIC))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def close(self):
+        """Unmaps both files; arrays returned by move_words must no longer be in use."""
+        self.index = None
+        for mapped in (self.data, self.index_map):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+    def move_words(self, game_number):
+        """Returns the packed moves of a game as a uint16 array viewing the mapped data file."""
+        entry = self.index[game_number]
+        return np.frombuffer(self.data, dtype=MOVE_DTYPE, count=int(entry["move_count"]), offset=int(entry["offset"]))
+
+    def game(self, game_number):
+        """Returns one game as a GameRecord."""
+        entry = self.index[game_number]
+        board_size = int(entry["board_size"])
+        moves = [decode_move(board_size, word) for word in self.move_words(game_number).tolist()]
+        return GameRecord(board_size, MODE_NAMES[entry["mode"]], moves, WINNER_NAMES[entry["winner"]],
+                          int(entry["blue_score"]), int(entry["red_score"]))
+
+    def select(self, board_size=None, game_mode=None, winner="any", min_score=None, max_score=None):
+        """Returns the numbers of the games matching every given filter, using only the index.
+
+        winner is "Blue", "Red", "Draw", "unfinished" for games without a
+        result, or "any", the default, to skip that filter. min_score and
+        max_score bound the total SOS count of both players.
+        """
+        index = self.index
+        mask = np.ones(len(index), dtype=bool)
+        if board_size is not None:
+            mask &= index["board_size"] == board_size
+        if game_mode is not None:
+            mask &= index["mode"] == MODE_CODES[game_mode]
+        if winner != "any":
+            mask &= index["winner"] == WINNER_CODES[None if winner == "unfinished" else winner]
+        if min_score is not None or max_score is not None:
+            total = index["blue_score"].astype(np.int32) + index["red_score"]
+            if min_score is not None:
+                mask &= total >= min_score
+            if max_score is not None:
+                mask &= total <= max_score
+        return np.flatnonzero(mask)
+
+    def replay(self, game_number):
+        """Plays a game on a new GameManager and returns it with the result of the last move."""
+        entry = self.index[game_number]
+        board_size = int(entry["board_size"])
+        game_mode = MODE_NAMES[entry["mode"]]
+        game_manager = GameManager(board_size, game_mode)
+        game_manager.reset_game(board_size, game_mode)
+        result = None
+        for word in self.move_words(game_number).tolist():
+            row, col = divmod(word >> 2, board_size)
+            game_manager.current_player = "Red" if word & 1 else "Blue"
+            result = game_manager.make_move(row, col, 'O' if word & 2 else 'S')
+            if not result:
+                raise ValueError(f"Move {row, col} of game {game_number} is not legal")
+        return game_manager, result
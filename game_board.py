@@ -1,7 +1,11 @@
 import tkinter as tk
 
 class GameBoard:
-    """Manages the game board UI and interactions."""
+    """Manages the game board UI and interactions with one tk.Button per cell.
+
+    The GUI draws with CanvasGameBoard; this widget stays as the baseline the
+    board-rendering benchmark compares it against.
+    """
     
     def __init__(self, parent, board_size, on_click_callback):
         self.parent = parent
@@ -42,3 +46,104 @@ class GameBoard:
                 except tk.TclError:
                     # Button no longer exists, skip disabling
                     continue
+
+
+class CanvasGameBoard:
+    """Draws the game board on a single tk.Canvas instead of one button per cell.
+
+    The grid is a handful of line items, so creating a board costs O(board_size)
+    canvas items however large it is. Clicks are mapped to cells by arithmetic,
+    only cells that change are redrawn, and completed SOS lines are drawn on top.
+    """
+
+    MIN_CELL_SIZE = 16  # Pixels; larger boards scroll instead of shrinking further
+    MAX_CELL_SIZE = 50
+    TARGET_BOARD_PIXELS = 600  # Cells shrink until the board fits this size
+    PLAYER_COLORS = {"Blue": "blue", "Red": "red"}
+    # Fill of hinted cells: scoring with S, with O, or with either
+    HINT_COLORS = {'S': "#fff2a8", 'O': "#c9f2c7", 'SO': "#ffd8a8"}
+
+    def __init__(self, canvas, board_size, on_click_callback):
+        self.canvas = canvas
+        self.board_size = board_size
+        self.on_click_callback = on_click_callback
+        self.cell_size = self.cell_size_for(board_size)
+        self.cell_items = {}  # (row, col) -> text item showing the character
+        self.line_items = {}  # (row, col) of the scoring move -> SOS line items it drew
+        self.is_enabled = True
+        self.create_board()
+
+    @classmethod
+    def cell_size_for(cls, board_size):
+        """Returns the cell size in pixels used for a board of the given size."""
+        return max(cls.MIN_CELL_SIZE, min(cls.MAX_CELL_SIZE, cls.TARGET_BOARD_PIXELS // board_size))
+
+    def create_board(self):
+        """Clears the canvas and draws an empty grid."""
+        self.canvas.delete("all")
+        self.cell_items = {}
+        self.line_items = {}
+        self.is_enabled = True
+
+        board_pixels = self.board_size * self.cell_size
+        for index in range(self.board_size + 1):
+            offset = index * self.cell_size
+            self.canvas.create_line(0, offset, board_pixels, offset, fill="gray")
+            self.canvas.create_line(offset, 0, offset, board_pixels, fill="gray")
+        self.canvas.configure(scrollregion=(0, 0, board_pixels, board_pixels))
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+
+    def cell_center(self, row, col):
+        """Returns the canvas coordinates of the centre of a cell."""
+        return (col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size
+
+    def on_canvas_click(self, event):
+        """Maps a click to its cell and forwards it to the click callback."""
+        if not self.is_enabled:
+            return
+        # canvasx/canvasy account for the scrolled part of the board
+        row = int(self.canvas.canvasy(event.y) // self.cell_size)
+        col = int(self.canvas.canvasx(event.x) // self.cell_size)
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            self.on_click_callback(row, col)
+
+    def update_button(self, row, col, text):
+        """Redraws one cell; an empty text also removes the SOS lines that move drew."""
+        item = self.cell_items.pop((row, col), None)
+        if item is not None:
+            self.canvas.delete(item)
+        for line_item in self.line_items.pop((row, col), ()):
+            self.canvas.delete(line_item)
+
+        if text.strip():
+            x, y = self.cell_center(row, col)
+            font_size = max(8, self.cell_size // 2)
+            self.cell_items[(row, col)] = self.canvas.create_text(x, y, text=text, font=("Helvetica", font_size))
+
+    def draw_sos_lines(self, row, col, lines, player):
+        """Draws the SOS lines completed by the move at (row, col) in the player's colour."""
+        items = self.line_items.setdefault((row, col), [])
+        for first, _, last in lines:
+            x1, y1 = self.cell_center(*first)
+            x2, y2 = self.cell_center(*last)
+            items.append(self.canvas.create_line(x1, y1, x2, y2, width=3,
+                                                 fill=self.PLAYER_COLORS.get(player, "black")))
+
+    def highlight_cells(self, s_cells, o_cells):
+        """Shades the cells where an S or an O would complete an SOS, replacing any earlier hints."""
+        self.clear_highlights()
+        for cell in set(s_cells) | set(o_cells):
+            key = ('S' if cell in s_cells else '') + ('O' if cell in o_cells else '')
+            row, col = cell
+            x, y = col * self.cell_size, row * self.cell_size
+            self.canvas.create_rectangle(x + 1, y + 1, x + self.cell_size - 1, y + self.cell_size - 1,
+                                         fill=self.HINT_COLORS[key], outline="", tags="hint")
+        self.canvas.tag_lower("hint")  # Keep the grid and characters on top
+
+    def clear_highlights(self):
+        """Removes all hint shading."""
+        self.canvas.delete("hint")
+
+    def disable_buttons(self):
+        """Ignores further clicks after the game ends."""
+        self.is_enabled = False
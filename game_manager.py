@@ -1,3 +1,40 @@
+from collections import namedtuple
+from time import perf_counter
+from sos_lines import get_line_index
+
+MIN_BOARD_SIZE = 3
+# Largest board the front ends offer: the computer players start to overrun their
+# time limit beyond it (MCTS takes 1.6s for a 1s move at 150x150)
+MAX_BOARD_SIZE = 128
+
+# One entry of the move log: enough to revert a move without copying the board
+MoveRecord = namedtuple("MoveRecord", ["row", "col", "character", "sos_delta", "player", "was_active"])
+
+class GameObserver:
+    """Base class for objects notified of a GameManager's events; every hook does nothing by default.
+
+    on_move_applied receives the move's timings in seconds: "sos_detection"
+    (the threat-map lookup and update that find the SOS lines a move
+    completes), "end_check" (scoring and the full-board check) and
+    "make_move" (the whole move).
+    """
+
+    def on_move_applied(self, game_manager, record, result, timings):
+        """Called after make_move places a character, with its MoveRecord and result."""
+
+    def on_sos_scored(self, game_manager, player, count):
+        """Called when a move completes count SOS lines for player."""
+
+    def on_turn_switched(self, game_manager, player):
+        """Called after switch_turn, with the player now on turn."""
+
+    def on_game_ended(self, game_manager, result):
+        """Called when a move wins, draws or ends the game, or when end_game stops it first.
+
+        A game stopped by end_game is reported with result "stopped" and the
+        winner and scores end_game returns.
+        """
+
 class GameManager:
     """Manages the game state, player turns, and game logic for SOS."""
 
@@ -7,36 +44,102 @@ class GameManager:
         self.game_mode = game_mode
         self.current_player = "Blue"  # Start with Blue player
         self.board = [[' ' for _ in range(board_size)] for _ in range(board_size)]  # Initialize empty board
+        self.line_index = get_line_index(board_size)  # SOS lines through each cell
+        self.free_cells = {(row, col) for row in range(board_size) for col in range(board_size)}  # Empty cells
+        self.empty_count = board_size * board_size  # Number of empty cells
         self.is_game_active = False  # Game active flag
+        # Per character, empty (row, col) cells where placing it would complete SOS lines -> number of lines
+        self.threats = {'S': {}, 'O': {}}
         self.sos_count = {"Blue": 0, "Red": 0}  # Track SOS counts for each player in General mode
         self.sos_occurred = False  # Track if any SOS has occurred
+        self.move_log = []  # MoveRecord for every move made, newest last
+        self.redo_log = []  # Records reverted by undo_move, newest last
+        self.observers = []  # GameObserver instances notified of moves, scores, turns and game ends
 
     def reset_game(self, board_size, game_mode):
         """Resets the game with a new board size and game mode."""
         self.board_size = board_size
         self.game_mode = game_mode
         self.board = [[' ' for _ in range(board_size)] for _ in range(board_size)]
+        self.line_index = get_line_index(board_size)
+        self.free_cells = {(row, col) for row in range(board_size) for col in range(board_size)}
+        self.empty_count = board_size * board_size
         self.current_player = "Blue"
         self.is_game_active = True
+        self.threats = {'S': {}, 'O': {}}
         self.sos_count = {"Blue": 0, "Red": 0}  # Reset SOS counters for a new game
         self.sos_occurred = False  # Reset SOS tracker for a new game
+        self.move_log = []
+        self.redo_log = []
+
+    def copy(self):
+        """Returns an independent GameManager in the same position, e.g. for searching on another thread."""
+        clone = GameManager.__new__(GameManager)
+        clone.__dict__.update(self.__dict__)
+        clone.board = [row[:] for row in self.board]
+        clone.free_cells = set(self.free_cells)
+        clone.threats = {'S': dict(self.threats['S']), 'O': dict(self.threats['O'])}
+        clone.sos_count = dict(self.sos_count)
+        clone.move_log = list(self.move_log)
+        clone.redo_log = []
+        clone.observers = []  # Searches on the copy are not part of the observed game
+        return clone
 
     def is_board_full(self):
         """Checks if the entire board is filled."""
-        for row in self.board:
-            if ' ' in row:
-                return False
-        return True
-    
+        return self.empty_count == 0
+
+    def legal_moves(self):
+        """Returns the set of empty (row, col) cells.
+
+        This is the live set kept up to date by make_move, so callers that make
+        moves while iterating over it should iterate over a copy.
+        """
+        return self.free_cells
+
     def make_move(self, row, col, character):
         """Attempts to place the selected character on the board, checks for SOS, and determines the game result."""
-        if self.board[row][col] != ' ' or not self.is_game_active:
-            return False  # Invalid move
+        result = self.apply_move(row, col, character)
+        if result and self.redo_log:
+            self.redo_log.clear()  # A new move discards any undone moves
+        return result
+
+    def apply_move(self, row, col, character):
+        """Places a character like make_move, but leaves the moves kept for redo_move alone."""
+        if self.board[row][col] != ' ' or not self.is_game_active or character not in self.threats:
+            return False  # Invalid move: occupied cell, finished game or a character other than S and O
+        observers = self.observers
+        if observers:
+            started = perf_counter()
+
+        # The threat map already knows how many SOS lines this placement completes
+        sos_created = self.threats[character].get((row, col), 0)
 
         # Place the selected character
-        self.board[row][col] = character
-        sos_created = self.check_sos(row, col)
+        self.set_cell(row, col, character)
+        self.free_cells.remove((row, col))
+        self.empty_count -= 1
+        sos_delta = sos_created if self.game_mode == "General" else 0
+        record = MoveRecord(row, col, character, sos_delta, self.current_player, self.is_game_active)
+        self.move_log.append(record)
+        if not observers:
+            return self.move_result(sos_created)
 
+        detected = perf_counter()
+        result = self.move_result(sos_created)
+        finished = perf_counter()
+        timings = {"sos_detection": detected - started, "end_check": finished - detected,
+                   "make_move": finished - started}
+        for observer in observers:
+            observer.on_move_applied(self, record, result, timings)
+            if sos_created:
+                observer.on_sos_scored(self, record.player, sos_created)
+            if result["result"] in ("win", "draw", "end"):
+                observer.on_game_ended(self, result)
+        return result
+
+    def move_result(self, sos_created):
+        """Scores a move that completed sos_created SOS lines and returns the make_move result."""
         # Check for Simple Game Mode win condition
         if self.game_mode == "Simple" and sos_created:
             self.is_game_active = False
@@ -45,8 +148,9 @@ class GameManager:
         # General Game Mode: Update SOS count if an SOS is created
         if self.game_mode == "General" and sos_created:
             self.sos_count[self.current_player] += sos_created
-            # Return "continue" to allow the player to take another turn
-            return {"result": "continue"}
+            if self.empty_count:
+                # Return "continue" to allow the player to take another turn
+                return {"result": "continue"}
 
         # Check if board is full to determine end game result
         if self.is_board_full():
@@ -71,90 +175,118 @@ class GameManager:
 
 
 
+    def unmake_move(self):
+        """Reverts the last move in constant time and returns its MoveRecord, or None if no move was made."""
+        if not self.move_log:
+            return None
+
+        record = self.move_log.pop()
+        self.set_cell(record.row, record.col, ' ')
+        self.free_cells.add((record.row, record.col))
+        self.empty_count += 1
+        self.sos_count[record.player] -= record.sos_delta
+        self.current_player = record.player  # Also reverts any switch_turn made after the move
+        self.is_game_active = record.was_active
+        return record
+
+    def undo_move(self):
+        """Reverts the last move and keeps it so redo_move can replay it."""
+        record = self.unmake_move()
+        if record is not None:
+            self.redo_log.append(record)
+        return record
+
+    def redo_move(self):
+        """Replays the most recently undone move and returns the make_move result, or None if nothing was undone."""
+        if not self.redo_log:
+            return None
+
+        record = self.redo_log.pop()
+        return self.apply_move(record.row, record.col, record.character)
+
+    def set_cell(self, row, col, character):
+        """Writes a cell and updates the threat maps, looking only at the SOS lines through that cell."""
+        board = self.board
+        s_threats = self.threats['S']
+        o_threats = self.threats['O']
+        lines = self.line_index[row * self.board_size + col]
+
+        # Withdraw the threats these lines made before the change, then add the ones they make after it
+        for delta in (-1, 1):
+            if delta == 1:
+                board[row][col] = character
+            for first, middle, last in lines:
+                middle_character = board[middle[0]][middle[1]]
+                if middle_character == 'O':
+                    first_character = board[first[0]][first[1]]
+                    last_character = board[last[0]][last[1]]
+                    if first_character == 'S' and last_character == ' ':
+                        target, threats = last, s_threats
+                    elif last_character == 'S' and first_character == ' ':
+                        target, threats = first, s_threats
+                    else:
+                        continue
+                elif middle_character == ' ' and board[first[0]][first[1]] == 'S' and board[last[0]][last[1]] == 'S':
+                    target, threats = middle, o_threats
+                else:
+                    continue
+
+                count = threats.get(target, 0) + delta
+                if count:
+                    threats[target] = count
+                else:
+                    del threats[target]
+
+    def scoring_cells(self, character):
+        """Returns the live {(row, col): lines completed} map of empty cells where character would score.
+
+        It is kept up to date by make_move and unmake_move, so callers that make
+        moves while iterating over it should iterate over a copy.
+        """
+        return self.threats[character]
+
     def switch_turn(self):
         """Switches the turn between players."""
         self.current_player = "Red" if self.current_player == "Blue" else "Blue"
+        if self.observers:
+            for observer in self.observers:
+                observer.on_turn_switched(self, self.current_player)
+
+    def add_observer(self, observer):
+        """Attaches a GameObserver; make_move is only timed while at least one is attached."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Detaches a GameObserver added with add_observer."""
+        self.observers.remove(observer)
 
     def check_sos(self, row, col):
-        """Checks if an SOS pattern is created at the given row and col."""
+        """Returns the number of SOS lines completed by the character at the given row and col."""
+        board = self.board
         sos_count = 0
 
-        # Horizontal SOS (left-right)
-        if col - 1 >= 0 and col + 1 < self.board_size:
-            if self.board[row][col - 1] == 'S' and self.board[row][col] == 'O' and self.board[row][col + 1] == 'S':
+        # Walk every precomputed S-O-S line through this cell
+        for (s1_row, s1_col), (o_row, o_col), (s2_row, s2_col) in self.line_index[row * self.board_size + col]:
+            if board[s1_row][s1_col] == 'S' and board[o_row][o_col] == 'O' and board[s2_row][s2_col] == 'S':
                 sos_count += 1
-                return sos_count
 
-        # Vertical SOS (up-down)
-        if row - 1 >= 0 and row + 1 < self.board_size:
-            if self.board[row - 1][col] == 'S' and self.board[row][col] == 'O' and self.board[row + 1][col] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # Diagonal SOS (top-left to bottom-right)
-        if row - 1 >= 0 and col - 1 >= 0 and row + 1 < self.board_size and col + 1 < self.board_size:
-            if self.board[row - 1][col - 1] == 'S' and self.board[row][col] == 'O' and self.board[row + 1][col + 1] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # Diagonal SOS (bottom-left to top-right)
-        if row + 1 < self.board_size and col - 1 >= 0 and row - 1 >= 0 and col + 1 < self.board_size:
-            if self.board[row + 1][col - 1] == 'S' and self.board[row][col] == 'O' and self.board[row - 1][col + 1] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # "OSO" pattern horizontally (left-right)
-        if col - 2 >= 0:
-            if self.board[row][col - 2] == 'S' and self.board[row][col - 1] == 'O' and self.board[row][col] == 'S':
-                sos_count += 1
-        if col + 2 < self.board_size:
-            if self.board[row][col] == 'S' and self.board[row][col + 1] == 'O' and self.board[row][col + 2] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # "OSO" pattern vertically (up-down)
-        if row - 2 >= 0:
-            if self.board[row - 2][col] == 'S' and self.board[row - 1][col] == 'O' and self.board[row][col] == 'S':
-                sos_count += 1
-        if row + 2 < self.board_size:
-            if self.board[row][col] == 'S' and self.board[row + 1][col] == 'O' and self.board[row + 2][col] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # "OSO" pattern diagonally (top-left to bottom-right)
-        if row - 2 >= 0 and col - 2 >= 0:
-            if self.board[row - 2][col - 2] == 'S' and self.board[row - 1][col - 1] == 'O' and self.board[row][col] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        if row + 2 < self.board_size and col + 2 < self.board_size:
-            if self.board[row][col] == 'S' and self.board[row + 1][col + 1] == 'O' and self.board[row + 2][col + 2] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        # "OSO" pattern diagonally (bottom-left to top-right)
-        if row + 2 < self.board_size and col - 2 >= 0:
-            if self.board[row + 2][col - 2] == 'S' and self.board[row + 1][col - 1] == 'O' and self.board[row][col] == 'S':
-                sos_count += 1
-                return sos_count
-            
-        if row - 2 >= 0 and col + 2 < self.board_size:
-            if self.board[row][col] == 'S' and self.board[row - 1][col + 1] == 'O' and self.board[row - 2][col + 2] == 'S':
-                sos_count += 1
-                return sos_count
-          
         return sos_count
 
+    def sos_lines_at(self, row, col):
+        """Returns the SOS lines through the given cell, as ((row, col), (row, col), (row, col)) triples."""
+        board = self.board
+        return [line for line in self.line_index[row * self.board_size + col]
+                if board[line[0][0]][line[0][1]] == 'S' and board[line[1][0]][line[1][1]] == 'O'
+                and board[line[2][0]][line[2][1]] == 'S']
+
     def is_board_filled(self):
         """Checks if the entire board is filled."""
-        for row in self.board:
-            for cell in row:
-                if cell == ' ':  # Found an empty cell
-                    return False
-        return True
+        return self.empty_count == 0
 
     def end_game(self):
         """Ends the game by determining the winner based on game mode and returning the result."""
+        # A game that a move finished has already been reported to the observers
+        stopped = self.is_game_active and not self.is_board_full()
         self.is_game_active = False
         blue_score = self.sos_count["Blue"]
         red_score = self.sos_count["Red"]
@@ -169,6 +301,9 @@ class GameManager:
             else:
                 result["winner"] = "Draw"  # Both players have the same SOS count
 
+        if stopped:
+            for observer in self.observers:
+                observer.on_game_ended(self, dict(result, result="stopped"))
         return result
     
     def get_current_player(self):
@@ -0,0 +1,125 @@
+import bisect
+import os
+from game_manager import GameObserver
+
+# Upper bounds of the latency histogram buckets, in seconds, from 1 microsecond to 1 second
+LATENCY_BUCKETS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+TIMED_PHASES = ("make_move", "sos_detection", "end_check")
+METRIC_PREFIX = "sos"
+
+
+class LatencyHistogram:
+    """Counts observed durations in fixed buckets, the way a Prometheus histogram does."""
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # The last bucket holds durations above every bound
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds):
+        """Records one duration."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def mean(self):
+        """Returns the average duration, or 0.0 if nothing was observed."""
+        return self.total / self.count if self.count else 0.0
+
+    def cumulative_counts(self):
+        """Returns (upper bound, number of durations at or below it) per bucket, ending with infinity."""
+        running = 0
+        buckets = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+    def snapshot(self):
+        """Returns the histogram as a dict of plain values."""
+        return {"count": self.count, "sum": self.total, "mean": self.mean(),
+                "buckets": self.cumulative_counts()}
+
+
+class GameMetrics(GameObserver):
+    """GameObserver counting a GameManager's events and timing its moves.
+
+    Attach it with game_manager.add_observer(metrics). One instance may
+    observe any number of games; export the totals with snapshot or
+    to_prometheus.
+    """
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.moves = 0
+        self.sos_scored = {"Blue": 0, "Red": 0}
+        self.turns_switched = 0
+        self.games_ended = {}  # Result ("win", "draw", "end", "stopped") -> count
+        self.winners = {}  # Winner ("Blue", "Red", "Draw") -> count; stopped games have none
+        self.histograms = {phase: LatencyHistogram(bounds) for phase in TIMED_PHASES}
+
+    def on_move_applied(self, game_manager, record, result, timings):
+        self.moves += 1
+        for phase, seconds in timings.items():
+            self.histograms[phase].observe(seconds)
+
+    def on_sos_scored(self, game_manager, player, count):
+        self.sos_scored[player] += count
+
+    def on_turn_switched(self, game_manager, player):
+        self.turns_switched += 1
+
+    def on_game_ended(self, game_manager, result):
+        outcome = result["result"]
+        self.games_ended[outcome] = self.games_ended.get(outcome, 0) + 1
+        winner = result.get("winner", "Draw")
+        if winner is not None:
+            self.winners[winner] = self.winners.get(winner, 0) + 1
+
+    def snapshot(self):
+        """Returns every counter and histogram as a dict, e.g. for JSON."""
+        return {
+            "moves": self.moves,
+            "sos_scored": dict(self.sos_scored),
+            "turns_switched": self.turns_switched,
+            "games_ended": dict(self.games_ended),
+            "winners": dict(self.winners),
+            "timings": {phase: histogram.snapshot() for phase, histogram in self.histograms.items()},
+        }
+
+    def to_prometheus(self, prefix=METRIC_PREFIX):
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        counter("moves_total", "Moves applied.", [("", self.moves)])
+        counter("sos_scored_total", "SOS lines completed, by player.",
+                [(f'{{player="{player}"}}', count) for player, count in sorted(self.sos_scored.items())])
+        counter("turns_switched_total", "Turn changes.", [("", self.turns_switched)])
+        counter("games_ended_total", "Finished games, by result.",
+                [(f'{{result="{result}"}}', count) for result, count in sorted(self.games_ended.items())])
+        counter("game_winners_total", "Finished games, by winner.",
+                [(f'{{winner="{winner}"}}', count) for winner, count in sorted(self.winners.items())])
+
+        for phase, histogram in self.histograms.items():
+            name = f"{prefix}_{phase}_seconds"
+            lines.append(f"# HELP {name} Duration of the {phase.replace('_', ' ')} phase of make_move.")
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in histogram.cumulative_counts():
+                label = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{le="{label}"}} {count}')
+            lines.append(f"{name}_sum {histogram.total!r}")
+            lines.append(f"{name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix=METRIC_PREFIX):
+        """Writes to_prometheus to a file, atomically so a scraper never reads half a file."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temporary_path, path)
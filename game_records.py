@@ -0,0 +1,140 @@
+import array
+import struct
+import sys
+from collections import namedtuple
+from game_manager import MAX_BOARD_SIZE, GameManager
+
+FILE_MAGIC = b"SOSR\x01"  # File signature and format version
+# Per game: board size, mode, move count, winner, Blue score, Red score
+GAME_HEADER = struct.Struct("<BBHBHH")
+MODE_CODES = {"Simple": 0, "General": 1}
+MODE_NAMES = ("Simple", "General")
+WINNER_CODES = {"Blue": 0, "Red": 1, "Draw": 2, None: 3}
+WINNER_NAMES = ("Blue", "Red", "Draw", None)
+
+RecordedMove = namedtuple("RecordedMove", ["row", "col", "character", "player"])
+GameRecord = namedtuple("GameRecord", ["board_size", "game_mode", "moves", "winner", "blue_score", "red_score"])
+
+
+def encode_move(board_size, row, col, character, player):
+    """Packs one move into 16 bits: the cell index, then one bit for O and one bit for Red.
+
+    The 14 bits left for the cell index hold every cell of a MAX_BOARD_SIZE board.
+    """
+    return (row * board_size + col) << 2 | (character == 'O') << 1 | (player == "Red")
+
+
+def decode_move(board_size, word):
+    """Unpacks a 16-bit move into a RecordedMove."""
+    row, col = divmod(word >> 2, board_size)
+    return RecordedMove(row, col, 'O' if word & 2 else 'S', "Red" if word & 1 else "Blue")
+
+
+class GameRecordWriter:
+    """Appends finished games to a record file, two bytes per move.
+
+    Moves are collected as they are played and each game is written out in
+    one piece by end_game, so an interrupted game never leaves a partial
+    record behind. Opening an existing file appends to it.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(FILE_MAGIC)
+        else:
+            # Appending to anything but a record file of this version would corrupt it
+            with open(path, "rb") as existing:
+                magic = existing.read(len(FILE_MAGIC))
+            if magic != FILE_MAGIC:
+                self.file.close()
+                if magic[:-1] == FILE_MAGIC[:-1]:
+                    raise ValueError(f"{path} is a version {magic[-1]} game record file; "
+                                     f"only version {FILE_MAGIC[-1]} can be appended to")
+                raise ValueError(f"{path} is not an SOS game record file")
+        self.board_size = None
+        self.game_mode = None
+        self.moves = array.array("H")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flushes and closes the file; an unfinished game is dropped."""
+        self.file.close()
+
+    def begin_game(self, board_size, game_mode):
+        """Starts recording a new game."""
+        if board_size > MAX_BOARD_SIZE:
+            raise ValueError(f"Boards larger than {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE} cannot be recorded")
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.moves = array.array("H")
+
+    def record_move(self, row, col, character, player):
+        """Adds one move of the current game, as passed to GameManager.make_move, with the player who made it."""
+        self.moves.append(encode_move(self.board_size, row, col, character, player))
+
+    def end_game(self, winner=None, blue_score=0, red_score=0):
+        """Writes the current game with its outcome; winner is "Blue", "Red", "Draw" or None if unfinished."""
+        header = GAME_HEADER.pack(self.board_size, MODE_CODES[self.game_mode], len(self.moves),
+                                  WINNER_CODES[winner], blue_score, red_score)
+        self.file.write(header)
+        moves = self.moves
+        if sys.byteorder == "big":
+            moves = array.array("H", moves)
+            moves.byteswap()
+        self.file.write(moves.tobytes())
+        self.board_size = None
+
+    def write_game(self, game_manager, winner=None):
+        """Records a whole game from a GameManager's move log."""
+        self.begin_game(game_manager.board_size, game_manager.game_mode)
+        for move in game_manager.move_log:
+            self.record_move(move.row, move.col, move.character, move.player)
+        self.end_game(winner, game_manager.sos_count["Blue"], game_manager.sos_count["Red"])
+
+
+def read_game_words(file):
+    """Yields (header fields, move words) for every game of an open record file, one game in memory at a time."""
+    if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+        raise ValueError("Not an SOS game record file")
+    while True:
+        header = file.read(GAME_HEADER.size)
+        if not header:
+            return
+        if len(header) < GAME_HEADER.size:
+            raise ValueError("Truncated game header")
+        fields = GAME_HEADER.unpack(header)
+        moves = array.array("H")
+        try:
+            moves.fromfile(file, fields[2])
+        except EOFError:
+            raise ValueError("Truncated game moves") from None
+        if sys.byteorder == "big":
+            moves.byteswap()
+        yield fields, moves
+
+
+def read_games(path):
+    """Streams the games of a record file as GameRecords."""
+    with open(path, "rb") as file:
+        for (board_size, mode, _, winner, blue_score, red_score), words in read_game_words(file):
+            moves = [decode_move(board_size, word) for word in words]
+            yield GameRecord(board_size, MODE_NAMES[mode], moves, WINNER_NAMES[winner], blue_score, red_score)
+
+
+def replay(record):
+    """Plays a GameRecord on a new GameManager and returns it with the result of the last move."""
+    game_manager = GameManager(record.board_size, record.game_mode)
+    game_manager.reset_game(record.board_size, record.game_mode)
+    result = None
+    for move in record.moves:
+        game_manager.current_player = move.player
+        result = game_manager.make_move(move.row, move.col, move.character)
+        if not result:
+            raise ValueError(f"Recorded move {move} is not legal")
+    return game_manager, result
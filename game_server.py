@@ -0,0 +1,240 @@
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from compact_state import CompactGameState
+from game_manager import MAX_BOARD_SIZE, MIN_BOARD_SIZE
+
+MAX_LINE_BYTES = 64 * 1024  # Longest request line accepted
+DEFAULT_MAX_SESSIONS = 100000
+DEFAULT_IDLE_TIMEOUT = 600.0  # Seconds without a request before a session is evicted
+DEFAULT_EVICTION_INTERVAL = 30.0
+
+
+class GameSession:
+    """One headless game hosted by the server, kept compact so a server can hold a large number of them."""
+
+    __slots__ = ("game", "winner", "last_used")
+
+    def __init__(self, board_size, game_mode):
+        self.game = CompactGameState(board_size, game_mode)
+        self.winner = None
+        self.last_used = time.monotonic()
+
+    def state(self):
+        """Returns the JSON-ready state of the game."""
+        game = self.game
+        return {
+            "board_size": game.board_size,
+            "game_mode": game.game_mode,
+            "board": game.board_rows(),
+            "current_player": game.get_current_player(),
+            "sos_count": game.sos_count,
+            "active": game.is_game_active,
+            "winner": self.winner,
+        }
+
+
+class GameServer:
+    """Hosts many game sessions behind one asyncio TCP server speaking newline-delimited JSON.
+
+    Each request is one JSON object per line with an "op" of create, move,
+    state, resign or stats; each gets exactly one JSON reply line, echoing the
+    request's "rid" if it has one. Requests on a connection are handled in
+    order and the next one is read only after the reply has drained, so a
+    client that stops reading stops being served instead of piling up replies.
+    """
+
+    def __init__(self, max_sessions=DEFAULT_MAX_SESSIONS, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 eviction_interval=DEFAULT_EVICTION_INTERVAL):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.eviction_interval = eviction_interval
+        self.sessions = {}
+        self.moves_played = 0
+        self.sessions_created = 0
+        self.sessions_evicted = 0
+        self.handlers = {
+            "create": self.handle_create,
+            "move": self.handle_move,
+            "state": self.handle_state,
+            "resign": self.handle_resign,
+            "stats": self.handle_stats,
+        }
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """Starts listening and evicting idle sessions; returns the asyncio server."""
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        self.eviction_task = asyncio.create_task(self.evict_idle_sessions())
+        return server
+
+    async def handle_connection(self, reader, writer):
+        """Serves one client connection until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(self.encode({"ok": False, "error": "request line too long"}))
+                    break
+                if not line:
+                    break
+                writer.write(self.encode(self.handle_line(line)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def encode(self, response):
+        """Serialises one reply line."""
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    def handle_line(self, line):
+        """Parses one request line and returns the reply dict."""
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "invalid JSON"}
+        if not isinstance(message, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+        return self.handle_message(message)
+
+    def handle_message(self, message):
+        """Dispatches one decoded request to its handler and returns the reply dict."""
+        op = message.get("op")
+        handler = self.handlers.get(op) if isinstance(op, str) else None
+        if handler is None:
+            response = {"ok": False, "error": f"unknown op {op!r}"}
+        else:
+            try:
+                response = handler(message)
+            except (KeyError, TypeError, ValueError) as error:
+                response = {"ok": False, "error": f"bad request: {error}"}
+        if "rid" in message:
+            response["rid"] = message["rid"]
+        return response
+
+    def get_session(self, message):
+        """Returns the session named by the request and marks it as used."""
+        session = self.sessions.get(message["session"])
+        if session is not None:
+            session.last_used = time.monotonic()
+        return session
+
+    def handle_create(self, message):
+        """Creates a new session."""
+        if len(self.sessions) >= self.max_sessions:
+            return {"ok": False, "error": "server full"}
+        board_size = int(message.get("board_size", 3))
+        game_mode = message.get("game_mode", "Simple")
+        if not MIN_BOARD_SIZE <= board_size <= MAX_BOARD_SIZE or game_mode not in ("Simple", "General"):
+            return {"ok": False, "error": "unsupported board size or game mode"}
+
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = GameSession(board_size, game_mode)
+        self.sessions_created += 1
+        return {"ok": True, "session": session_id}
+
+    def handle_move(self, message):
+        """Plays a move for the player on turn, passing the turn like the GUI does."""
+        session = self.get_session(message)
+        if session is None:
+            return {"ok": False, "error": "unknown session"}
+        row, col, character = int(message["row"]), int(message["col"]), message["character"]
+        game = session.game
+        if character not in ('S', 'O') or not (0 <= row < game.board_size and 0 <= col < game.board_size):
+            return {"ok": False, "error": "invalid move"}
+
+        result = game.make_move(row, col, character)
+        if not result:
+            return {"ok": False, "error": "invalid move"}
+        self.moves_played += 1
+
+        if result["result"] == "next_turn":
+            game.switch_turn()
+        elif result["result"] in ("win", "end"):
+            session.winner = result["winner"]
+            game.end_game()
+        elif result["result"] == "draw":
+            session.winner = "Draw"
+            game.end_game()
+        return {"ok": True, "result": result, "current_player": game.get_current_player()}
+
+    def handle_state(self, message):
+        """Returns the full state of a session."""
+        session = self.get_session(message)
+        if session is None:
+            return {"ok": False, "error": "unknown session"}
+        return {"ok": True, "state": session.state()}
+
+    def handle_resign(self, message):
+        """Ends a session's game, with the resigning player (by default the one on turn) losing."""
+        session = self.get_session(message)
+        if session is None:
+            return {"ok": False, "error": "unknown session"}
+        game = session.game
+        if not game.is_game_active:
+            return {"ok": False, "error": "game is over"}
+
+        player = message.get("player", game.get_current_player())
+        if player not in ("Blue", "Red"):
+            return {"ok": False, "error": "unknown player"}
+        session.winner = "Red" if player == "Blue" else "Blue"
+        game.end_game()
+        return {"ok": True, "winner": session.winner}
+
+    def handle_stats(self, message):
+        """Returns server counters, including the CPU time the server process has used."""
+        return {
+            "ok": True,
+            "sessions": len(self.sessions),
+            "sessions_created": self.sessions_created,
+            "sessions_evicted": self.sessions_evicted,
+            "moves_played": self.moves_played,
+            "cpu_seconds": time.process_time(),
+        }
+
+    def evict_idle(self, now=None):
+        """Removes sessions that have not been used within the idle timeout; returns how many."""
+        now = time.monotonic() if now is None else now
+        idle = [session_id for session_id, session in self.sessions.items()
+                if now - session.last_used > self.idle_timeout]
+        for session_id in idle:
+            del self.sessions[session_id]
+        self.sessions_evicted += len(idle)
+        return len(idle)
+
+    async def evict_idle_sessions(self):
+        """Background task evicting idle sessions at a fixed interval."""
+        while True:
+            await asyncio.sleep(self.eviction_interval)
+            self.evict_idle()
+
+
+async def serve(host, port, max_sessions, idle_timeout):
+    """Runs a GameServer until cancelled."""
+    game_server = GameServer(max_sessions=max_sessions, idle_timeout=idle_timeout)
+    server = await game_server.start(host, port)
+    print(f"SOS game server listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Command-line entry point for the game server."""
+    parser = argparse.ArgumentParser(description="Host headless SOS games over newline-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_sessions, args.idle_timeout))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
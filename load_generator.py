@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+SERVER_START_TIMEOUT = 10.0  # Seconds to wait for a --local server to accept connections
+
+
+class LoadClient:
+    """One connection to the game server that plays random games back to back."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = []  # Seconds per move request
+        self.games_played = 0
+
+    async def request(self, message):
+        """Sends one request and waits for its reply."""
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        return json.loads(line)
+
+    async def play_game(self, board_size, game_mode, rng):
+        """Creates a session and plays random moves in it until the game ends."""
+        reply = await self.request({"op": "create", "board_size": board_size, "game_mode": game_mode})
+        if not reply["ok"]:
+            raise RuntimeError(reply["error"])
+        session = reply["session"]
+
+        cells = [(row, col) for row in range(board_size) for col in range(board_size)]
+        rng.shuffle(cells)
+        for row, col in cells:
+            message = {"op": "move", "session": session, "row": row, "col": col, "character": rng.choice("SO")}
+            start = time.perf_counter()
+            reply = await self.request(message)
+            self.latencies.append(time.perf_counter() - start)
+            if not reply["ok"]:
+                raise RuntimeError(reply["error"])
+            if reply["result"]["result"] in ("win", "draw", "end"):
+                break
+        self.games_played += 1
+
+    async def run(self, games, board_size, game_mode, rng):
+        """Plays the given number of games, then closes the connection."""
+        for _ in range(games):
+            await self.play_game(board_size, game_mode, rng)
+        self.writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at the given fraction of a sorted list (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def server_stats(host, port):
+    """Asks the server for its counters over a short-lived connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    client = LoadClient(reader, writer)
+    stats = await client.request({"op": "stats"})
+    writer.close()
+    return stats
+
+
+async def run_load(host, port, connections, games, board_size, game_mode, seed=0):
+    """Plays games across concurrent connections and returns a dict of latency and throughput figures.
+
+    games is spread as evenly as possible over the connections. Sessions per
+    core-second divides the games played by the CPU time the server spent on
+    them, as reported by its stats op, so it is unaffected by the client's own load.
+    """
+    rng = random.Random(seed)
+    before = await server_stats(host, port)
+
+    clients = []
+    for _ in range(connections):
+        reader, writer = await asyncio.open_connection(host, port)
+        clients.append(LoadClient(reader, writer))
+    shares = [games // connections + (index < games % connections) for index in range(connections)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client.run(share, board_size, game_mode, random.Random(rng.getrandbits(32)))
+                           for client, share in zip(clients, shares)))
+    elapsed = time.perf_counter() - start
+    after = await server_stats(host, port)
+
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    games_played = sum(client.games_played for client in clients)
+    server_cpu = after["cpu_seconds"] - before["cpu_seconds"]
+    return {
+        "connections": connections,
+        "games": games_played,
+        "moves": len(latencies),
+        "elapsed": elapsed,
+        "games_per_second": games_played / elapsed if elapsed else 0.0,
+        "moves_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1000,
+        "latency_p95_ms": percentile(latencies, 0.95) * 1000,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000,
+        "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "server_cpu_seconds": server_cpu,
+        "sessions_per_core_second": games_played / server_cpu if server_cpu > 0 else 0.0,
+    }
+
+
+def start_local_server(port):
+    """Starts game_server.py in a child process and waits until it accepts connections."""
+    server_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_server.py")
+    process = subprocess.Popen([sys.executable, server_path, "--port", str(port)], stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(server_stats("127.0.0.1", port))
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("the local game server did not start")
+
+
+def main(argv=None):
+    """Command-line entry point for the load generator."""
+    parser = argparse.ArgumentParser(description="Play random games against the SOS game server and report latency.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--local", action="store_true", help="start a game server in a child process first")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--mode", choices=("Simple", "General"), default="General")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    process = start_local_server(args.port) if args.local else None
+    try:
+        report = asyncio.run(run_load(args.host, args.port, args.connections, args.games,
+                                      args.size, args.mode, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"{report['games']} games, {report['moves']} moves over {report['connections']} connections "
+          f"in {report['elapsed']:.2f}s")
+    print(f"throughput: {report['games_per_second']:.0f} games/s, {report['moves_per_second']:.0f} moves/s")
+    print(f"move latency: p50 {report['latency_p50_ms']:.2f}ms, p95 {report['latency_p95_ms']:.2f}ms, "
+          f"p99 {report['latency_p99_ms']:.2f}ms, max {report['latency_max_ms']:.2f}ms")
+    print(f"server: {report['server_cpu_seconds']:.2f} CPU seconds, "
+          f"{report['sessions_per_core_second']:.0f} sessions per core-second")
+
+
+if __name__ == "__main__":
+    main()
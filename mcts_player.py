@@ -0,0 +1,223 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from game_manager import GameManager
+
+EXPLORATION = 1.4  # UCT exploration constant
+
+
+def position_snapshot(game_manager):
+    """Returns a small picklable tuple describing the game manager's position."""
+    cells = "".join("".join(row) for row in game_manager.board)
+    return (game_manager.board_size, game_manager.game_mode, cells, game_manager.current_player,
+            game_manager.sos_count["Blue"], game_manager.sos_count["Red"])
+
+
+def restore_position(snapshot):
+    """Builds an active GameManager holding the position of a snapshot."""
+    board_size, game_mode, cells, current_player, blue_score, red_score = snapshot
+    game_manager = GameManager(board_size, game_mode)
+    game_manager.reset_game(board_size, game_mode)
+    for index, character in enumerate(cells):
+        if character != ' ':
+            game_manager.make_move(index // board_size, index % board_size, character)
+    game_manager.current_player = current_player
+    game_manager.sos_count = {"Blue": blue_score, "Red": red_score}
+    game_manager.is_game_active = True
+    return game_manager
+
+
+def random_playout(snapshot, seed):
+    """Plays uniformly random moves from a snapshot to the end and returns the winner ("Blue", "Red" or "Draw")."""
+    rng = random.Random(seed)
+    game_manager = restore_position(snapshot)
+    cells = list(game_manager.legal_moves())
+    rng.shuffle(cells)
+
+    for row, col in cells:
+        result = game_manager.make_move(row, col, 'S' if rng.random() < 0.5 else 'O')
+        if result["result"] == "win":
+            return result["winner"]
+        if result["result"] == "draw":
+            return "Draw"
+        if result["result"] == "end":
+            return result["winner"]
+        if result["result"] == "next_turn":
+            game_manager.switch_turn()
+    return "Draw"
+
+
+def run_playouts(jobs):
+    """Runs a batch of (snapshot, seed) playouts and returns their winners; executed in worker processes."""
+    return [random_playout(snapshot, seed) for snapshot, seed in jobs]
+
+
+class MCTSNode:
+    """One position in the search tree, reached by playing move from the parent position."""
+
+    def __init__(self, move=None, parent=None, player=None):
+        self.move = move  # (row, col, character) leading here from the parent
+        self.parent = parent
+        self.player = player  # Player who made the move, whose point of view wins are counted from
+        self.children = []
+        self.untried_moves = None  # Filled the first time the node is expanded
+        self.visits = 0
+        self.wins = 0.0
+        self.winner = None  # Set when the move ends the game
+
+    def reward(self, winner):
+        """Returns 1 for a win of this node's player, 0.5 for a draw and 0 for a loss."""
+        if winner == "Draw":
+            return 0.5
+        return 1.0 if winner == self.player else 0.0
+
+    def best_child(self):
+        """Returns the child with the highest UCT score."""
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits
+                   + EXPLORATION * math.sqrt(log_visits / child.visits))
+
+
+class MCTSPlayer:
+    """Computer player using Monte Carlo Tree Search with UCT selection and random playouts.
+
+    Playouts are collected in batches and run across a process pool, so the
+    number of playouts per second grows with the number of workers. Selected
+    paths are counted as visited before their playouts return (virtual loss),
+    which spreads one batch over different branches of the tree.
+    """
+
+    def __init__(self, time_limit=1.0, max_playouts=None, workers=None, batch_size=None, seed=None):
+        self.time_limit = time_limit  # Wall-clock budget per move, in seconds
+        self.max_playouts = max_playouts
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers  # 0 runs the playouts in this process
+        self.batch_size = batch_size or max(8, 4 * self.workers)
+        self.rng = random.Random(seed)
+        self.executor = None
+        self.last_stats = {}
+
+    def close(self):
+        """Shuts down the worker processes, if any were started."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def choose_move(self, game_manager, cancel_event=None):
+        """Returns the (row, col, character) the current player should play.
+
+        The tree is walked on the game manager itself with make_move/unmake_move,
+        and the game manager is left exactly as it was passed in. Setting
+        cancel_event (a threading.Event) stops the search after the current batch.
+        """
+        start = time.perf_counter()
+        deadline = start + self.time_limit
+        root = MCTSNode()
+        playouts = 0
+
+        while time.perf_counter() < deadline and (self.max_playouts is None or playouts < self.max_playouts):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            batch_size = self.batch_size
+            if self.max_playouts is not None:
+                batch_size = min(batch_size, self.max_playouts - playouts)
+
+            leaves = []
+            jobs = []
+            for _ in range(batch_size):
+                leaf, snapshot = self.select(root, game_manager)
+                leaves.append(leaf)
+                if snapshot is not None:
+                    jobs.append((snapshot, self.rng.getrandbits(32)))
+
+            winners = iter(self.run_jobs(jobs))
+            for leaf in leaves:
+                winner = leaf.winner if leaf.winner is not None else next(winners)
+                self.backpropagate(leaf, winner)
+            playouts += len(leaves)
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "playouts": playouts,
+            "elapsed": elapsed,
+            "playouts_per_second": playouts / elapsed if elapsed else 0.0,
+            "workers": self.workers,
+        }
+
+        if not root.children:
+            row, col = next(iter(game_manager.legal_moves()))
+            return row, col, 'S'
+        return max(root.children, key=lambda child: child.visits).move
+
+    def select(self, root, game_manager):
+        """Walks down the tree, expanding one new node, and returns (leaf, snapshot to play out).
+
+        The snapshot is None when the leaf ends the game. Every node on the path
+        is counted as visited right away, before its playout result is known.
+        """
+        log_length = len(game_manager.move_log)
+        node = root
+        node.visits += 1
+
+        while node.winner is None:
+            if node.untried_moves is None:
+                node.untried_moves = [(row, col, character) for row, col in game_manager.legal_moves()
+                                      for character in ('S', 'O')]
+                self.rng.shuffle(node.untried_moves)
+
+            if node.untried_moves:
+                move = node.untried_moves.pop()
+                child = MCTSNode(move, node, game_manager.get_current_player())
+                child.winner = self.apply_move(game_manager, move)
+                node.children.append(child)
+                node = child
+                node.visits += 1
+                break
+
+            if not node.children:
+                break  # No moves left, the position is finished
+            node = node.best_child()
+            node.visits += 1
+            self.apply_move(game_manager, node.move)
+
+        snapshot = position_snapshot(game_manager) if node.winner is None else None
+        while len(game_manager.move_log) > log_length:
+            game_manager.unmake_move()
+        return node, snapshot
+
+    def apply_move(self, game_manager, move):
+        """Plays a move, passing the turn when needed, and returns the winner if the game ended."""
+        result = game_manager.make_move(*move)
+        if result["result"] == "next_turn":
+            game_manager.switch_turn()
+        elif result["result"] in ("win", "end"):
+            return result["winner"]
+        elif result["result"] == "draw":
+            return "Draw"
+        return None
+
+    def backpropagate(self, leaf, winner):
+        """Adds the playout result to every node from the leaf up to the root."""
+        node = leaf
+        while node.parent is not None:
+            node.wins += node.reward(winner)
+            node = node.parent
+
+    def run_jobs(self, jobs):
+        """Runs playouts, split across the process pool when one is configured."""
+        if not jobs:
+            return []
+        if self.workers == 0:
+            return run_playouts(jobs)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        chunk_size = math.ceil(len(jobs) / self.workers)
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        winners = []
+        for chunk_winners in self.executor.map(run_playouts, chunks):
+            winners.extend(chunk_winners)
+        return winners
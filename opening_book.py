@@ -0,0 +1,299 @@
+import argparse
+import array
+import bisect
+import operator
+import os
+import struct
+import sys
+import time
+from compact_state import get_flat_line_index
+from position_cache import get_symmetries
+
+BOOK_MAGIC = b"SOSB\x01"  # File signature and format version
+BOOK_HEADER = struct.Struct("<BBI")  # Board size, mode (0 Simple, 1 General), entry count
+BOOK_DIRECTORY_VARIABLE = "SOS_BOOK_DIR"  # Environment variable overriding where books are kept
+MAX_BOOK_SIZE = 4  # Larger boards cannot be solved exhaustively
+MODE_CODES = {"Simple": 0, "General": 1}
+QUICK_BUILD_SIZE = 3  # Books up to this size are solved on first use, in well under a second
+DIGITS = str.maketrans(" SO", "012")  # Base-3 digit of each cell in a position key
+
+_LOADED_BOOKS = {}
+_KEY_WEIGHTS = {}
+_DIGIT_GETTERS = {}
+
+
+def default_book_directory():
+    """Returns where books are kept: $SOS_BOOK_DIR if set, otherwise the user's cache directory."""
+    directory = os.environ.get(BOOK_DIRECTORY_VARIABLE)
+    if directory:
+        return directory
+    if sys.platform == "win32":
+        cache = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    elif sys.platform == "darwin":
+        cache = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(cache, "sos", "books")
+
+
+def get_key_weights(board_size):
+    """Returns, per symmetry, the base-3 place value of every cell once transformed."""
+    weights = _KEY_WEIGHTS.get(board_size)
+    if weights is None:
+        weights = tuple(tuple(3 ** image for image in symmetry) for symmetry in get_symmetries(board_size))
+        _KEY_WEIGHTS[board_size] = weights
+    return weights
+
+
+def symmetric_keys(board, board_size):
+    """Returns the base-3 key of a GameManager board under each of the eight symmetries.
+
+    Key i reads the board transformed by symmetry i as a base-3 number, so the
+    smallest of the eight is the same for all symmetric boards.
+    """
+    getters = _DIGIT_GETTERS.get(board_size)
+    if getters is None:
+        # Per symmetry, picks the cells landing on the highest to lowest place value
+        cell_count = board_size * board_size
+        getters = [operator.itemgetter(*[symmetry.index(image) for image in reversed(range(cell_count))])
+                   for symmetry in get_symmetries(board_size)]
+        _DIGIT_GETTERS[board_size] = getters
+    digits = "".join(map("".join, board)).translate(DIGITS)
+    return [int("".join(getter(digits)), 3) for getter in getters]
+
+
+class Solver:
+    """Exhaustive memoised negamax over every position reachable on a small board.
+
+    The value of a position is for the side to move: in Simple mode 1 for a
+    forced win, 0 for a draw and -1 for a loss; in General mode the SOS count
+    that player will score from here on minus the opponent's, with best play.
+    Both depend on the board alone, so positions are memoised by the smallest
+    of their eight symmetric base-3 keys.
+    """
+
+    def __init__(self, board_size, game_mode):
+        if board_size > MAX_BOOK_SIZE:
+            raise ValueError(f"Boards larger than {MAX_BOOK_SIZE}x{MAX_BOOK_SIZE} cannot be solved exhaustively")
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.cell_count = board_size * board_size
+        self.line_index = get_flat_line_index(board_size)
+        self.symmetries = get_symmetries(board_size)
+        # Per cell, the amount each symmetric key grows by per unit of the cell's code
+        self.weights = list(zip(*get_key_weights(board_size)))
+        self.board = [0] * self.cell_count
+        self.entries = {}  # Canonical key -> packed (value, best move), see pack_entry
+
+    def solve(self):
+        """Solves every position reachable from the empty board and returns the empty board's value."""
+        return self.search((0,) * 8, self.cell_count)
+
+    def search(self, keys, empty_count):
+        """Returns the value of the current board, solving and memoising it first if needed."""
+        key = min(keys)
+        entry = self.entries.get(key)
+        if entry is not None:
+            return (entry >> 8) - 128
+
+        board = self.board
+        line_index = self.line_index
+        general = self.game_mode == "General"
+        best_value = None
+        best_move = 0
+        for cell in range(self.cell_count):
+            if board[cell]:
+                continue
+            weights = self.weights[cell]
+            for code in (1, 2):
+                board[cell] = code
+                gain = 0
+                for first, middle, last in line_index[cell]:
+                    if board[first] == 1 and board[middle] == 2 and board[last] == 1:
+                        gain += 1
+
+                if not general and gain:
+                    value = 1
+                elif empty_count == 1:
+                    value = gain
+                else:
+                    child_keys = tuple(key + code * weight for key, weight in zip(keys, weights))
+                    if gain:
+                        value = gain + self.search(child_keys, empty_count - 1)  # The scorer moves again
+                    else:
+                        value = -self.search(child_keys, empty_count - 1)
+                board[cell] = 0
+
+                if best_value is None or value > best_value:
+                    best_value = value
+                    best_move = cell << 1 | (code - 1)
+
+        # Store the move as it appears on the canonical board
+        symmetry = self.symmetries[keys.index(key)]
+        best_move = symmetry[best_move >> 1] << 1 | (best_move & 1)
+        self.entries[key] = pack_entry(best_value, best_move)
+        return best_value
+
+
+def pack_entry(value, move):
+    """Packs a value (-128..127) and a move (cell * 2 + 1 for O) into one int."""
+    return (value + 128) << 8 | move
+
+
+class OpeningBook:
+    """Solved values and best moves of every reachable position of one board size and mode.
+
+    Entries are sorted canonical keys with parallel value and move arrays, so
+    a book loads with three array reads and a lookup is a binary search.
+    """
+
+    def __init__(self, board_size, game_mode, keys, values, moves):
+        self.board_size = board_size
+        self.game_mode = game_mode
+        self.keys = keys  # array('I') of sorted canonical keys; 3 ** 16 fits in 32 bits
+        self.values = values  # array('b') of values for the side to move
+        self.moves = moves  # array('B') of best moves on the canonical board, cell * 2 + 1 for O
+        self.inverses = tuple(tuple(symmetry.index(cell) for cell in range(board_size * board_size))
+                              for symmetry in get_symmetries(board_size))
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_solver(cls, solver):
+        """Builds a book from a Solver that has solved its positions."""
+        keys = array.array("I")
+        values = array.array("b")
+        moves = array.array("B")
+        for key in sorted(solver.entries):
+            entry = solver.entries[key]
+            keys.append(key)
+            values.append((entry >> 8) - 128)
+            moves.append(entry & 0xFF)
+        return cls(solver.board_size, solver.game_mode, keys, values, moves)
+
+    def save(self, path):
+        """Writes the book to a file, creating its directory if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        keys = array.array("I", self.keys)
+        if sys.byteorder == "big":
+            keys.byteswap()
+        # Write under a temporary name first, so an interrupted save never leaves half a book behind
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(BOOK_MAGIC)
+            file.write(BOOK_HEADER.pack(self.board_size, MODE_CODES[self.game_mode], len(keys)))
+            keys.tofile(file)
+            self.values.tofile(file)
+            self.moves.tofile(file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Reads a book written by save; a file that is not a whole book raises ValueError."""
+        with open(path, "rb") as file:
+            if file.read(len(BOOK_MAGIC)) != BOOK_MAGIC:
+                raise ValueError("Not an SOS opening book")
+            try:
+                board_size, mode, count = BOOK_HEADER.unpack(file.read(BOOK_HEADER.size))
+                keys = array.array("I")
+                keys.fromfile(file, count)
+                values = array.array("b")
+                values.fromfile(file, count)
+                moves = array.array("B")
+                moves.fromfile(file, count)
+            except (struct.error, EOFError):
+                raise ValueError(f"{path} is a truncated opening book") from None
+            if mode >= len(MODE_CODES) or file.read(1):
+                raise ValueError(f"{path} is not a valid opening book")
+        if sys.byteorder == "big":
+            keys.byteswap()
+        return cls(board_size, ("Simple", "General")[mode], keys, values, moves)
+
+    def lookup(self, game_manager):
+        """Returns (value, (row, col, character)) for a GameManager's position, or None if it is not in the book.
+
+        The value is for the player on turn, as described in Solver.
+        """
+        if game_manager.board_size != self.board_size or game_manager.game_mode != self.game_mode:
+            return None
+        keys = symmetric_keys(game_manager.board, self.board_size)
+        key = min(keys)
+        index = bisect.bisect_left(self.keys, key)
+        if index == len(self.keys) or self.keys[index] != key:
+            return None
+
+        move = self.moves[index]
+        cell = self.inverses[keys.index(key)][move >> 1]
+        return self.values[index], (cell // self.board_size, cell % self.board_size, 'O' if move & 1 else 'S')
+
+
+def book_path(board_size, game_mode, directory=None):
+    """Returns the file name of the book for a board size and mode, in default_book_directory() unless given."""
+    if directory is None:
+        directory = default_book_directory()
+    return os.path.join(directory, f"sos_{board_size}x{board_size}_{game_mode.lower()}.book")
+
+
+def get_book(board_size, game_mode, directory=None):
+    """Returns the opening book for a board size and mode, loading it once.
+
+    Missing or unreadable books up to QUICK_BUILD_SIZE are solved and saved
+    on the spot; for larger sizes None is returned until the book is built
+    with this module's command line.
+    """
+    path = book_path(board_size, game_mode, directory)
+    book = _LOADED_BOOKS.get(path)
+    if book is None and board_size <= MAX_BOOK_SIZE:
+        if os.path.exists(path):
+            try:
+                book = OpeningBook.load(path)
+            except (ValueError, OSError):
+                pass  # An unreadable book is solved again below, or left to search
+        if book is None and board_size <= QUICK_BUILD_SIZE:
+            book = solve_book(board_size, game_mode)
+            try:
+                book.save(path)
+            except OSError:
+                pass  # Keep the book in memory only
+        if book is not None:
+            _LOADED_BOOKS[path] = book
+    return book
+
+
+def solve_book(board_size, game_mode):
+    """Solves every reachable position of a board size and mode and returns the book."""
+    solver = Solver(board_size, game_mode)
+    solver.solve()
+    return OpeningBook.from_solver(solver)
+
+
+def build_book(board_size, game_mode, directory=None):
+    """Solves a board size and mode, writes its book and returns (book, seconds taken)."""
+    start = time.perf_counter()
+    book = solve_book(board_size, game_mode)
+    path = book_path(board_size, game_mode, directory)
+    book.save(path)
+    _LOADED_BOOKS.pop(path, None)
+    return book, time.perf_counter() - start
+
+
+def main(argv=None):
+    """Builds the opening books for the requested board sizes and modes."""
+    parser = argparse.ArgumentParser(description="Solve small SOS boards and write their opening books.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4])
+    parser.add_argument("--modes", nargs="+", choices=["Simple", "General"], default=["Simple", "General"])
+    parser.add_argument("--directory", default=None,
+                        help=f"where to write the books; defaults to ${BOOK_DIRECTORY_VARIABLE} or the user cache directory")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        for mode in args.modes:
+            book, elapsed = build_book(size, mode, args.directory)
+            # The empty board has key 0, the first entry
+            print(f"{size}x{size} {mode}: {len(book)} positions in {elapsed:.1f}s, "
+                  f"value of the empty board {book.values[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,12 @@ import tkinter as tk
 class PlayerControls:
     """Handles the player controls for selecting S or O."""
     
-    def __init__(self, parent, player_name, default_choice="S"):
+    def __init__(self, parent, player_name, default_choice="S", player_types=("Human", "Alpha-beta", "MCTS")):
         self.parent = parent
         self.player_name = player_name
+        self.player_types = player_types
         self.choice = tk.StringVar(value=default_choice)
+        self.player_type = tk.StringVar(value=player_types[0])
         self.create_controls()
 
     def create_controls(self):
@@ -20,3 +22,12 @@ class PlayerControls:
         o_button = tk.Radiobutton(self.parent, text="O", variable=self.choice, value="O")
         o_button.grid(row=2, column=0, padx=5, pady=5)
 
+        # Who plays this colour: a human clicking the board or a computer player
+        for index, player_type in enumerate(self.player_types):
+            type_button = tk.Radiobutton(self.parent, text=player_type, variable=self.player_type, value=player_type)
+            type_button.grid(row=3 + index, column=0, padx=5, pady=1, sticky="w")
+
+    def is_computer(self):
+        """Returns True if this colour is played by a computer player."""
+        return self.player_type.get() != "Human"
+
@@ -0,0 +1,132 @@
+import inspect
+import random
+from alphabeta_player import AlphaBetaPlayer
+from game_manager import GameManager
+from mcts_player import MCTSPlayer
+
+
+class RandomPlayer:
+    """Computer player choosing a uniformly random empty cell and character."""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose_move(self, game_manager, cancel_event=None):
+        """Returns a random legal (row, col, character)."""
+        row, col = self.rng.choice(sorted(game_manager.legal_moves()))
+        return row, col, self.rng.choice("SO")
+
+
+class GreedyPlayer:
+    """Computer player taking the move that completes the most SOS lines right now, otherwise a random one."""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose_move(self, game_manager, cancel_event=None):
+        """Returns the best scoring (row, col, character), or a random one if no move scores."""
+        best_gain = 0
+        best_moves = []
+        for character in ('S', 'O'):
+            for (row, col), gain in game_manager.scoring_cells(character).items():
+                if gain > best_gain:
+                    best_gain = gain
+                    best_moves = []
+                if gain == best_gain:
+                    best_moves.append((row, col, character))
+        if best_moves:
+            return self.rng.choice(sorted(best_moves))
+        row, col = self.rng.choice(sorted(game_manager.legal_moves()))
+        return row, col, self.rng.choice("SO")
+
+
+# Player types by the name used in player specs
+PLAYER_TYPES = {
+    "random": RandomPlayer,
+    "greedy": GreedyPlayer,
+    "alphabeta": AlphaBetaPlayer,
+    "mcts": MCTSPlayer,
+}
+# Options given to a player type unless its spec sets them; MCTS defaults to in-process
+# playouts, since players created inside a process pool cannot start pools of their own
+DEFAULT_OPTIONS = {
+    "alphabeta": {"time_limit": 0.1},
+    "mcts": {"time_limit": 0.1, "workers": 0},
+}
+
+
+def parse_value(text):
+    """Converts an option value from a player spec to an int, float or None where it reads as one."""
+    if text == "None":
+        return None
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def get_option_names(name):
+    """Returns the options a player type's constructor accepts, in order."""
+    return tuple(inspect.signature(PLAYER_TYPES[name]).parameters)
+
+
+def parse_player_spec(spec):
+    """Splits a spec like "alphabeta:time_limit=0.5,max_depth=4" into (type name, options dict)."""
+    name, _, option_text = spec.partition(":")
+    if name not in PLAYER_TYPES:
+        raise ValueError(f"Unknown player type {name!r}; choose from {', '.join(PLAYER_TYPES)}")
+    options = dict(DEFAULT_OPTIONS.get(name, {}))
+    for option in filter(None, option_text.split(",")):
+        key, separator, value = option.partition("=")
+        if not separator:
+            raise ValueError(f"Player option {option!r} is not of the form name=value")
+        key = key.strip()
+        if key not in get_option_names(name):
+            raise ValueError(f"{name} players have no option {key!r}; "
+                             f"choose from {', '.join(get_option_names(name))}")
+        options[key] = parse_value(value.strip())
+    return name, options
+
+
+def create_player(spec, seed=None):
+    """Builds a computer player from a spec (see parse_player_spec), seeded unless the spec sets a seed."""
+    name, options = parse_player_spec(spec)
+    options.setdefault("seed", seed)
+    return PLAYER_TYPES[name](**options)
+
+
+def close_player(player):
+    """Releases a player's worker processes, for the player types that have them."""
+    close = getattr(player, "close", None)
+    if close is not None:
+        close()
+
+
+def play_game(players, board_size, game_mode, on_move=None):
+    """Plays one game between computer players and returns its outcome.
+
+    players maps "Blue" and "Red" to objects with choose_move(game_manager).
+    on_move(game_manager, move), if given, is called before each move is made.
+    Returns {"winner": "Blue", "Red" or "Draw", "blue_score", "red_score", "moves"}.
+    """
+    game_manager = GameManager(board_size, game_mode)
+    game_manager.reset_game(board_size, game_mode)
+    moves = 0
+    while True:
+        move = players[game_manager.get_current_player()].choose_move(game_manager)
+        if on_move is not None:
+            on_move(game_manager, move)
+        mover = game_manager.get_current_player()
+        result = game_manager.make_move(*move)
+        if result is False:
+            raise ValueError(f"{mover} chose the illegal move {move}")
+        moves += 1
+
+        if result["result"] == "next_turn":
+            game_manager.switch_turn()
+        elif result["result"] in ("win", "draw", "end"):
+            winner = result.get("winner", "Draw")
+            return {"winner": winner, "blue_score": game_manager.sos_count["Blue"],
+                    "red_score": game_manager.sos_count["Red"], "moves": moves}
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+
+_SYMMETRY_CACHE = {}
+
+
+def get_symmetries(board_size):
+    """Returns the eight dihedral symmetries of the board as tuples mapping each flat cell index to its image.
+
+    The first symmetry is the identity; the rest are the three rotations and
+    the four reflections.
+    """
+    symmetries = _SYMMETRY_CACHE.get(board_size)
+    if symmetries is None:
+        last = board_size - 1
+        transforms = (
+            lambda row, col: (row, col),
+            lambda row, col: (col, last - row),
+            lambda row, col: (last - row, last - col),
+            lambda row, col: (last - col, row),
+            lambda row, col: (row, last - col),
+            lambda row, col: (last - row, col),
+            lambda row, col: (col, row),
+            lambda row, col: (last - col, last - row),
+        )
+        symmetries = tuple(
+            tuple(new_row * board_size + new_col
+                  for new_row, new_col in (transform(cell // board_size, cell % board_size)
+                                           for cell in range(board_size * board_size)))
+            for transform in transforms)
+        _SYMMETRY_CACHE[board_size] = symmetries
+    return symmetries
+
+
+def canonical_key(game_manager, include_side=True, include_score=True):
+    """Returns (key, symmetry index) for a GameManager position, identical for all eight symmetric boards.
+
+    The key is (game mode, canonical cells, side to move, Blue minus Red
+    score), with the side and score left out (None and 0) when not wanted, as
+    for engines whose values are relative to the side to move. The canonical
+    cells are the smallest string of the eight transformed boards; the
+    symmetry index tells which transform produced it, for map_cell.
+    """
+    size = game_manager.board_size
+    cells = "".join("".join(row) for row in game_manager.board)
+    best = None
+    best_index = 0
+    for index, symmetry in enumerate(get_symmetries(size)):
+        transformed = [' '] * len(cells)
+        for cell, image in enumerate(symmetry):
+            transformed[image] = cells[cell]
+        transformed = "".join(transformed)
+        if best is None or transformed < best:
+            best, best_index = transformed, index
+
+    side = game_manager.current_player if include_side else None
+    score = game_manager.sos_count["Blue"] - game_manager.sos_count["Red"] if include_score else 0
+    return (game_manager.game_mode, best, side, score), best_index
+
+
+def map_cell(board_size, symmetry_index, cell, to_canonical=True):
+    """Maps a flat cell index between a board and its canonical form under the given symmetry."""
+    symmetry = get_symmetries(board_size)[symmetry_index]
+    if to_canonical:
+        return symmetry[cell]
+    return symmetry.index(cell)
+
+
+class SymmetricZobrist:
+    """Keeps one Zobrist hash per symmetry so a canonical hash can be updated in O(8) per move.
+
+    Hash i of a board is the plain Zobrist hash of the board transformed by
+    symmetry i, so the eight hashes of symmetric boards are the same set and
+    their minimum is a canonical hash. The keys are the engine's own
+    per-cell {'S': key, 'O': key} table, so hash 0 is its usual hash.
+    """
+
+    def __init__(self, board_size, keys):
+        self.board_size = board_size
+        self.symmetries = get_symmetries(board_size)
+        self.inverses = tuple(tuple(symmetry.index(cell) for cell in range(board_size * board_size))
+                              for symmetry in self.symmetries)
+        # Per cell and character, the key each symmetric hash changes by
+        self.cell_keys = [{character: tuple(keys[symmetry[cell]][character] for symmetry in self.symmetries)
+                           for character in ('S', 'O')}
+                          for cell in range(board_size * board_size)]
+
+    def hashes(self, board):
+        """Computes the eight hashes of a board from scratch."""
+        hashes = [0] * 8
+        size = self.board_size
+        for row, board_row in enumerate(board):
+            for col, character in enumerate(board_row):
+                if character != ' ':
+                    hashes = [value ^ key for value, key in zip(hashes, self.cell_keys[row * size + col][character])]
+        return tuple(hashes)
+
+    def update(self, hashes, cell, character):
+        """Returns the hashes after placing character on cell (or removing it, as XOR is its own inverse)."""
+        keys = self.cell_keys[cell][character]
+        return (hashes[0] ^ keys[0], hashes[1] ^ keys[1], hashes[2] ^ keys[2], hashes[3] ^ keys[3],
+                hashes[4] ^ keys[4], hashes[5] ^ keys[5], hashes[6] ^ keys[6], hashes[7] ^ keys[7])
+
+    def canonical(self, hashes):
+        """Returns (canonical hash, symmetry index) of a board's hashes."""
+        index = min(range(8), key=hashes.__getitem__)
+        return hashes[index], index
+
+
+class PositionCache:
+    """Bounded least-recently-used cache of evaluated positions, keyed by canonical position keys.
+
+    Values are whatever the engine stores; keys from canonical_key or
+    SymmetricZobrist make one entry serve all eight symmetric positions.
+    """
+
+    def __init__(self, max_entries=1 << 16):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        """Returns the value cached for key, marking it as recently used, or default."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Caches value for key, evicting the least recently used entry when full."""
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = value
+
+    def clear(self):
+        """Removes every entry and resets the statistics."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Returns the entry count, hits, misses, evictions and hit rate as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from numpy.lib.format import open_memmap
+from players import close_player, create_player, parse_player_spec, play_game
+
+# Input planes of an encoded position
+PLANE_S, PLANE_O, PLANE_EMPTY, PLANE_SIDE = range(4)
+PLANE_COUNT = 4
+MANIFEST_NAME = "manifest.json"
+DEFAULT_SHARD_SIZE = 1 << 16  # Positions per shard
+OUTCOMES = {"win": 1, "draw": 0, "loss": -1}
+
+
+def get_example_dtype(board_size):
+    """Returns the structured dtype of one training example for a board size.
+
+    planes: S, O, empty and side to move (all ones when Blue is on turn) as 0/1 bytes
+    move: the move played, cell * 2 + 1 for O
+    outcome: the final result for the side to move: 1 win, 0 draw, -1 loss
+    margin: the final SOS count of the side to move minus the opponent's
+    """
+    return np.dtype([("planes", np.uint8, (PLANE_COUNT, board_size, board_size)),
+                     ("move", "<i2"), ("outcome", "i1"), ("margin", "<i2")])
+
+
+def encode_position(game_manager):
+    """Returns the (PLANE_COUNT, size, size) uint8 planes of a GameManager position."""
+    board = np.array(game_manager.board)
+    planes = np.empty((PLANE_COUNT,) + board.shape, dtype=np.uint8)
+    planes[PLANE_S] = board == 'S'
+    planes[PLANE_O] = board == 'O'
+    planes[PLANE_EMPTY] = board == ' '
+    planes[PLANE_SIDE] = game_manager.get_current_player() == "Blue"
+    return planes
+
+
+def encode_move(board_size, row, col, character):
+    """Returns the move index used as the policy target: cell * 2 + 1 for O."""
+    return (row * board_size + col) * 2 + (character == 'O')
+
+
+def decode_move(board_size, move):
+    """Returns the (row, col, character) of a move index."""
+    row, col = divmod(int(move) >> 1, board_size)
+    return row, col, 'O' if move & 1 else 'S'
+
+
+class ShardWriter:
+    """Writes training examples into fixed-size .npy shards through numpy memory maps.
+
+    A shard is filled under a temporary name and renamed once it is full, so
+    readers never see a shard that is still being written. close() shrinks
+    the last shard to the examples it holds.
+    """
+
+    def __init__(self, directory, prefix, board_size, shard_size=DEFAULT_SHARD_SIZE):
+        self.directory = directory
+        self.prefix = prefix  # Unique per worker, so workers never write the same file
+        self.dtype = get_example_dtype(board_size)
+        self.shard_size = shard_size
+        self.shards = []  # (file name, example count) of every finished shard
+        self.shard = None
+        self.filled = 0
+
+    def temporary_path(self):
+        return os.path.join(self.directory, f"{self.prefix}-{len(self.shards):05d}.npy.tmp")
+
+    def finished_name(self):
+        return f"{self.prefix}-{len(self.shards):05d}.npy"
+
+    def add_game(self, examples):
+        """Appends the examples of one game, an array of the example dtype."""
+        written = 0
+        while written < len(examples):
+            if self.shard is None:
+                self.shard = open_memmap(self.temporary_path(), mode="w+", dtype=self.dtype,
+                                         shape=(self.shard_size,))
+                self.filled = 0
+            count = min(len(examples) - written, self.shard_size - self.filled)
+            self.shard[self.filled:self.filled + count] = examples[written:written + count]
+            self.filled += count
+            written += count
+            if self.filled == self.shard_size:
+                self.finish_shard()
+
+    def finish_shard(self):
+        """Flushes the current shard, shrinking it first if it is not full, and gives it its final name."""
+        temporary_path = self.temporary_path()
+        name = self.finished_name()
+        if self.filled < self.shard_size:
+            # Copy the examples into a file of the right length and drop the full-size one
+            partial_path = temporary_path + ".part"
+            partial = open_memmap(partial_path, mode="w+", dtype=self.dtype, shape=(self.filled,))
+            partial[:] = self.shard[:self.filled]
+            partial.flush()
+            del partial
+            self.shard = None
+            os.replace(partial_path, os.path.join(self.directory, name))
+            os.remove(temporary_path)
+        else:
+            self.shard.flush()
+            self.shard = None
+            os.replace(temporary_path, os.path.join(self.directory, name))
+        self.shards.append((name, self.filled))
+
+    def close(self):
+        """Finishes the last shard, if it holds any examples."""
+        if self.shard is not None:
+            if self.filled:
+                self.finish_shard()
+            else:
+                self.shard = None
+                os.remove(self.temporary_path())
+        return self.shards
+
+
+def self_play_game(players, board_size, game_mode, dtype):
+    """Plays one game and returns its positions as an array of training examples."""
+    positions = []
+    movers = []
+    moves = []
+
+    def record(game_manager, move):
+        positions.append(encode_position(game_manager))
+        movers.append(game_manager.get_current_player())
+        moves.append(encode_move(board_size, *move))
+
+    outcome = play_game(players, board_size, game_mode, on_move=record)
+    examples = np.zeros(len(positions), dtype=dtype)
+    examples["planes"] = positions
+    examples["move"] = moves
+    blue_margin = outcome["blue_score"] - outcome["red_score"]
+    for index, mover in enumerate(movers):
+        if outcome["winner"] == "Draw":
+            examples["outcome"][index] = OUTCOMES["draw"]
+        else:
+            examples["outcome"][index] = OUTCOMES["win" if outcome["winner"] == mover else "loss"]
+        examples["margin"][index] = blue_margin if mover == "Blue" else -blue_margin
+    return examples
+
+
+def generate_worker_shards(job):
+    """Plays one worker's share of the games into its own shards; executed in worker processes."""
+    board_size = job["board_size"]
+    writer = ShardWriter(job["directory"], f"shard-{job['worker']:03d}", board_size, job["shard_size"])
+    for seed in job["seeds"]:
+        players = {"Blue": create_player(job["blue"], seed=seed), "Red": create_player(job["red"], seed=seed + 1)}
+        try:
+            examples = self_play_game(players, board_size, job["game_mode"], writer.dtype)
+        finally:
+            close_player(players["Blue"])
+            close_player(players["Red"])
+        writer.add_game(examples)
+    return writer.close()
+
+
+def generate(directory, games, board_size, game_mode, blue="greedy", red=None, workers=None,
+             shard_size=DEFAULT_SHARD_SIZE, seed=0):
+    """Plays self-play games and writes their positions as shards in a directory.
+
+    Game i is played by worker i % workers with seed derived from seed and i,
+    and each worker writes its own shards, so workers never share a file. A
+    manifest listing the shards and settings is written last. workers=0
+    plays every game in this process. Returns the manifest.
+    """
+    red = blue if red is None else red
+    parse_player_spec(blue)
+    parse_player_spec(red)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    os.makedirs(directory, exist_ok=True)
+    if os.path.exists(os.path.join(directory, MANIFEST_NAME)):
+        raise ValueError(f"{directory} already holds a self-play data set")
+
+    seeds = [seed * 1000003 + 2 * game for game in range(games)]
+    worker_count = max(workers, 1)
+    jobs = [{"worker": worker, "seeds": seeds[worker::worker_count], "directory": directory,
+             "board_size": board_size, "game_mode": game_mode, "blue": blue, "red": red,
+             "shard_size": shard_size} for worker in range(worker_count)]
+
+    start = time.perf_counter()
+    if workers == 0:
+        shard_lists = [generate_worker_shards(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_lists = list(executor.map(generate_worker_shards, jobs))
+    elapsed = time.perf_counter() - start
+
+    shards = sorted(shard for shard_list in shard_lists for shard in shard_list)
+    manifest = {
+        "board_size": board_size,
+        "game_mode": game_mode,
+        "blue": blue,
+        "red": red,
+        "games": games,
+        "seed": seed,
+        "shard_size": shard_size,
+        "positions": sum(count for _, count in shards),
+        "shards": [{"file": name, "positions": count} for name, count in shards],
+        "elapsed": elapsed,
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), "w") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+class ShardDataset:
+    """Reads a self-play directory shard by shard through read-only memory maps.
+
+    Only the batches handed out are copied into memory; the operating system
+    pages the rest of each shard in and out as needed.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_NAME)) as file:
+            self.manifest = json.load(file)
+        self.board_size = self.manifest["board_size"]
+        self.shard_files = [os.path.join(directory, shard["file"]) for shard in self.manifest["shards"]]
+
+    def __len__(self):
+        return self.manifest["positions"]
+
+    def shards(self):
+        """Yields each shard as a read-only memory-mapped array of examples."""
+        for path in self.shard_files:
+            yield np.load(path, mmap_mode="r")
+
+    def batches(self, batch_size=1024, shuffle=False, seed=None):
+        """Yields dicts of "planes", "move", "outcome" and "margin" arrays of up to batch_size examples.
+
+        With shuffle, the shard order and the order of batches within each
+        shard are shuffled; examples within a batch stay in file order so each
+        batch is read from one contiguous range.
+        """
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(self.shard_files)) if shuffle else range(len(self.shard_files))
+        for shard_index in order:
+            shard = np.load(self.shard_files[shard_index], mmap_mode="r")
+            starts = np.arange(0, len(shard), batch_size)
+            if shuffle:
+                rng.shuffle(starts)
+            for start in starts:
+                batch = np.array(shard[start:start + batch_size])
+                yield {field: batch[field] for field in batch.dtype.names}
+
+
+def main(argv=None):
+    """Generates a self-play data set from the command line."""
+    parser = argparse.ArgumentParser(description="Write SOS self-play positions as memory-mapped .npy shards.")
+    parser.add_argument("directory")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=5)
+    parser.add_argument("--mode", choices=["Simple", "General"], default="General")
+    parser.add_argument("--player", default="greedy", help="player spec for Blue, and for Red unless --opponent is set")
+    parser.add_argument("--opponent", help="player spec for Red")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes; 0 plays in this process")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = generate(args.directory, args.games, args.size, args.mode, args.player, args.opponent,
+                            args.workers, args.shard_size, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{manifest['positions']} positions from {manifest['games']} games in {len(manifest['shards'])} shards, "
+          f"{manifest['elapsed']:.1f}s ({manifest['games'] / manifest['elapsed']:.1f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
-from game_manager import GameManager
+from game_manager import MAX_BOARD_SIZE, MIN_BOARD_SIZE, GameManager
 from player_controls import PlayerControls
-from game_board import GameBoard
+from game_board import CanvasGameBoard
+from alphabeta_player import AlphaBetaPlayer
+from mcts_player import MCTSPlayer
+from engine_worker import EngineWorker
+from opening_book import get_book
+
+COMPUTER_MOVE_DELAY = 100  # Milliseconds before a computer player moves, so each move stays visible
+COMPUTER_TIME_LIMIT = 1.0  # Seconds a computer player may think about one move
+MAX_VISIBLE_BOARD_PIXELS = 600  # Larger boards scroll inside the canvas
 
 class SOSGameGUI:
     """Handles the user interface for the SOS game."""
@@ -18,6 +26,17 @@ class SOSGameGUI:
 
         # Game active flag
         self.is_game_active = False
+        self.game_number = 0  # Counts started games, so a computer move from an earlier game is dropped
+
+        # Computer players by the player type chosen in PlayerControls, shared by both colours
+        self.computer_players = {
+            "Alpha-beta": AlphaBetaPlayer(time_limit=COMPUTER_TIME_LIMIT),
+            "MCTS": MCTSPlayer(time_limit=COMPUTER_TIME_LIMIT),
+        }
+        # Solved moves for small boards, when a book has been built for the chosen size and mode
+        self.opening_book = None
+        # Computer moves are computed off the Tk thread so the window stays responsive
+        self.engine_worker = EngineWorker(self.root)
 
         # Create the main UI structure
         self.create_ui()
@@ -42,6 +61,8 @@ class SOSGameGUI:
         self.red_frame = tk.Frame(self.main_frame)
         self.red_controls = PlayerControls(self.red_frame, "Red")
         self.red_frame.grid(row=1, column=2, padx=20, pady=10, sticky="n")
+        for controls in (self.blue_controls, self.red_controls):
+            controls.player_type.trace_add("write", self.on_player_type_change)
 
         # Create the Scrollable Board Frame
         self.create_scrollable_board_frame()
@@ -63,7 +84,7 @@ class SOSGameGUI:
         self.red_sos_label.grid(row=3, column=2, padx=5, pady=5)
 
     def create_scrollable_board_frame(self):
-        """Create a scrollable frame for the game board."""
+        """Create the scrollable canvas the game board is drawn on."""
         self.canvas = tk.Canvas(self.main_frame)
         self.canvas.grid(row=1, column=1, padx=20, pady=10, sticky="nsew")
 
@@ -75,11 +96,6 @@ class SOSGameGUI:
 
         self.canvas.configure(xscrollcommand=self.scrollbar_x.set, yscrollcommand=self.scrollbar_y.set)
 
-        self.board_frame = tk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.board_frame, anchor="nw")
-
-        self.board_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-
     def setup_game_controls(self, parent):
         """Sets up game mode and board size selection."""
         label = tk.Label(parent, text="SOS")
@@ -98,24 +114,42 @@ class SOSGameGUI:
 
         self.board_size_var = tk.IntVar(value=3)
         vcmd = (self.root.register(self.validate_board_size), '%P')
-        self.board_size_spinbox = tk.Spinbox(parent, from_=3, to=20, textvariable=self.board_size_var, 
+        self.board_size_spinbox = tk.Spinbox(parent, from_=MIN_BOARD_SIZE, to=MAX_BOARD_SIZE, textvariable=self.board_size_var, 
                                              validate="key", validatecommand=vcmd, width=3)
         self.board_size_spinbox.grid(row=0, column=3, padx=5, pady=1, sticky="w")
 
+        # Shade the empty cells where the next S or O would complete an SOS
+        self.show_hints_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(parent, text="Show scoring cells", variable=self.show_hints_var,
+                       command=self.update_hints).grid(row=0, column=4, padx=5, pady=1, sticky="w")
+
     def setup_bottom_controls(self, parent):
         """Sets up the bottom controls like Start/End game buttons."""
         self.start_button = tk.Button(parent, text="Start Game", command=self.toggle_game)
         self.start_button.grid(row=0, column=0, padx=10, pady=5)
 
+        self.undo_button = tk.Button(parent, text="Undo", command=self.undo_move)
+        self.undo_button.grid(row=0, column=1, padx=10, pady=5)
+
+        self.redo_button = tk.Button(parent, text="Redo", command=self.redo_move)
+        self.redo_button.grid(row=0, column=2, padx=10, pady=5)
+
         self.turn_label = tk.Label(parent, text="Current turn: Blue")
         self.turn_label.grid(row=1, column=0)
         self.turn_label.grid_remove()
 
+        # Shown while a computer player is thinking
+        self.thinking_label = tk.Label(parent, text="")
+        self.thinking_label.grid(row=2, column=0)
+        self.move_now_button = tk.Button(parent, text="Move Now", command=self.engine_worker.finish_early)
+        self.move_now_button.grid(row=2, column=1, padx=10, pady=5)
+        self.set_thinking(False)
+
     def validate_board_size(self, new_value):
-        """Validates the board size input in the Spinbox to ensure it is between 3 and 20."""
+        """Validates the board size input in the Spinbox to ensure it is between MIN_BOARD_SIZE and MAX_BOARD_SIZE."""
         if new_value.isdigit():
             value = int(new_value)
-            return 3 <= value <= 20
+            return MIN_BOARD_SIZE <= value <= MAX_BOARD_SIZE
         return False
 
     def toggle_game(self):
@@ -129,7 +163,9 @@ class SOSGameGUI:
 
     def start_game(self):
         """Initializes the game board and sets up for play."""
+        self.stop_computer_move()
         self.is_game_active = True
+        self.game_number += 1
         # Retrieve the game mode as selected by the user in the radio button ("Simple" or "General")
         selected_mode = self.radio_var.get().split()[0]  # "Simple" or "General"
 
@@ -140,41 +176,146 @@ class SOSGameGUI:
 
         # Pass the selected game mode to the GameManager
         self.game_manager.reset_game(self.board_size, self.game_mode)
+        self.opening_book = get_book(self.board_size, self.game_mode)
 
         # Adjust the window size and initialize the game board
         self.adjust_window_size(self.board_size)
-        self.board = GameBoard(self.board_frame, self.board_size, self.on_board_click)
-        self.board.create_board()
+        self.board = CanvasGameBoard(self.canvas, self.board_size, self.on_board_click)
         
         initial_turn = self.game_manager.get_current_player()
         self.turn_label.config(text=f"Current turn: {initial_turn}")
         self.turn_label.grid()  # Show the turn label to start displaying turns
+        self.update_hints()
+        self.schedule_computer_turn()
 
 
     def adjust_window_size(self, board_size):
-        """Adjusts the window size based on the board size."""
-        cell_size = 50
-        board_pixel_size = board_size * cell_size
-        max_window_size = 600
+        """Adjusts the canvas and window size based on the board size."""
+        board_pixels = board_size * CanvasGameBoard.cell_size_for(board_size)
+        visible_size = min(board_pixels, MAX_VISIBLE_BOARD_PIXELS)
 
-        if board_pixel_size > max_window_size:
-            self.canvas.grid()
-        else:
-            self.root.geometry(f"{board_pixel_size + 600}x{board_pixel_size + 600}")
+        self.canvas.configure(width=visible_size, height=visible_size)
+        self.root.geometry(f"{visible_size + 600}x{visible_size + 400}")
 
     def on_board_click(self, row, col):
         """Handles a click on the board."""
         if not self.game_manager.is_game_active:
             return
 
-        current_player = self.game_manager.get_current_player()
-        character_choice = self.blue_controls.choice.get() if current_player == "Blue" else self.red_controls.choice.get()
+        current_controls = self.get_player_controls(self.game_manager.get_current_player())
+        if current_controls.is_computer():
+            return  # Ignore clicks while a computer player is on turn
 
-        move_result = self.game_manager.make_move(row, col, character_choice)
+        self.play_move(row, col, current_controls.choice.get())
+
+    def play_move(self, row, col, character):
+        """Plays a move for the current player, human or computer, and updates the display."""
+        move_result = self.game_manager.make_move(row, col, character)
+        self.handle_move_result(row, col, character, move_result)
+        self.schedule_computer_turn()
+
+    def get_player_controls(self, player):
+        """Returns the PlayerControls of the given player."""
+        return self.blue_controls if player == "Blue" else self.red_controls
+
+    def schedule_computer_turn(self):
+        """Lets the computer move shortly if it plays the colour now on turn."""
+        if not self.is_game_active or not self.game_manager.is_game_active:
+            return
+        if self.get_player_controls(self.game_manager.get_current_player()).is_computer():
+            self.root.after(COMPUTER_MOVE_DELAY, self.play_computer_move)
+
+    def play_computer_move(self):
+        """Starts the computer player on turn thinking about its move on the engine worker thread."""
+        if not self.is_game_active or not self.game_manager.is_game_active or self.engine_worker.is_busy():
+            return  # The game ended before the computer's turn came up, or it is already thinking
+
+        current_controls = self.get_player_controls(self.game_manager.get_current_player())
+        if not current_controls.is_computer():
+            return
 
+        token = self.position_token()
+        if self.opening_book is not None:
+            entry = self.opening_book.lookup(self.game_manager)
+            if entry is not None:
+                self.on_computer_move(entry[1], token)  # Solved position, no need to think
+                return
+
+        computer_player = self.computer_players[current_controls.player_type.get()]
+        position = self.game_manager.copy()  # The worker searches its own copy of the game
+        self.set_thinking(True)
+        self.engine_worker.submit(lambda cancel_event: computer_player.choose_move(position, cancel_event),
+                                  on_done=lambda move: self.on_computer_move(move, token),
+                                  on_tick=self.show_thinking_time,
+                                  on_error=self.on_computer_error)
+
+    def position_token(self):
+        """Returns (game number, player on turn, moves made), which identifies the position a computer move is for."""
+        return self.game_number, self.game_manager.get_current_player(), len(self.game_manager.move_log)
+
+    def on_computer_move(self, move, token):
+        """Plays the move a computer player chose for the position identified by token, back on the Tk thread."""
+        self.set_thinking(False)
+        if not self.is_game_active or not self.game_manager.is_game_active:
+            return
+
+        current_controls = self.get_player_controls(self.game_manager.get_current_player())
+        if token != self.position_token() or not current_controls.is_computer():
+            # The game moved on or this colour was handed to a human while the computer thought
+            self.schedule_computer_turn()
+            return
+
+        row, col, character = move
+        current_controls.choice.set(character)  # Show the computer's letter choice
+        self.play_move(row, col, character)
+
+    def on_computer_error(self, error):
+        """Reports a failed computer move and hands the board back to the humans."""
+        self.set_thinking(False)
+        self.turn_label.config(text=f"Computer player failed: {error}")
+
+    def show_thinking_time(self, elapsed):
+        """Updates the progress label while a computer player is thinking."""
+        self.thinking_label.config(text=f"Computer thinking... {elapsed:.1f}s")
+
+    def set_thinking(self, is_thinking):
+        """Shows or hides the thinking controls and blocks board input and undo while a computer thinks."""
+        if is_thinking:
+            self.thinking_label.config(text="Computer thinking...")
+            self.thinking_label.grid()
+            self.move_now_button.grid()
+        else:
+            self.thinking_label.grid_remove()
+            self.move_now_button.grid_remove()
+
+        state = "disabled" if is_thinking else "normal"
+        self.undo_button.config(state=state)
+        self.redo_button.config(state=state)
+        if hasattr(self, "board"):
+            self.board.is_enabled = not is_thinking and self.is_game_active
+
+    def on_player_type_change(self, *_):
+        """Stops a computer that is thinking for a colour just handed to a human, or lets a new computer move."""
+        if self.engine_worker.is_busy() and not self.get_player_controls(
+                self.game_manager.get_current_player()).is_computer():
+            self.stop_computer_move()
+        self.schedule_computer_turn()
+
+    def stop_computer_move(self):
+        """Cancels a computer move in progress and discards its result."""
+        self.engine_worker.cancel()
+        self.set_thinking(False)
+
+    def handle_move_result(self, row, col, character, move_result):
+        """Updates the board and labels for the result of a move made by the current player."""
         if move_result:
+            current_player = self.game_manager.get_current_player()
+
             # Update the board visually
-            self.board.update_button(row, col, character_choice)
+            self.board.update_button(row, col, character)
+            sos_lines = self.game_manager.sos_lines_at(row, col)
+            if sos_lines:
+                self.board.draw_sos_lines(row, col, sos_lines, current_player)
 
             # Handle different results from make_move
             if move_result["result"] == "win":
@@ -187,6 +328,7 @@ class SOSGameGUI:
                 self.turn_label.config(text="The game is a draw! No SOS was created.")
                 self.end_game()
             elif move_result["result"] == "end":
+                self.update_sos_count_display()
                 winner = move_result["winner"]
                 blue_score = move_result["blue_score"]
                 red_score = move_result["red_score"]
@@ -201,7 +343,44 @@ class SOSGameGUI:
                 self.game_manager.switch_turn()
                 next_turn = self.game_manager.get_current_player()
                 self.turn_label.config(text=f"Current turn: {next_turn}")
+        self.update_hints()
+
+    def update_hints(self):
+        """Redraws the scoring-cell hints, or clears them when hints are off or no game is running."""
+        if not hasattr(self, "board"):
+            return
+        if self.show_hints_var.get() and self.is_game_active and self.game_manager.is_game_active:
+            self.board.highlight_cells(self.game_manager.scoring_cells('S'), self.game_manager.scoring_cells('O'))
+        else:
+            self.board.clear_highlights()
+
+    def undo_move(self):
+        """Takes back the last move of the current game, and the computer's replies to it."""
+        if not self.is_game_active:
+            return
+
+        record = self.game_manager.undo_move()
+        while record is not None:
+            self.board.update_button(record.row, record.col, ' ')
+            # Keep undoing until a human is on turn, unless both colours are computers
+            if not self.get_player_controls(record.player).is_computer() or (
+                    self.blue_controls.is_computer() and self.red_controls.is_computer()):
+                break
+            record = self.game_manager.undo_move()
+
+        self.update_sos_count_display()
+        self.turn_label.config(text=f"Current turn: {self.game_manager.get_current_player()}")
+        self.update_hints()
+
+    def redo_move(self):
+        """Replays the last move that was taken back."""
+        if not self.is_game_active or not self.game_manager.redo_log:
+            return
 
+        record = self.game_manager.redo_log[-1]
+        move_result = self.game_manager.redo_move()
+        self.handle_move_result(record.row, record.col, record.character, move_result)
+        self.schedule_computer_turn()
 
     def update_sos_count_display(self):
         """Updates the SOS count display for each player."""
@@ -211,20 +390,23 @@ class SOSGameGUI:
         self.red_sos_label.config(text=f"Red SOS Count: {red_count}")
 
     def end_game(self):
-        """Ends the game, disables all buttons, and clears the board."""
+        """Ends the game and disables the board, leaving the final position visible."""
         self.is_game_active = False
+        self.stop_computer_move()
         self.game_manager.end_game()
 
         self.board.disable_buttons()
+        self.board.clear_highlights()
         self.blue_controls.choice.set("S")
         self.red_controls.choice.set("S")
-        self.board_frame.grid_remove()
 
 def main():
     """Main function to run the Tkinter application."""
     root = tk.Tk()
     app = SOSGameGUI(root)
     root.mainloop()
+    app.engine_worker.shutdown()
+    app.computer_players["MCTS"].close()  # Stop the playout worker processes
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,265 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from game_manager import GameManager
+# Everything else, the Tk GUI included, is imported by the commands that use it,
+# so batch jobs start fast and run on hosts without a display
+
+HUMAN = "human"
+EMPTY_MARK = "."  # How an empty cell is printed
+STARTUP_COMMANDS = {
+    "sos_cli": "import sos_cli",
+    "Tk launcher": "import sos",
+}
+
+
+def format_board(game_manager):
+    """Returns the board as text with row and column numbers."""
+    size = game_manager.board_size
+    width = len(str(size - 1))
+    lines = [" " * (width + 1) + " ".join(f"{col:>{width}}" for col in range(size))]
+    for row, cells in enumerate(game_manager.board):
+        lines.append(f"{row:>{width}} " + " ".join(f"{cell if cell != ' ' else EMPTY_MARK:>{width}}"
+                                                   for cell in cells))
+    return "\n".join(lines)
+
+
+def format_outcome(winner, blue_score, red_score, game_mode):
+    """Returns a one-line description of how a game ended."""
+    if winner is None:
+        return "unfinished"
+    text = "draw" if winner == "Draw" else f"{winner} wins"
+    if game_mode == "General":
+        text += f" {blue_score}-{red_score}"
+    return text
+
+
+def parse_human_move(text, game_manager):
+    """Parses "row col S" or "row col O" typed by a player; returns (row, col, character) or None."""
+    parts = text.replace(",", " ").split()
+    if len(parts) != 3 or parts[2].upper() not in ("S", "O"):
+        return None
+    try:
+        row, col = int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+    if (row, col) not in game_manager.legal_moves():
+        return None
+    return row, col, parts[2].upper()
+
+
+def play(args, input_function=input, output=print):
+    """Plays one game in the terminal between humans and/or computer players."""
+    specs = {"Blue": args.blue, "Red": args.red}
+    players = {}
+    if any(spec != HUMAN for spec in specs.values()):
+        from players import create_player
+        for colour, spec in specs.items():
+            if spec != HUMAN:
+                players[colour] = create_player(spec, seed=args.seed)
+
+    game_manager = GameManager(args.size, args.mode)
+    game_manager.reset_game(args.size, args.mode)
+    output(f"{args.size}x{args.size} {args.mode} game. Enter moves as: row col S|O  (or undo, quit)")
+    while True:
+        output(format_board(game_manager))
+        player = game_manager.get_current_player()
+        if player in players:
+            move = players[player].choose_move(game_manager)
+            output(f"{player} plays {move[0]} {move[1]} {move[2]}")
+        else:
+            try:
+                text = input_function(f"{player}> ").strip()
+            except EOFError:
+                text = "quit"
+            if text.lower() in ("q", "quit", "exit"):
+                output("Game abandoned")
+                return None
+            if text.lower() == "undo":
+                # Take back computer replies too, back to the last move a human made
+                if not any(record.player not in players for record in game_manager.move_log):
+                    output("No human move to undo")
+                    continue
+                record = game_manager.undo_move()
+                while record.player in players:
+                    record = game_manager.undo_move()
+                continue
+            move = parse_human_move(text, game_manager)
+            if move is None:
+                output("Enter an empty cell and a character, e.g. 0 1 S")
+                continue
+
+        result = game_manager.make_move(*move)
+        if result["result"] == "next_turn":
+            game_manager.switch_turn()
+        elif result["result"] == "continue":
+            output(f"{player} scored and moves again")
+        else:
+            output(format_board(game_manager))
+            winner = result.get("winner", "Draw")
+            output(format_outcome(winner, game_manager.sos_count["Blue"], game_manager.sos_count["Red"], args.mode))
+            return winner
+
+
+def simulate(args, output=print):
+    """Plays games between two computer players and prints the totals, optionally recording them."""
+    from players import close_player, create_player, play_game
+
+    writer = None
+    if args.record:
+        from game_records import GameRecordWriter
+        writer = GameRecordWriter(args.record)
+    totals = {"Blue": 0, "Red": 0, "Draw": 0}
+    move_total = 0
+    start = time.perf_counter()
+    try:
+        for game in range(args.games):
+            seed = args.seed * 1000003 + 2 * game
+            players = {"Blue": create_player(args.blue, seed=seed), "Red": create_player(args.red, seed=seed + 1)}
+            moves = []
+            try:
+                outcome = play_game(players, args.size, args.mode,
+                                    on_move=lambda game_manager, move: moves.append(
+                                        move + (game_manager.get_current_player(),)))
+            finally:
+                close_player(players["Blue"])
+                close_player(players["Red"])
+            totals[outcome["winner"]] += 1
+            move_total += outcome["moves"]
+            if writer is not None:
+                writer.begin_game(args.size, args.mode)
+                for row, col, character, player in moves:
+                    writer.record_move(row, col, character, player)
+                writer.end_game(outcome["winner"], outcome["blue_score"], outcome["red_score"])
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+
+    output(f"{args.games} games of {args.size}x{args.size} {args.mode}, {args.blue} (Blue) vs {args.red} (Red)")
+    output(f"Blue {totals['Blue']}  Red {totals['Red']}  Draw {totals['Draw']}")
+    if args.games:
+        output(f"{move_total / args.games:.1f} moves per game, {args.games / elapsed:.1f} games/s")
+    return totals
+
+
+def replay(args, output=print):
+    """Prints the games of a record file, with the board after every move if asked."""
+    from game_records import read_games, replay as replay_record
+
+    shown = 0
+    for number, record in enumerate(read_games(args.file), start=1):
+        if args.game is not None and number != args.game:
+            continue
+        output(f"Game {number}: {record.board_size}x{record.board_size} {record.game_mode}, "
+               f"{len(record.moves)} moves, "
+               f"{format_outcome(record.winner, record.blue_score, record.red_score, record.game_mode)}")
+        if args.moves:
+            game_manager = GameManager(record.board_size, record.game_mode)
+            game_manager.reset_game(record.board_size, record.game_mode)
+            for move in record.moves:
+                game_manager.current_player = move.player
+                if not game_manager.make_move(move.row, move.col, move.character):
+                    raise ValueError(f"Recorded move {move} is not legal")
+                output(f"{move.player} plays {move.row} {move.col} {move.character}")
+                output(format_board(game_manager))
+        elif args.board:
+            output(format_board(replay_record(record)[0]))
+        shown += 1
+    if args.game is not None and not shown:
+        raise ValueError(f"{args.file} has no game {args.game}")
+    return shown
+
+
+def measure_startup(repeat=5):
+    """Returns {name: median seconds} to start Python and import each entry point, in fresh processes."""
+    timings = {}
+    for name, statement in STARTUP_COMMANDS.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            completed = subprocess.run([sys.executable, "-c", statement], capture_output=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__)))
+            samples.append(time.perf_counter() - start)
+            if completed.returncode != 0:
+                samples = None  # e.g. tkinter is not installed
+                break
+        timings[name] = statistics.median(samples) if samples else None
+    return timings
+
+
+def startup(args, output=print):
+    """Prints the cold-start time of this entry point next to the Tk launcher's."""
+    timings = measure_startup(args.repeat)
+    baseline = timings["Tk launcher"]
+    for name, seconds in timings.items():
+        if seconds is None:
+            output(f"{name:<12} could not be imported")
+        elif baseline and name != "Tk launcher":
+            output(f"{name:<12} {seconds * 1000:7.1f} ms  ({seconds / baseline:.2f}x the Tk launcher)")
+        else:
+            output(f"{name:<12} {seconds * 1000:7.1f} ms")
+    return timings
+
+
+def gui(args):
+    """Starts the Tk GUI, which needs tkinter and a display."""
+    from sos import main as gui_main
+    gui_main()
+
+
+def build_parser():
+    """Returns the argument parser of every subcommand."""
+    parser = argparse.ArgumentParser(description="Play, simulate and replay SOS games from the console.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_game_options(command, blue, red):
+        command.add_argument("--size", type=int, default=3)
+        command.add_argument("--mode", choices=["Simple", "General"], default="Simple")
+        command.add_argument("--blue", default=blue, help="player spec such as greedy or alphabeta:time_limit=0.5")
+        command.add_argument("--red", default=red, help="player spec such as greedy or alphabeta:time_limit=0.5")
+        command.add_argument("--seed", type=int, default=0)
+
+    play_command = commands.add_parser("play", help="play a game in the terminal")
+    add_game_options(play_command, HUMAN, HUMAN)
+    play_command.set_defaults(handler=play)
+
+    simulate_command = commands.add_parser("simulate", help="play games between computer players")
+    add_game_options(simulate_command, "random", "random")
+    simulate_command.add_argument("--games", type=int, default=100)
+    simulate_command.add_argument("--record", help="append the games to this record file")
+    simulate_command.set_defaults(handler=simulate)
+
+    replay_command = commands.add_parser("replay", help="show the games of a record file")
+    replay_command.add_argument("file")
+    replay_command.add_argument("--game", type=int, help="only this game, counting from 1")
+    replay_command.add_argument("--board", action="store_true", help="print each game's final board")
+    replay_command.add_argument("--moves", action="store_true", help="print the board after every move")
+    replay_command.set_defaults(handler=replay)
+
+    startup_command = commands.add_parser("startup", help="compare cold-start time with the Tk launcher")
+    startup_command.add_argument("--repeat", type=int, default=5)
+    startup_command.set_defaults(handler=startup)
+
+    gui_command = commands.add_parser("gui", help="start the graphical game")
+    gui_command.set_defaults(handler=gui)
+    return parser
+
+
+def main(argv=None):
+    """Runs the subcommand given on the command line."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "size", 3) < 3:
+        parser.error("the board must be at least 3x3")
+    try:
+        args.handler(args)
+    except (ValueError, OSError) as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Row/column steps for horizontal, vertical, diagonal and anti-diagonal lines
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+_LINE_INDEX_CACHE = {}
+
+
+def build_all_lines(board_size):
+    """Returns every possible S-O-S line on the board as ((row, col), (row, col), (row, col)) triples.
+
+    The first and last cells of a triple hold the S's and the middle cell holds the O.
+    """
+    lines = []
+    for row in range(board_size):
+        for col in range(board_size):
+            for d_row, d_col in DIRECTIONS:
+                end_row = row + 2 * d_row
+                end_col = col + 2 * d_col
+                if 0 <= end_row < board_size and 0 <= end_col < board_size:
+                    lines.append(((row, col), (row + d_row, col + d_col), (end_row, end_col)))
+    return tuple(lines)
+
+
+def get_line_index(board_size):
+    """Returns the cached per-cell line index for the given board size.
+
+    The index is a flat tuple with one entry per cell (row * board_size + col),
+    each holding the tuple of every S-O-S line that passes through that cell.
+    """
+    line_index = _LINE_INDEX_CACHE.get(board_size)
+    if line_index is None:
+        lines_by_cell = [[] for _ in range(board_size * board_size)]
+        for line in build_all_lines(board_size):
+            for row, col in line:
+                lines_by_cell[row * board_size + col].append(line)
+        line_index = _LINE_INDEX_CACHE[board_size] = tuple(tuple(lines) for lines in lines_by_cell)
+    return line_index
@@ -0,0 +1,95 @@
+import random
+import threading
+import time
+import unittest
+from alphabeta_player import AlphaBetaPlayer
+from game_manager import GameManager
+
+class TestAlphaBetaPlayer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a 3x3 Simple game and a player with a fixed seed for each test."""
+        self.game_manager = GameManager(board_size=3, game_mode="Simple")
+        self.game_manager.reset_game(3, "Simple")
+        self.player = AlphaBetaPlayer(time_limit=1.0, seed=0)
+
+    def test_takes_winning_move_in_simple_mode(self):
+        """Test that the player completes an available SOS in Simple mode."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+
+        self.assertEqual(self.player.choose_move(self.game_manager), (0, 2, 'S'))
+
+    def test_orders_sos_completing_moves_first(self):
+        """Test that moves completing the most SOS lines are searched first."""
+        self.game_manager.reset_game(4, "General")
+        # An O at (1, 1) completes both diagonals, five other O's complete one line each
+        for row, col in [(0, 0), (0, 2), (2, 0), (2, 2), (3, 1), (3, 3)]:
+            self.game_manager.make_move(row, col, 'S')
+
+        moves = self.player.ordered_moves(self.game_manager, None)
+
+        self.assertEqual(moves[0], (1, 1, 'O', 2))
+        self.assertEqual([gain for _, _, _, gain in moves[1:6]], [1] * 5)
+        self.assertIn((3, 2, 'O', 1), moves[1:6])
+        self.assertTrue(all(gain == 0 for _, _, _, gain in moves[6:]))
+
+    def test_search_leaves_game_unchanged(self):
+        """Test that searching restores the board, scores, player and move log."""
+        self.game_manager.reset_game(4, "General")
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.switch_turn()
+        board = [row[:] for row in self.game_manager.board]
+
+        self.player.choose_move(self.game_manager)
+
+        self.assertEqual(self.game_manager.board, board)
+        self.assertEqual(self.game_manager.get_current_player(), "Red")
+        self.assertEqual(self.game_manager.empty_count, 15)
+        self.assertEqual(len(self.game_manager.move_log), 1)
+
+    def test_respects_time_limit(self):
+        """Test that a search on a large board stops close to its time budget and still returns a move."""
+        self.game_manager.reset_game(12, "General")
+        player = AlphaBetaPlayer(time_limit=0.2, seed=0)
+
+        start = time.perf_counter()
+        row, col, character = player.choose_move(self.game_manager)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.game_manager.board[row][col], ' ')
+        self.assertEqual(self.game_manager.empty_count, 144)
+
+    def test_modes_do_not_share_table_entries(self):
+        """Test that a General search after a Simple one on the same board searches like a fresh player."""
+        def general_search(player):
+            game_manager = GameManager(4, "General")
+            game_manager.reset_game(4, "General")
+            player.rng = random.Random(0)
+            move = player.choose_move(game_manager)
+            return move, player.last_stats["nodes"], player.last_stats["tt_hit_rate"]
+
+        reused = AlphaBetaPlayer(time_limit=60.0, max_depth=3, seed=0)
+        simple_game = GameManager(4, "Simple")
+        simple_game.reset_game(4, "Simple")
+        reused.choose_move(simple_game)
+
+        fresh = AlphaBetaPlayer(time_limit=60.0, max_depth=3, seed=0)
+        self.assertEqual(general_search(reused), general_search(fresh))
+
+    def test_cancel_event_stops_search(self):
+        """Test that a set cancel event makes the search return a legal move right away."""
+        self.game_manager.reset_game(10, "General")
+        player = AlphaBetaPlayer(time_limit=30.0, seed=0)
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        start = time.perf_counter()
+        row, col, character = player.choose_move(self.game_manager, cancel_event)
+
+        self.assertLess(time.perf_counter() - start, 5.0)
+        self.assertEqual(self.game_manager.board[row][col], ' ')
+
+
+if __name__ == "__main__":
+    unittest.main()
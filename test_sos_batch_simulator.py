@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from batch_simulator import BLUE, DRAW, EMPTY, NO_WINNER, O, S, BatchSimulator, play_reference_game
+
+class TestBatchSimulator(unittest.TestCase):
+
+    def assert_matches_game_manager(self, board_size, game_mode, seeds):
+        """Checks that every batched game ends exactly like the same seeded GameManager game."""
+        simulator = BatchSimulator(len(seeds), board_size, game_mode, seeds=seeds)
+        results = simulator.run()
+
+        for game, seed in enumerate(seeds):
+            board, reference = play_reference_game(board_size, game_mode, seed)
+            np.testing.assert_array_equal(simulator.boards[game], board)
+            self.assertEqual(results["winners"][game], reference["winner"])
+            self.assertEqual(results["blue_scores"][game], reference["blue_score"])
+            self.assertEqual(results["red_scores"][game], reference["red_score"])
+            self.assertEqual(results["move_counts"][game], reference["move_count"])
+
+    def test_simple_games_match_game_manager(self):
+        """Test that seeded Simple games give identical results in the batch and in GameManager."""
+        self.assert_matches_game_manager(3, "Simple", list(range(100)))
+        self.assert_matches_game_manager(6, "Simple", list(range(500, 550)))
+
+    def test_general_games_match_game_manager(self):
+        """Test that seeded General games give identical boards and scores in the batch and in GameManager."""
+        self.assert_matches_game_manager(3, "General", list(range(100)))
+        self.assert_matches_game_manager(7, "General", list(range(900, 950)))
+
+    def test_move_completing_several_lines(self):
+        """Test that a batched move completing four lines scores four and keeps the turn."""
+        # S's around (1, 1) of a 4x4 board, then an O in the middle
+        simulator = BatchSimulator(1, 4, "General")
+        for cell in [0, 1, 2, 4, 6, 8, 9, 10]:
+            simulator.step([cell], [S])
+        self.assertEqual(simulator.current_players[0], BLUE)  # Eight passes of the turn
+
+        simulator.step([5], [O])
+
+        self.assertEqual(simulator.scores[0, BLUE], 4)
+        self.assertEqual(simulator.current_players[0], BLUE)
+        self.assertEqual(simulator.winners[0], NO_WINNER)
+        self.assertTrue(simulator.active[0])
+
+    def test_occupied_cell_is_rejected(self):
+        """Test that a step placing on an occupied cell raises an error."""
+        simulator = BatchSimulator(2, 3, "Simple")
+        simulator.step([0, 0], [S, S])
+
+        with self.assertRaises(ValueError):
+            simulator.step([1, 0], [S, S])
+
+    def test_finished_games_are_not_changed(self):
+        """Test that games that have ended ignore later steps."""
+        simulator = BatchSimulator(1, 3, "Simple")
+        for cell, character in [(0, S), (1, O), (2, S)]:
+            simulator.step([cell], [character])
+        simulator.step([4], [S])
+
+        self.assertEqual(simulator.boards[0, 1, 1], EMPTY)
+        self.assertNotEqual(simulator.winners[0], DRAW)
+
+
+if __name__ == "__main__":
+    unittest.main()
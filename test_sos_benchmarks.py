@@ -0,0 +1,39 @@
+import random
+import unittest
+from benchmarks import MEMORY_LAYOUTS, bench_memory, compare_results, metric, random_move_sequence, run_benchmark_suite
+from compact_state import CompactGameState
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_suite_reports_every_metric(self):
+        """Test that a minimal suite run measures latency and throughput for both modes."""
+        results = run_benchmark_suite(sizes=(3,), throughput_sizes=(3,), render_sizes=(), repeat=1)
+        self.assertEqual(sorted(results), ["check_sos/3", "game_throughput/General/3", "game_throughput/Simple/3",
+                                           "make_move/General/3", "make_move/Simple/3"])
+        for result in results.values():
+            self.assertGreater(result["value"], 0)
+        self.assertEqual(results["game_throughput/Simple/3"]["better"], "higher")
+
+    def test_comparison_reports_slowdowns_in_both_directions(self):
+        """Test that a longer time and a lower throughput both count as slowdowns."""
+        baseline = {"make_move/Simple/3": metric(2.0, "us"), "game_throughput/Simple/3": metric(100.0, "games/s", "higher"),
+                    "check_sos/3": metric(1.0, "us")}
+        current = {"make_move/Simple/3": metric(3.0, "us"), "game_throughput/Simple/3": metric(200.0, "games/s", "higher"),
+                   "make_move/Simple/100": metric(9.0, "us")}
+        rows = compare_results(baseline, current)
+        self.assertEqual(rows, [("game_throughput/Simple/3", 100.0, 200.0, -0.5),
+                                ("make_move/Simple/3", 2.0, 3.0, 0.5)])
+
+    def test_memory_layouts_hold_the_same_position(self):
+        """Test that every memory layout plays the moves, the snapshot included, before it is measured."""
+        moves = random_move_sequence(8, random.Random(0))[:32]
+        game_manager = MEMORY_LAYOUTS["GameManager"](8, "General", moves)
+        board = ["".join(row) for row in game_manager.board]
+        self.assertEqual(sum(row.count(' ') for row in board), 32)
+        self.assertEqual(MEMORY_LAYOUTS["CompactGameState"](8, "General", moves).board_rows(), board)
+        self.assertEqual(CompactGameState.restore(MEMORY_LAYOUTS["snapshot"](8, "General", moves)).board_rows(), board)
+        for layout in MEMORY_LAYOUTS.values():
+            self.assertGreater(bench_memory(layout, 8, "General", 10), 0)
+
+if __name__ == '__main__':
+    unittest.main()
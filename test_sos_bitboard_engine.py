@@ -0,0 +1,83 @@
+import random
+import unittest
+from bitboard_engine import BitboardGameManager
+from game_manager import GameManager
+
+class TestBitboardEngine(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new 3x3 General game on the bitboard engine for each test."""
+        self.game_manager = BitboardGameManager(board_size=3, game_mode="General")
+        self.game_manager.reset_game(3, "General")
+
+    def test_simple_mode_win_with_first_sos(self):
+        """Test that Simple mode ends with a win as soon as the first SOS is created."""
+        self.game_manager.reset_game(3, "Simple")
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        result = self.game_manager.make_move(0, 2, 'S')
+
+        self.assertEqual(result["result"], "win")
+        self.assertEqual(result["winner"], "Blue")
+        self.assertFalse(self.game_manager.make_move(1, 1, 'S'))
+
+    def test_general_mode_sos_additional_turn(self):
+        """Test that creating an SOS in General mode grants an extra turn."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        result = self.game_manager.make_move(0, 2, 'S')
+
+        self.assertEqual(result["result"], "continue")
+        self.assertEqual(self.game_manager.sos_count["Blue"], 1)
+
+    def test_occupied_cell_is_rejected(self):
+        """Test that a move on an occupied cell is invalid."""
+        self.game_manager.make_move(1, 1, 'O')
+        self.assertFalse(self.game_manager.make_move(1, 1, 'S'))
+
+    def test_o_in_centre_completes_every_line(self):
+        """Test that an O completing several SOS lines at once counts each of them."""
+        for row, col in [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            self.game_manager.make_move(row, col, 'S')
+        self.game_manager.make_move(1, 1, 'O')
+
+        self.assertEqual(self.game_manager.sos_count["Blue"], 4)
+        self.assertEqual(self.game_manager.count_sos(), 4)
+
+    def test_unmake_move_restores_layers(self):
+        """Test that unmake_move clears the bit and the score of the reverted move."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        self.game_manager.make_move(0, 2, 'S')
+
+        self.game_manager.unmake_move()
+
+        self.assertEqual(self.game_manager.board[0], ['S', 'O', ' '])
+        self.assertEqual(self.game_manager.sos_count["Blue"], 0)
+        self.assertTrue(self.game_manager.make_move(0, 2, 'O'))
+
+    def test_board_matches_list_engine(self):
+        """Test that both engines accept and reject the same random moves and end on the same board."""
+        rng = random.Random(7)
+        bitboard = BitboardGameManager(6, "General")
+        reference = GameManager(6, "General")
+        bitboard.reset_game(6, "General")
+        reference.reset_game(6, "General")
+
+        cells = [(row, col) for row in range(6) for col in range(6)]
+        rng.shuffle(cells)
+        for row, col in cells:
+            invalid = rng.choice(("X", "s", "o", "", "SO"))
+            self.assertFalse(bitboard.make_move(row, col, invalid))
+            self.assertFalse(reference.make_move(row, col, invalid))
+            character = rng.choice("SO")
+            self.assertEqual(bool(bitboard.make_move(row, col, character)),
+                             bool(reference.make_move(row, col, character)))
+
+        self.assertEqual(bitboard.board, reference.board)
+        self.assertEqual(bitboard.sos_count, reference.sos_count)
+        self.assertTrue(bitboard.is_board_full())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from batch_simulator import BatchSimulator
+from board_analysis import count_sos_lines, verify_general_scores
+from game_manager import GameManager
+
+class TestBoardAnalysis(unittest.TestCase):
+
+    def test_counts_each_direction(self):
+        """Test the per-direction counts and line coordinates of a known board."""
+        board = [
+            ['S', 'O', 'S'],
+            [' ', 'O', ' '],
+            ['S', ' ', 'S']
+        ]
+
+        counts, lines = count_sos_lines(board, return_lines=True)
+
+        self.assertEqual(counts, {"horizontal": 1, "vertical": 0, "diagonal": 1, "anti_diagonal": 1, "total": 3})
+        self.assertEqual(lines["horizontal"].tolist(), [[[0, 0], [0, 1], [0, 2]]])
+        self.assertEqual(lines["anti_diagonal"].tolist(), [[[0, 2], [1, 1], [2, 0]]])
+        self.assertEqual(lines["vertical"].shape, (0, 3, 2))
+
+    def test_batch_totals_match_simulated_scores(self):
+        """Test that the lines on finished General boards equal the points scored while playing them."""
+        simulator = BatchSimulator(300, 6, "General", seeds=np.arange(300))
+        simulator.run()
+
+        counts, lines = count_sos_lines(simulator.boards, return_lines=True)
+
+        np.testing.assert_array_equal(counts["total"], simulator.scores.sum(axis=1))
+        self.assertEqual(len(lines["diagonal"]), 300)
+        self.assertEqual(len(lines["diagonal"][7]), counts["diagonal"][7])
+
+    def test_verify_general_scores(self):
+        """Test that a General game's SOS counts agree with its board, and that tampering is caught."""
+        game_manager = GameManager(4, "General")
+        game_manager.reset_game(4, "General")
+        for row, col, character in [(0, 0, 'S'), (1, 1, 'O'), (2, 2, 'S'), (0, 2, 'S'), (2, 0, 'S')]:
+            game_manager.make_move(row, col, character)
+
+        self.assertTrue(verify_general_scores(game_manager))
+        game_manager.sos_count["Red"] += 1
+        self.assertFalse(verify_general_scores(game_manager))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from game_manager import GameManager
+from sos_cli import build_parser, format_board, parse_human_move, play, replay, simulate
+
+class TestSOSCli(unittest.TestCase):
+
+    def run_command(self, argv, **kwargs):
+        """Runs a subcommand's handler with its printed lines collected; returns (result, lines)."""
+        args = build_parser().parse_args(argv)
+        lines = []
+        return args.handler(args, output=lines.append, **kwargs), lines
+
+    def test_board_and_move_parsing(self):
+        """Test the printed board and that only legal moves are accepted."""
+        game_manager = GameManager(3, "Simple")
+        game_manager.reset_game(3, "Simple")
+        game_manager.make_move(0, 1, 'S')
+        self.assertEqual(format_board(game_manager), "  0 1 2\n0 . S .\n1 . . .\n2 . . .")
+        self.assertEqual(parse_human_move("2, 1 o", game_manager), (2, 1, 'O'))
+        self.assertIsNone(parse_human_move("0 1 O", game_manager))  # Occupied
+        self.assertIsNone(parse_human_move("3 0 S", game_manager))
+        self.assertIsNone(parse_human_move("1 1 X", game_manager))
+
+    def test_play_between_two_humans(self):
+        """Test a typed Simple game with an undo of Red's move and an invalid entry, up to Blue's win."""
+        typed = iter(["0 0 S", "0 1 S", "undo", "oops", "0 2 S", "0 1 O"])
+        winner, lines = self.run_command(["play"], input_function=lambda prompt: next(typed))
+        self.assertEqual(winner, "Blue")
+        self.assertIn("Enter an empty cell and a character, e.g. 0 1 S", lines)
+        self.assertEqual(lines[-1], "Blue wins")
+
+    def test_undo_against_the_computer(self):
+        """Test that undo takes back the computer's reply with the human's move, and nothing before them."""
+        lines = []
+        boards = []  # The board printed before each prompt
+
+        def type_next(prompt):
+            boards.append(lines[-1])
+            if len(boards) == 2:
+                # Play the first empty cell of the printed board
+                for row, text in enumerate(boards[-1].splitlines()[1:]):
+                    cells = text.split()[1:]
+                    if "." in cells:
+                        return f"{row} {cells.index('.')} S"
+            return ["undo", None, "undo", "undo", "quit"][len(boards) - 1]
+
+        args = build_parser().parse_args(["play", "--blue", "greedy"])
+        self.assertIsNone(play(args, input_function=type_next, output=lines.append))
+        self.assertEqual(lines.count("No human move to undo"), 2)
+        # Blue's opening move is never taken back
+        self.assertNotEqual(boards[2], boards[0])  # After the human move and the reply
+        self.assertEqual(boards[3], boards[0])
+        self.assertEqual(boards[4], boards[0])
+        self.assertEqual(sum(text.split()[1:].count(".") for text in boards[0].splitlines()[1:]), 8)
+
+    def test_simulate_records_games_that_replay(self):
+        """Test that simulated games are written to a record file and replayed with the same outcomes."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.sosr")
+            totals, lines = self.run_command(["simulate", "--games", "12", "--size", "4", "--mode", "General",
+                                              "--blue", "greedy", "--record", path])
+            self.assertEqual(sum(totals.values()), 12)
+            shown, lines = self.run_command(["replay", path])
+            self.assertEqual(shown, 12)
+            self.assertEqual(sum("Blue wins" in line for line in lines), totals["Blue"])
+
+            shown, lines = self.run_command(["replay", path, "--game", "3", "--moves"])
+            self.assertEqual(shown, 1)
+            self.assertEqual(sum(line.startswith(("Blue plays", "Red plays")) for line in lines), 16)
+            with self.assertRaises(ValueError):
+                self.run_command(["replay", path, "--game", "13"])
+
+    def test_headless_import_does_not_load_tkinter(self):
+        """Test that importing the console entry point leaves tkinter and the GUI modules unloaded."""
+        code = "import sys, sos_cli; print(sorted({'tkinter', 'sos', 'game_board', 'players'} & set(sys.modules)))"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        self.assertEqual(output.strip(), "[]")
+
+if __name__ == '__main__':
+    unittest.main()
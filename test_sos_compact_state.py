@@ -0,0 +1,82 @@
+import random
+import unittest
+from compact_state import CompactGameState
+from game_manager import GameManager
+
+class TestCompactGameState(unittest.TestCase):
+
+    def play_both(self, board_size, game_mode, seed):
+        """Plays the same random game on a GameManager and a CompactGameState and checks every result matches."""
+        rng = random.Random(seed)
+        game_manager = GameManager(board_size, game_mode)
+        game_manager.reset_game(board_size, game_mode)
+        state = CompactGameState(board_size, game_mode)
+        cells = [(row, col) for row in range(board_size) for col in range(board_size)]
+        rng.shuffle(cells)
+
+        for row, col in cells:
+            character = rng.choice("SO")
+            result = game_manager.make_move(row, col, character)
+            self.assertEqual(state.make_move(row, col, character), result)
+            if result["result"] == "next_turn":
+                game_manager.switch_turn()
+                state.switch_turn()
+            if result["result"] in ("win", "draw", "end"):
+                break
+        return game_manager, state
+
+    def test_results_match_game_manager(self):
+        """Test that random games give the same results and final position as GameManager."""
+        for game_mode in ("Simple", "General"):
+            for seed in range(30):
+                game_manager, state = self.play_both(5, game_mode, seed)
+                self.assertEqual(state.board_rows(), ["".join(row) for row in game_manager.board])
+                self.assertEqual(state.sos_count, game_manager.sos_count)
+                self.assertEqual(state.get_current_player(), game_manager.get_current_player())
+
+    def test_snapshot_round_trip(self):
+        """Test that restore(snapshot()) gives back an identical state that plays on."""
+        _, state = self.play_both(6, "General", 3)
+        data = state.snapshot()
+        self.assertEqual(len(data), 8 + 36)
+
+        restored = CompactGameState.restore(data)
+        for name in CompactGameState.__slots__:
+            self.assertEqual(getattr(restored, name), getattr(state, name))
+        self.assertEqual(restored.snapshot(), data)
+        with self.assertRaises(ValueError):
+            CompactGameState.restore(data[:-1])
+
+    def test_game_manager_conversion(self):
+        """Test converting to a GameManager and back keeps the position."""
+        state = CompactGameState(4, "General")
+        state.make_move(0, 0, 'S')
+        state.make_move(0, 1, 'O')
+        state.make_move(0, 2, 'S')
+        self.assertEqual(state.get_cell(0, 1), 'O')
+
+        game_manager = state.to_game_manager()
+        self.assertEqual(game_manager.sos_count["Blue"], 1)
+        self.assertEqual(len(game_manager.legal_moves()), 13)
+        self.assertEqual(game_manager.make_move(1, 0, 'S'), {"result": "next_turn"})
+        self.assertEqual(CompactGameState.from_game_manager(game_manager).board_rows(),
+                         ["SOS ", "S   ", "    ", "    "])
+
+        # The converted game still scores: O at (1, 1) completes the S-O-S from (0, 0) to (2, 2)
+        game_manager.make_move(2, 2, 'S')
+        self.assertEqual(game_manager.make_move(1, 1, 'O'), {"result": "continue"})
+        self.assertEqual(game_manager.sos_count["Blue"], 2)
+
+        simple = CompactGameState(3, "Simple")
+        simple.make_move(0, 0, 'S')
+        simple.switch_turn()
+        simple.make_move(0, 1, 'O')
+        simple.switch_turn()
+        self.assertEqual(simple.to_game_manager().make_move(0, 2, 'S'), {"result": "win", "winner": "Blue"})
+
+    def test_no_instance_dict(self):
+        """Test that the state uses slots only."""
+        self.assertFalse(hasattr(CompactGameState(), "__dict__"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import time
+import unittest
+from engine_worker import EngineWorker
+
+class FakeRoot:
+    """Stands in for tk.Tk, running root.after callbacks when pumped instead of from a main loop."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.reported = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def report_callback_exception(self, error_type, error, traceback):
+        self.reported.append(error)
+
+    def pump(self, timeout=5.0):
+        """Runs scheduled callbacks until none are left."""
+        deadline = time.perf_counter() + timeout
+        while self.callbacks and time.perf_counter() < deadline:
+            callback = self.callbacks.pop(0)
+            time.sleep(0.001)
+            callback()
+
+class TestEngineWorker(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a worker on a fake Tk root for each test."""
+        self.root = FakeRoot()
+        self.worker = EngineWorker(self.root)
+        self.done = []
+
+    def tearDown(self):
+        self.worker.shutdown()
+
+    def test_result_is_delivered_through_the_main_loop(self):
+        """Test that a task's result reaches on_done only when the main loop polls."""
+        ticks = []
+        release = threading.Event()
+        self.worker.submit(lambda cancel_event: release.wait(5) and 42, self.done.append, on_tick=ticks.append)
+
+        self.assertTrue(self.worker.is_busy())
+        self.root.pump(timeout=0.1)  # Polls while the task is still blocked
+        release.set()
+        self.root.pump()
+
+        self.assertEqual(self.done, [42])
+        self.assertTrue(ticks)
+        self.assertFalse(self.worker.is_busy())
+
+    def test_cancelled_result_is_discarded(self):
+        """Test that cancelling stops the task and drops its result."""
+        self.worker.submit(lambda cancel_event: cancel_event.wait(5), self.done.append)
+        self.worker.cancel()
+        self.root.pump()
+
+        self.assertEqual(self.done, [])
+        self.assertFalse(self.worker.is_busy())
+
+    def test_new_task_replaces_awaited_task(self):
+        """Test that submitting again discards the earlier task's result, as when a game restarts."""
+        self.worker.submit(lambda cancel_event: "old" if cancel_event.wait(5) else "timeout", self.done.append)
+        self.worker.submit(lambda cancel_event: "new", self.done.append)
+        self.root.pump()
+
+        self.assertEqual(self.done, ["new"])
+
+    def test_finish_early_still_delivers(self):
+        """Test that finish_early stops the task but keeps its result."""
+        self.worker.submit(lambda cancel_event: "stopped" if cancel_event.wait(5) else "timeout", self.done.append)
+        self.worker.finish_early()
+        self.root.pump()
+
+        self.assertEqual(self.done, ["stopped"])
+
+    def test_errors_go_to_on_error(self):
+        """Test that an exception in the task is passed to on_error, or reported to Tk without one."""
+        errors = []
+        self.worker.submit(lambda cancel_event: 1 / 0, self.done.append, on_error=errors.append)
+        self.root.pump()
+        self.worker.submit(lambda cancel_event: 1 / 0, self.done.append)
+        self.root.pump()
+
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        self.assertIsInstance(self.root.reported[0], ZeroDivisionError)
+        self.assertEqual(self.done, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import random
+import tempfile
+import unittest
+from game_archive import INDEX_MAGIC, ArchiveWriter, GameArchive, build_archive
+from game_manager import MAX_BOARD_SIZE, GameManager
+from game_records import GameRecordWriter, read_games
+
+def play_random_game(board_size, game_mode, rng):
+    """Plays a random game and returns the game manager and winner."""
+    game_manager = GameManager(board_size, game_mode)
+    game_manager.reset_game(board_size, game_mode)
+    cells = list(game_manager.legal_moves())
+    rng.shuffle(cells)
+    for row, col in cells:
+        result = game_manager.make_move(row, col, rng.choice("SO"))
+        if result["result"] in ("win", "end"):
+            return game_manager, result["winner"]
+        if result["result"] == "draw":
+            return game_manager, "Draw"
+        if result["result"] == "next_turn":
+            game_manager.switch_turn()
+
+class TestGameArchive(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an archive of random games of several sizes and both modes."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "archive")
+        rng = random.Random(2)
+        self.games = [play_random_game(rng.choice((3, 5, 7)), rng.choice(("Simple", "General")), rng)
+                      for _ in range(120)]
+        with ArchiveWriter(self.path) as writer:
+            for game_manager, winner in self.games:
+                writer.write_game(game_manager, winner)
+        self.archive = GameArchive(self.path)
+        self.addCleanup(self.archive.close)
+
+    def test_random_access_replays_each_game(self):
+        """Test that any game can be fetched by number and replays to its original position."""
+        self.assertEqual(len(self.archive), len(self.games))
+        for game_number in (0, 57, 119, 3):
+            game_manager, winner = self.games[game_number]
+            record = self.archive.game(game_number)
+            self.assertEqual((record.board_size, record.game_mode, record.winner),
+                             (game_manager.board_size, game_manager.game_mode, winner))
+            self.assertEqual([(move.row, move.col, move.character, move.player) for move in record.moves],
+                             [(move.row, move.col, move.character, move.player) for move in game_manager.move_log])
+            replayed, _ = self.archive.replay(game_number)
+            self.assertEqual(replayed.board, game_manager.board)
+            self.assertEqual(replayed.sos_count, game_manager.sos_count)
+
+    def test_select_matches_a_full_scan(self):
+        """Test that index filters find exactly the games a scan of every game would."""
+        selected = self.archive.select(board_size=5, game_mode="General", winner="any", min_score=2)
+        expected = [number for number, (game_manager, _) in enumerate(self.games)
+                    if game_manager.board_size == 5 and game_manager.game_mode == "General"
+                    and sum(game_manager.sos_count.values()) >= 2]
+        self.assertEqual(selected.tolist(), expected)
+        self.assertGreater(len(expected), 0)
+
+        blue_wins = self.archive.select(game_mode="Simple", winner="Blue")
+        self.assertEqual(blue_wins.tolist(), [number for number, (game_manager, winner) in enumerate(self.games)
+                                              if game_manager.game_mode == "Simple" and winner == "Blue"])
+
+    def test_filters_left_out_match_every_game(self):
+        """Test that finished games are selected when no winner filter is given, and unfinished ones on request."""
+        self.assertEqual(self.archive.select().tolist(), list(range(len(self.games))))
+        general = self.archive.select(board_size=5, game_mode="General")
+        self.assertEqual(general.tolist(), [number for number, (game_manager, _) in enumerate(self.games)
+                                            if game_manager.board_size == 5 and game_manager.game_mode == "General"])
+        self.assertEqual(len(self.archive.select(winner="unfinished")), 0)
+
+        unfinished_path = self.path + "-unfinished"
+        with ArchiveWriter(unfinished_path) as writer:
+            writer.add_game(3, "Simple", [])
+            writer.write_game(*self.games[0])
+        with GameArchive(unfinished_path) as archive:
+            self.assertEqual(archive.select(winner="unfinished").tolist(), [0])
+            self.assertEqual(archive.select().tolist(), [0, 1])
+
+    def test_appending_checks_the_existing_index(self):
+        """Test that the writer refuses to append to a foreign, newer or truncated index and to oversized boards."""
+        with ArchiveWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.add_game(MAX_BOARD_SIZE + 1, "General", [])
+        with GameArchive(self.path) as archive:
+            self.assertEqual(len(archive), len(self.games))
+
+        for name, contents, message in (("foreign", b"not an archive at all", "not an SOS game archive"),
+                                        ("newer", b"SOSI\x02\x00\x00\x00", "version 2"),
+                                        ("truncated", INDEX_MAGIC + b"\x00" * 5, "partial entry")):
+            path = os.path.join(os.path.dirname(self.path), name)
+            with open(path + ".index", "wb") as file:
+                file.write(contents)
+            with self.assertRaisesRegex(ValueError, message):
+                ArchiveWriter(path)
+            with open(path + ".index", "rb") as file:
+                self.assertEqual(file.read(), contents)
+
+    def test_build_from_record_file(self):
+        """Test that converting a game_records file gives the same games."""
+        record_path = self.path + ".sosr"
+        with GameRecordWriter(record_path) as writer:
+            for game_manager, winner in self.games[:20]:
+                writer.write_game(game_manager, winner)
+        converted_path = self.path + "-converted"
+        self.assertEqual(build_archive(record_path, converted_path), 20)
+        with GameArchive(converted_path) as converted:
+            for game_number, record in enumerate(read_games(record_path)):
+                self.assertEqual(converted.game(game_number), record)
+
+    def test_empty_archive(self):
+        """Test that an archive with no games opens and selects nothing."""
+        empty_path = self.path + "-empty"
+        ArchiveWriter(empty_path).close()
+        with GameArchive(empty_path) as empty:
+            self.assertEqual(len(empty), 0)
+            self.assertEqual(len(empty.select(board_size=3)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
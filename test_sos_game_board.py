@@ -0,0 +1,126 @@
+import unittest
+from game_board import CanvasGameBoard
+
+class FakeCanvas:
+    """Stands in for tk.Canvas so the board can be tested without a display; records every item."""
+
+    def __init__(self, scroll_x=0, scroll_y=0):
+        self.items = {}  # Item id -> (kind, coordinates, options)
+        self.next_id = 1
+        self.scroll_x = scroll_x
+        self.scroll_y = scroll_y
+        self.options = {}
+        self.bindings = {}
+
+    def create_item(self, kind, coordinates, options):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = (kind, coordinates, options)
+        return item
+
+    def create_line(self, *coordinates, **options):
+        return self.create_item("line", coordinates, options)
+
+    def create_text(self, *coordinates, **options):
+        return self.create_item("text", coordinates, options)
+
+    def create_rectangle(self, *coordinates, **options):
+        return self.create_item("rectangle", coordinates, options)
+
+    def delete(self, target):
+        if target == "all":
+            self.items.clear()
+        elif isinstance(target, str):
+            for item in [item for item, (_, _, options) in self.items.items() if options.get("tags") == target]:
+                del self.items[item]
+        else:
+            del self.items[target]
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def bind(self, sequence, handler):
+        self.bindings[sequence] = handler
+
+    def canvasx(self, x):
+        return x + self.scroll_x
+
+    def canvasy(self, y):
+        return y + self.scroll_y
+
+    def tag_lower(self, tag):
+        pass
+
+    def kinds(self, kind):
+        return [item for item in self.items.values() if item[0] == kind]
+
+class Click:
+    """A mouse event at window coordinates."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+class TestCanvasGameBoard(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a 5x5 board on a fake canvas that records the clicked cells."""
+        self.canvas = FakeCanvas()
+        self.clicks = []
+        self.board = CanvasGameBoard(self.canvas, 5, lambda row, col: self.clicks.append((row, col)))
+
+    def test_grid_is_a_few_lines_whatever_the_size(self):
+        """Test that the grid is board_size + 1 lines each way and sets the scroll region."""
+        self.assertEqual(len(self.canvas.kinds("line")), 12)
+        self.assertEqual(self.board.cell_size, 50)
+        self.assertEqual(self.canvas.options["scrollregion"], (0, 0, 250, 250))
+
+        large = CanvasGameBoard(FakeCanvas(), 100, lambda row, col: None)
+        self.assertEqual(large.cell_size, CanvasGameBoard.MIN_CELL_SIZE)
+        self.assertEqual(len(large.canvas.kinds("line")), 202)
+
+    def test_clicks_map_to_cells(self):
+        """Test hit-testing inside cells, on the far edge, outside the board and on a scrolled board."""
+        click = self.canvas.bindings["<Button-1>"]
+        click(Click(10, 10))
+        click(Click(249, 120))
+        click(Click(250, 10))  # Just past the last column
+        self.assertEqual(self.clicks, [(0, 0), (2, 4)])
+
+        self.canvas.scroll_y = 100
+        click(Click(60, 10))
+        self.assertEqual(self.clicks[-1], (2, 1))
+
+        self.board.disable_buttons()
+        click(Click(10, 10))
+        self.assertEqual(len(self.clicks), 3)
+
+    def test_redraw_replaces_only_the_changed_cell(self):
+        """Test that updating a cell swaps its text item and clearing it removes the lines its move drew."""
+        self.board.update_button(1, 1, 'S')
+        self.board.update_button(2, 2, 'S')
+        self.board.update_button(1, 1, 'O')
+        texts = sorted(options["text"] for _, _, options in self.canvas.kinds("text"))
+        self.assertEqual(texts, ['O', 'S'])
+
+        self.board.draw_sos_lines(1, 1, [((0, 0), (1, 1), (2, 2))], "Red")
+        (_, coordinates, options), = [item for item in self.canvas.kinds("line") if item[2].get("width") == 3]
+        self.assertEqual(coordinates, (25.0, 25.0, 125.0, 125.0))
+        self.assertEqual(options["fill"], "red")
+
+        self.board.update_button(1, 1, ' ')
+        self.assertEqual(len(self.canvas.kinds("text")), 1)
+        self.assertEqual(len(self.canvas.kinds("line")), 12)
+
+    def test_hints_are_replaced_and_cleared(self):
+        """Test that hint shading is redrawn from scratch and removed by clear_highlights."""
+        self.board.highlight_cells({(0, 0): 1}, {(0, 0): 1, (3, 4): 2})
+        fills = sorted(options["fill"] for _, _, options in self.canvas.kinds("rectangle"))
+        self.assertEqual(fills, sorted([CanvasGameBoard.HINT_COLORS['SO'], CanvasGameBoard.HINT_COLORS['O']]))
+        self.board.highlight_cells({}, {(1, 1): 1})
+        self.assertEqual(len(self.canvas.kinds("rectangle")), 1)
+        self.board.clear_highlights()
+        self.assertEqual(self.canvas.kinds("rectangle"), [])
+
+if __name__ == '__main__':
+    unittest.main()
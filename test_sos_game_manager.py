@@ -0,0 +1,167 @@
+import random
+import unittest
+from game_manager import GameManager
+
+class TestGameManagerState(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a new 3x3 General game for each test."""
+        self.game_manager = GameManager(board_size=3, game_mode="General")
+        self.game_manager.reset_game(3, "General")
+
+    def test_legal_moves_track_placements(self):
+        """Test that the free-cell set and empty count shrink as moves are made."""
+        self.assertEqual(self.game_manager.empty_count, 9)
+        self.assertEqual(len(self.game_manager.legal_moves()), 9)
+
+        self.game_manager.make_move(1, 1, 'S')
+        self.game_manager.make_move(1, 1, 'O')  # Rejected, cell is taken
+
+        self.assertEqual(self.game_manager.empty_count, 8)
+        self.assertNotIn((1, 1), self.game_manager.legal_moves())
+        self.assertFalse(self.game_manager.is_board_full())
+
+    def test_invalid_character_is_rejected(self):
+        """Test that a character other than S or O is refused like any other invalid move."""
+        self.assertFalse(self.game_manager.make_move(0, 0, 'X'))
+        self.assertFalse(self.game_manager.make_move(0, 0, 's'))
+        self.assertEqual(self.game_manager.board[0][0], ' ')
+        self.assertEqual(self.game_manager.empty_count, 9)
+
+    def test_scoring_move_that_fills_board_ends_game(self):
+        """Test that an SOS on the last empty cell ends a General game instead of granting another turn."""
+        moves = [
+            (0, 0, 'S'), (0, 1, 'S'), (0, 2, 'S'),
+            (1, 0, 'S'), (1, 1, 'S'), (1, 2, 'S'),
+            (2, 0, 'S'), (2, 2, 'S')
+        ]
+        for row, col, char in moves:
+            self.game_manager.make_move(row, col, char)
+        result = self.game_manager.make_move(2, 1, 'O')
+
+        self.assertEqual(result["result"], "end")
+        self.assertEqual(result["blue_score"], 1)
+        self.assertTrue(self.game_manager.is_board_full())
+
+    def test_unmake_move_restores_state(self):
+        """Test that unmake_move reverts the board, score, player and active flag of a scoring move."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        self.game_manager.switch_turn()
+        self.game_manager.make_move(0, 2, 'S')  # Red scores
+
+        record = self.game_manager.unmake_move()
+
+        self.assertEqual((record.row, record.col, record.character), (0, 2, 'S'))
+        self.assertEqual(record.sos_delta, 1)
+        self.assertEqual(self.game_manager.board[0][2], ' ')
+        self.assertEqual(self.game_manager.sos_count, {"Blue": 0, "Red": 0})
+        self.assertEqual(self.game_manager.get_current_player(), "Red")
+        self.assertIn((0, 2), self.game_manager.legal_moves())
+        self.assertEqual(self.game_manager.empty_count, 7)
+
+    def test_unmake_move_reopens_simple_game(self):
+        """Test that undoing a Simple-mode winning move makes the game active again."""
+        self.game_manager.reset_game(3, "Simple")
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        self.game_manager.make_move(0, 2, 'S')
+
+        self.game_manager.unmake_move()
+
+        self.assertTrue(self.game_manager.is_game_active)
+        self.assertEqual(len(self.game_manager.move_log), 2)
+
+    def test_undo_and_redo(self):
+        """Test that redo_move replays an undone move and that undo with no moves does nothing."""
+        self.assertIsNone(self.game_manager.undo_move())
+        self.game_manager.make_move(2, 2, 'O')
+        self.game_manager.undo_move()
+
+        result = self.game_manager.redo_move()
+
+        self.assertEqual(result["result"], "next_turn")
+        self.assertEqual(self.game_manager.board[2][2], 'O')
+        self.assertIsNone(self.game_manager.redo_move())
+
+    def test_new_move_discards_undone_moves(self):
+        """Test that redo replays several undone moves in turn, and that a new move in between leaves nothing to redo."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'S')
+        self.game_manager.undo_move()
+        self.game_manager.undo_move()
+        self.game_manager.redo_move()
+        self.assertEqual(len(self.game_manager.redo_log), 1)
+
+        self.assertFalse(self.game_manager.make_move(0, 0, 'O'))  # An invalid move keeps them
+        self.assertEqual(len(self.game_manager.redo_log), 1)
+        self.game_manager.make_move(2, 2, 'O')
+
+        self.assertIsNone(self.game_manager.redo_move())
+        self.assertEqual(self.game_manager.board[0][1], ' ')
+
+    def test_sos_lines_at_lists_completed_lines(self):
+        """Test that sos_lines_at returns every SOS line through a cell and nothing for other cells."""
+        for row, col, char in [(0, 0, 'S'), (0, 2, 'S'), (2, 0, 'S'), (2, 2, 'S'), (1, 1, 'O')]:
+            self.game_manager.make_move(row, col, char)
+
+        lines = self.game_manager.sos_lines_at(1, 1)
+
+        self.assertEqual(sorted(lines), [((0, 0), (1, 1), (2, 2)), ((0, 2), (1, 1), (2, 0))])
+        self.assertEqual(self.game_manager.sos_lines_at(0, 1), [])
+
+    def test_copy_is_independent(self):
+        """Test that moves on a copy leave the original game untouched."""
+        self.game_manager.make_move(0, 0, 'S')
+        clone = self.game_manager.copy()
+
+        clone.make_move(0, 1, 'O')
+        clone.make_move(0, 2, 'S')
+
+        self.assertEqual(clone.sos_count["Blue"], 1)
+        self.assertEqual(self.game_manager.sos_count["Blue"], 0)
+        self.assertEqual(self.game_manager.board[0], ['S', ' ', ' '])
+        self.assertEqual(self.game_manager.empty_count, 8)
+        self.assertEqual(len(self.game_manager.move_log), 1)
+
+    def brute_force_threats(self, game_manager, character):
+        """Finds the scoring cells of a character by trying it on every empty cell."""
+        threats = {}
+        for row, col in game_manager.legal_moves():
+            game_manager.board[row][col] = character
+            count = game_manager.check_sos(row, col)
+            game_manager.board[row][col] = ' '
+            if count:
+                threats[(row, col)] = count
+        return threats
+
+    def test_threat_maps_match_brute_force(self):
+        """Test that the incremental scoring-cell maps stay exact through random moves and unmakes."""
+        rng = random.Random(9)
+        game_manager = GameManager(6, "General")
+        game_manager.reset_game(6, "General")
+        for _ in range(300):
+            if game_manager.empty_count and (not game_manager.move_log or rng.random() < 0.7):
+                row, col = rng.choice(sorted(game_manager.legal_moves()))
+                game_manager.make_move(row, col, rng.choice("SO"))
+            else:
+                game_manager.unmake_move()
+            for character in ('S', 'O'):
+                self.assertEqual(game_manager.scoring_cells(character),
+                                 self.brute_force_threats(game_manager, character))
+
+    def test_threat_maps_in_simple_position(self):
+        """Test the scoring cells of S _ S and S O _ patterns."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 2, 'S')
+        self.assertEqual(self.game_manager.scoring_cells('O'), {(0, 1): 1})
+        self.game_manager.make_move(1, 1, 'O')
+        self.assertEqual(self.game_manager.scoring_cells('S'), {(2, 2): 1, (2, 0): 1})
+
+        clone = self.game_manager.copy()
+        clone.make_move(2, 2, 'S')
+        self.assertIn((2, 2), self.game_manager.scoring_cells('S'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from game_manager import GameManager, GameObserver
+from game_metrics import GameMetrics, LatencyHistogram
+
+class RecordingObserver(GameObserver):
+    """Observer that keeps the name of every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_move_applied(self, game_manager, record, result, timings):
+        self.events.append(("move", record.character, result["result"]))
+
+    def on_sos_scored(self, game_manager, player, count):
+        self.events.append(("sos", player, count))
+
+    def on_turn_switched(self, game_manager, player):
+        self.events.append(("turn", player))
+
+    def on_game_ended(self, game_manager, result):
+        self.events.append(("end", result["result"]))
+
+class TestGameMetrics(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a 3x3 Simple game for each test."""
+        self.game_manager = GameManager(3, "Simple")
+        self.game_manager.reset_game(3, "Simple")
+
+    def play_simple_win(self):
+        """Blue plays S, Red plays S and Blue completes the row with O."""
+        for row, col, character in ((0, 0, 'S'), (0, 2, 'S'), (0, 1, 'O')):
+            if self.game_manager.make_move(row, col, character)["result"] == "next_turn":
+                self.game_manager.switch_turn()
+
+    def test_observer_receives_events_in_order(self):
+        """Test that moves, turn changes, scores and the game end are all reported."""
+        observer = RecordingObserver()
+        self.game_manager.add_observer(observer)
+        self.play_simple_win()
+        self.assertEqual(observer.events, [
+            ("move", 'S', "next_turn"), ("turn", "Red"),
+            ("move", 'S', "next_turn"), ("turn", "Blue"),
+            ("move", 'O', "win"), ("sos", "Blue", 1), ("end", "win")])
+
+        self.game_manager.remove_observer(observer)
+        self.game_manager.reset_game(3, "Simple")
+        self.play_simple_win()
+        self.assertEqual(len(observer.events), 7)
+
+    def test_stopped_games_are_reported_once(self):
+        """Test that end_game reports a game it stops, but not one a move already finished."""
+        metrics = GameMetrics()
+        self.game_manager.add_observer(metrics)
+        self.game_manager.make_move(0, 0, 'S')
+        self.assertIsNone(self.game_manager.end_game()["winner"])
+        self.game_manager.end_game()
+
+        self.game_manager.reset_game(3, "Simple")
+        self.play_simple_win()
+        self.game_manager.end_game()
+        self.assertEqual(metrics.snapshot()["games_ended"], {"stopped": 1, "win": 1})
+        self.assertEqual(metrics.snapshot()["winners"], {"Blue": 1})
+
+    def test_copies_are_not_observed(self):
+        """Test that searching on a copy does not notify the original game's observers."""
+        observer = RecordingObserver()
+        self.game_manager.add_observer(observer)
+        clone = self.game_manager.copy()
+        clone.make_move(1, 1, 'S')
+        self.assertEqual(observer.events, [])
+
+    def test_metrics_count_and_time_every_move(self):
+        """Test the counters and that each timed phase got one observation per move."""
+        metrics = GameMetrics()
+        self.game_manager.add_observer(metrics)
+        self.play_simple_win()
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["moves"], 3)
+        self.assertEqual(snapshot["sos_scored"], {"Blue": 1, "Red": 0})
+        self.assertEqual(snapshot["turns_switched"], 2)
+        self.assertEqual(snapshot["games_ended"], {"win": 1})
+        self.assertEqual(snapshot["winners"], {"Blue": 1})
+        for timing in snapshot["timings"].values():
+            self.assertEqual(timing["count"], 3)
+            self.assertEqual(timing["buckets"][-1][1], 3)
+        timings = snapshot["timings"]
+        self.assertLessEqual(timings["sos_detection"]["sum"], timings["make_move"]["sum"])
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that each duration is counted in its bucket and every larger one."""
+        histogram = LatencyHistogram(bounds=(1.0, 2.0))
+        for seconds in (0.5, 1.0, 1.5, 3.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.cumulative_counts(), [(1.0, 2), (2.0, 3), (float("inf"), 4)])
+        self.assertEqual(histogram.mean(), 1.5)
+
+    def test_prometheus_export(self):
+        """Test the text format and that write_prometheus leaves only the final file."""
+        metrics = GameMetrics()
+        self.game_manager.add_observer(metrics)
+        self.play_simple_win()
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE sos_moves_total counter\nsos_moves_total 3\n", text)
+        self.assertIn('sos_sos_scored_total{player="Blue"} 1\n', text)
+        self.assertIn('sos_make_move_seconds_bucket{le="+Inf"} 3\n', text)
+        self.assertIn("sos_end_check_seconds_count 3\n", text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sos.prom")
+            metrics.write_prometheus(path)
+            with open(path) as file:
+                self.assertEqual(file.read(), text)
+            self.assertEqual(os.listdir(directory), ["sos.prom"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import random
+import tempfile
+import unittest
+from game_manager import GameManager
+from game_records import GAME_HEADER, FILE_MAGIC, MAX_BOARD_SIZE, GameRecordWriter, decode_move, encode_move, read_games, replay
+
+class TestGameRecords(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary record file for each test."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "games.sosr")
+
+    def play_random_game(self, board_size, game_mode, rng):
+        """Plays a random game and returns the game manager and winner."""
+        game_manager = GameManager(board_size, game_mode)
+        game_manager.reset_game(board_size, game_mode)
+        cells = list(game_manager.legal_moves())
+        rng.shuffle(cells)
+        for row, col in cells:
+            result = game_manager.make_move(row, col, rng.choice("SO"))
+            if result["result"] == "win":
+                return game_manager, result["winner"]
+            if result["result"] == "draw":
+                return game_manager, "Draw"
+            if result["result"] == "end":
+                return game_manager, result["winner"]
+            if result["result"] == "next_turn":
+                game_manager.switch_turn()
+
+    def test_move_encoding_round_trip(self):
+        """Test that every field of a move survives packing into 16 bits, up to the largest recordable board."""
+        for board_size, row, col, character, player in [(3, 0, 0, 'S', "Blue"), (3, 2, 1, 'O', "Red"),
+                                                        (MAX_BOARD_SIZE, MAX_BOARD_SIZE - 1, MAX_BOARD_SIZE - 1,
+                                                         'O', "Red")]:
+            word = encode_move(board_size, row, col, character, player)
+            self.assertLess(word, 1 << 16)
+            self.assertEqual(tuple(decode_move(board_size, word)), (row, col, character, player))
+        with GameRecordWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.begin_game(MAX_BOARD_SIZE + 1, "General")
+
+    def test_games_stream_back_and_replay_to_the_same_position(self):
+        """Test that written games are read back in order and replay to the same board and scores."""
+        rng = random.Random(1)
+        games = [self.play_random_game(size, mode, rng) for size in (3, 6) for mode in ("Simple", "General")
+                 for _ in range(5)]
+        with GameRecordWriter(self.path) as writer:
+            for game_manager, winner in games[:10]:
+                writer.write_game(game_manager, winner)
+        with GameRecordWriter(self.path) as writer:  # Appending to an existing file
+            for game_manager, winner in games[10:]:
+                writer.write_game(game_manager, winner)
+
+        records = list(read_games(self.path))
+        self.assertEqual(len(records), len(games))
+        total_moves = 0
+        for record, (game_manager, winner) in zip(records, games):
+            self.assertEqual((record.board_size, record.game_mode, record.winner),
+                             (game_manager.board_size, game_manager.game_mode, winner))
+            replayed, _ = replay(record)
+            self.assertEqual(replayed.board, game_manager.board)
+            self.assertEqual(replayed.sos_count, game_manager.sos_count)
+            self.assertEqual((record.blue_score, record.red_score),
+                             (game_manager.sos_count["Blue"], game_manager.sos_count["Red"]))
+            total_moves += len(record.moves)
+
+        expected_size = len(FILE_MAGIC) + len(games) * GAME_HEADER.size + 2 * total_moves
+        self.assertEqual(os.path.getsize(self.path), expected_size)
+
+    def test_appending_checks_the_existing_header(self):
+        """Test that the writer refuses to append to a foreign file or another format version."""
+        for contents, message in [(b"not a record", "not an SOS game record"),
+                                  (FILE_MAGIC[:-1] + b"\x02", "version 2")]:
+            with open(self.path, "wb") as file:
+                file.write(contents)
+            with self.assertRaisesRegex(ValueError, message):
+                GameRecordWriter(self.path)
+            with open(self.path, "rb") as file:
+                self.assertEqual(file.read(), contents)
+
+    def test_truncated_file_is_reported(self):
+        """Test that a file cut off inside a game raises ValueError."""
+        with GameRecordWriter(self.path) as writer:
+            writer.begin_game(3, "Simple")
+            writer.record_move(0, 0, 'S', "Blue")
+            writer.record_move(1, 1, 'O', "Red")
+            writer.end_game()
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            list(read_games(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
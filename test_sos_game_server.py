@@ -0,0 +1,99 @@
+import asyncio
+import json
+import unittest
+from game_manager import MAX_BOARD_SIZE, MIN_BOARD_SIZE
+from game_server import GameServer
+from load_generator import run_load
+
+class TestGameServer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a server with one 3x3 Simple session for each test."""
+        self.server = GameServer(max_sessions=2, idle_timeout=60.0)
+        self.session = self.server.handle_message({"op": "create", "board_size": 3, "game_mode": "Simple"})["session"]
+
+    def move(self, row, col, character):
+        return self.server.handle_message({"op": "move", "session": self.session, "row": row, "col": col,
+                                           "character": character})
+
+    def test_moves_pass_the_turn_and_win_ends_the_session_game(self):
+        """Test that a move passes the turn and an SOS records the winner."""
+        reply = self.move(0, 0, 'S')
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["current_player"], "Red")
+        self.move(0, 1, 'O')
+        self.assertEqual(self.move(0, 2, 'S')["result"]["result"], "win")
+
+        state = self.server.handle_message({"op": "state", "session": self.session})["state"]
+        self.assertEqual(state["board"][0], "SOS")
+        self.assertEqual(state["winner"], "Blue")
+        self.assertFalse(state["active"])
+        self.assertFalse(self.move(1, 1, 'S')["ok"])
+
+    def test_invalid_requests_get_error_replies(self):
+        """Test that bad input is answered with an error instead of raising."""
+        self.move(0, 0, 'S')
+        self.assertEqual(self.move(0, 0, 'O')["error"], "invalid move")
+        self.assertFalse(self.move(5, 0, 'S')["ok"])
+        self.assertFalse(self.move(1, 1, 'X')["ok"])
+        self.assertFalse(self.server.handle_message({"op": "move", "session": self.session})["ok"])
+        self.assertFalse(self.server.handle_message({"op": "state", "session": "missing"})["ok"])
+        self.assertFalse(self.server.handle_message({"op": "fly"})["ok"])
+        self.assertEqual(self.server.handle_line(b"{not json\n")["error"], "invalid JSON")
+        self.assertEqual(self.server.handle_line(b'{"op":[1]}\n')["error"], "unknown op [1]")
+
+    def test_board_size_limits(self):
+        """Test that the server offers the same board sizes as the GUI and the record format."""
+        self.server.max_sessions = 3
+        for board_size in (MIN_BOARD_SIZE, MAX_BOARD_SIZE):
+            self.assertTrue(self.server.handle_message({"op": "create", "board_size": board_size})["ok"])
+        for board_size in (MIN_BOARD_SIZE - 1, MAX_BOARD_SIZE + 1):
+            self.assertFalse(self.server.handle_message({"op": "create", "board_size": board_size})["ok"])
+
+    def test_resign_and_rid_echo(self):
+        """Test that resigning gives the game to the opponent and replies echo the request id."""
+        reply = self.server.handle_message({"op": "resign", "session": self.session, "rid": 7})
+        self.assertEqual(reply, {"ok": True, "winner": "Red", "rid": 7})
+        self.assertFalse(self.server.handle_message({"op": "resign", "session": self.session})["ok"])
+
+    def test_session_limit_and_idle_eviction(self):
+        """Test that creation is refused when full and idle sessions are evicted."""
+        self.server.handle_message({"op": "create"})
+        self.assertEqual(self.server.handle_message({"op": "create"})["error"], "server full")
+
+        self.server.sessions[self.session].last_used -= 120.0
+        self.assertEqual(self.server.evict_idle(), 1)
+        self.assertNotIn(self.session, self.server.sessions)
+        self.assertTrue(self.server.handle_message({"op": "create"})["ok"])
+
+class TestGameServerOverTCP(unittest.TestCase):
+
+    def test_load_generator_plays_games_against_the_server(self):
+        """Test that games played over TCP all finish and latencies are reported."""
+        async def scenario():
+            game_server = GameServer()
+            server = await game_server.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"op":"create","rid":"a"}\n{"op":"stats"}\n')
+            await writer.drain()
+            first, second = json.loads(await reader.readline()), json.loads(await reader.readline())
+            writer.close()
+
+            report = await run_load("127.0.0.1", port, connections=4, games=10, board_size=4, game_mode="General")
+            game_server.eviction_task.cancel()
+            server.close()
+            await server.wait_closed()
+            return first, second, report, game_server
+
+        first, second, report, game_server = asyncio.run(scenario())
+        self.assertEqual(first["rid"], "a")
+        self.assertEqual(second["sessions"], 1)
+        self.assertEqual(report["games"], 10)
+        self.assertEqual(report["moves"], 10 * 16)  # General games always fill the board
+        self.assertEqual(game_server.moves_played, report["moves"])
+        self.assertLessEqual(report["latency_p50_ms"], report["latency_p99_ms"])
+
+if __name__ == '__main__':
+    unittest.main()
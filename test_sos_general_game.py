@@ -17,6 +17,17 @@ class TestGeneralGameMode(unittest.TestCase):
         self.assertEqual(result["result"], "continue")  # Indicates player gets an extra turn
         self.assertEqual(self.game_manager.sos_count["Blue"], 1)
 
+    def test_general_mode_counts_every_sos_in_one_move(self):
+        """Test that a move completing several SOS lines at once scores each of them."""
+        # S's around (1, 1) on a 4x4 board, so an O there completes all four lines through it
+        self.game_manager.reset_game(4, "General")
+        for row, col in [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            self.game_manager.make_move(row, col, 'S')
+        result = self.game_manager.make_move(1, 1, 'O')
+
+        self.assertEqual(result["result"], "continue")
+        self.assertEqual(self.game_manager.sos_count["Blue"], 4)
+
     def test_general_mode_end_game_with_sos_counts(self):
         """Test that the game ends with the player with the most SOS counts winning."""
         moves = [
@@ -0,0 +1,63 @@
+import unittest
+from game_manager import GameManager
+from mcts_player import MCTSPlayer, position_snapshot, restore_position
+
+class TestMCTSPlayer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a 3x3 Simple game for each test."""
+        self.game_manager = GameManager(board_size=3, game_mode="Simple")
+        self.game_manager.reset_game(3, "Simple")
+
+    def test_takes_winning_move_in_simple_mode(self):
+        """Test that the player completes an available SOS in Simple mode."""
+        self.game_manager.make_move(0, 0, 'S')
+        self.game_manager.make_move(0, 1, 'O')
+        player = MCTSPlayer(time_limit=5.0, max_playouts=600, workers=0, seed=0)
+
+        self.assertEqual(player.choose_move(self.game_manager), (0, 2, 'S'))
+        self.assertEqual(player.last_stats["playouts"], 600)
+
+    def test_search_leaves_game_unchanged(self):
+        """Test that searching restores the board, player and move log."""
+        self.game_manager.reset_game(5, "General")
+        self.game_manager.make_move(2, 2, 'O')
+        self.game_manager.switch_turn()
+        player = MCTSPlayer(time_limit=5.0, max_playouts=200, workers=0, seed=0)
+
+        row, col, character = player.choose_move(self.game_manager)
+
+        self.assertEqual(self.game_manager.board[row][col], ' ')
+        self.assertEqual(self.game_manager.get_current_player(), "Red")
+        self.assertEqual(self.game_manager.empty_count, 24)
+        self.assertEqual(len(self.game_manager.move_log), 1)
+
+    def test_snapshot_round_trip(self):
+        """Test that a restored snapshot has the same board, scores and player."""
+        self.game_manager.reset_game(4, "General")
+        for row, col, character in [(0, 0, 'S'), (0, 1, 'O'), (0, 2, 'S'), (3, 3, 'O')]:
+            self.game_manager.make_move(row, col, character)
+        self.game_manager.switch_turn()
+
+        restored = restore_position(position_snapshot(self.game_manager))
+
+        self.assertEqual(restored.board, self.game_manager.board)
+        self.assertEqual(restored.sos_count, {"Blue": 1, "Red": 0})
+        self.assertEqual(restored.get_current_player(), "Red")
+        self.assertEqual(restored.empty_count, 12)
+
+    def test_playouts_in_process_pool(self):
+        """Test that playouts run through worker processes return a legal move."""
+        self.game_manager.reset_game(4, "General")
+        player = MCTSPlayer(time_limit=5.0, max_playouts=32, workers=1, seed=0)
+        try:
+            row, col, character = player.choose_move(self.game_manager)
+        finally:
+            player.close()
+
+        self.assertIn((row, col), self.game_manager.legal_moves())
+        self.assertIn(character, ('S', 'O'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from game_manager import GameManager
+from opening_book import BOOK_DIRECTORY_VARIABLE, BOOK_MAGIC, OpeningBook, Solver, book_path, build_book, get_book
+
+class TestOpeningBook(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the 3x3 books once in a temporary directory."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.books = {mode: build_book(3, mode, cls.directory.name)[0] for mode in ("Simple", "General")}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def move_value(self, book, game_manager, row, col, character):
+        """Returns the value of a move for the player making it, using the book for the position after it."""
+        result = game_manager.make_move(row, col, character)["result"]
+        gain = game_manager.move_log[-1].sos_delta
+        if result == "win":
+            value = 1
+        elif result in ("draw", "end"):
+            value = gain
+        elif result == "continue":
+            value = gain + book.lookup(game_manager)[0]
+        else:
+            game_manager.switch_turn()
+            value = -book.lookup(game_manager)[0]
+        game_manager.unmake_move()
+        return value
+
+    def test_book_values_are_consistent_with_their_moves(self):
+        """Test that in random positions the book move achieves the book value and no move beats it."""
+        rng = random.Random(4)
+        for mode, book in self.books.items():
+            for _ in range(40):
+                game_manager = GameManager(3, mode)
+                game_manager.reset_game(3, mode)
+                for row, col in rng.sample(sorted(game_manager.legal_moves()), rng.randrange(8)):
+                    result = game_manager.make_move(row, col, rng.choice("SO"))["result"]
+                    if result in ("win", "draw", "end"):
+                        game_manager.unmake_move()
+                        break
+                    if result == "next_turn":
+                        game_manager.switch_turn()
+
+                value, (row, col, character) = book.lookup(game_manager)
+                self.assertEqual(self.move_value(book, game_manager, row, col, character), value)
+                for other_row, other_col in list(game_manager.legal_moves()):
+                    for other_character in ('S', 'O'):
+                        self.assertLessEqual(
+                            self.move_value(book, game_manager, other_row, other_col, other_character), value)
+
+    def test_known_results(self):
+        """Test the values of the empty 3x3 boards and of a position with a winning move."""
+        for mode, book in self.books.items():
+            game_manager = GameManager(3, mode)
+            game_manager.reset_game(3, mode)
+            self.assertEqual(book.lookup(game_manager)[0], 0)
+
+        game_manager = GameManager(3, "Simple")
+        game_manager.reset_game(3, "Simple")
+        game_manager.make_move(0, 2, 'S')
+        game_manager.make_move(2, 2, 'S')
+        self.assertEqual(self.books["Simple"].lookup(game_manager), (1, (1, 2, 'O')))
+
+    def test_saved_book_loads_identically(self):
+        """Test that get_book reads back the book build_book wrote."""
+        book = get_book(3, "General", self.directory.name)
+        self.assertIsInstance(book, OpeningBook)
+        self.assertEqual(len(book), len(self.books["General"]))
+        self.assertEqual(list(book.keys), list(self.books["General"].keys))
+        self.assertEqual(list(book.moves), list(self.books["General"].moves))
+        missing = os.path.join(self.directory.name, "missing")
+        self.assertIsNone(get_book(4, "General", missing))
+        self.assertEqual(len(get_book(3, "Simple", missing)), len(self.books["Simple"]))  # Solved on first use
+        self.assertTrue(os.path.exists(os.path.join(missing, "sos_3x3_simple.book")))
+
+    def test_truncated_books_are_rejected(self):
+        """Test that a cut-off book raises ValueError and that get_book solves it again or falls back to search."""
+        with open(book_path(3, "General", self.directory.name), "rb") as file:
+            contents = file.read()
+        with tempfile.TemporaryDirectory() as directory:
+            for length in (3, len(BOOK_MAGIC) + 2, len(contents) // 2, len(contents) - 1):
+                path = book_path(3, "General", directory)
+                with open(path, "wb") as file:
+                    file.write(contents[:length])
+                with self.assertRaises(ValueError):
+                    OpeningBook.load(path)
+            self.assertEqual(len(get_book(3, "General", directory)), len(self.books["General"]))
+            self.assertEqual(OpeningBook.load(path).keys, self.books["General"].keys)
+            self.assertEqual(sorted(os.listdir(directory)), ["sos_3x3_general.book"])  # Saved whole, no leftovers
+
+            with open(book_path(4, "Simple", directory), "wb") as file:
+                file.write(contents[:len(contents) // 2])
+            self.assertIsNone(get_book(4, "Simple", directory))
+
+    def test_default_directory_is_outside_the_source_tree(self):
+        """Test that books default to the user cache directory and that SOS_BOOK_DIR overrides it."""
+        source_directory = os.path.dirname(os.path.abspath(__file__))
+        with mock.patch.dict(os.environ, {BOOK_DIRECTORY_VARIABLE: ""}):
+            self.assertFalse(book_path(3, "Simple").startswith(source_directory))
+        with mock.patch.dict(os.environ, {BOOK_DIRECTORY_VARIABLE: self.directory.name}):
+            self.assertEqual(book_path(3, "Simple"), os.path.join(self.directory.name, "sos_3x3_simple.book"))
+            self.assertEqual(len(get_book(3, "Simple")), len(self.books["Simple"]))
+
+    def test_large_boards_are_refused(self):
+        """Test that the solver refuses boards too large to solve exhaustively."""
+        with self.assertRaises(ValueError):
+            Solver(5, "Simple")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from alphabeta_player import AlphaBetaPlayer
+from game_manager import GameManager
+from players import GreedyPlayer, RandomPlayer, create_player, parse_player_spec, play_game
+
+class TestPlayers(unittest.TestCase):
+
+    def test_greedy_player_takes_the_largest_score(self):
+        """Test that the greedy player completes two lines rather than one."""
+        game_manager = GameManager(3, "General")
+        game_manager.reset_game(3, "General")
+        # S's in the corners: an O on an edge completes one line, an O in the centre both diagonals
+        for row, col in ((0, 0), (0, 2), (2, 0), (2, 2)):
+            game_manager.make_move(row, col, 'S')
+        self.assertEqual(GreedyPlayer(seed=0).choose_move(game_manager), (1, 1, 'O'))
+
+    def test_player_specs(self):
+        """Test that specs pick the player type and convert their options."""
+        self.assertEqual(parse_player_spec("alphabeta:time_limit=0.5,max_depth=3"),
+                         ("alphabeta", {"time_limit": 0.5, "max_depth": 3}))
+        player = create_player("alphabeta:max_depth=2", seed=1)
+        self.assertIsInstance(player, AlphaBetaPlayer)
+        self.assertEqual(player.max_depth, 2)
+        with self.assertRaises(ValueError):
+            parse_player_spec("perfect")
+        with self.assertRaises(ValueError):
+            parse_player_spec("mcts:workers")
+        with self.assertRaisesRegex(ValueError, "no option 'depth'"):
+            create_player("greedy:depth=3")
+
+    def test_play_game_reports_a_consistent_outcome(self):
+        """Test that played games fill the board or end on a win, with matching scores."""
+        for mode in ("Simple", "General"):
+            for seed in range(10):
+                players = {"Blue": RandomPlayer(seed), "Red": GreedyPlayer(seed)}
+                moves = []
+                outcome = play_game(players, 4, mode, on_move=lambda game_manager, move: moves.append(move))
+                self.assertEqual(outcome["moves"], len(moves))
+                if mode == "General":
+                    self.assertEqual(outcome["moves"], 16)
+                    blue, red = outcome["blue_score"], outcome["red_score"]
+                    self.assertEqual(outcome["winner"], "Blue" if blue > red else "Red" if red > blue else "Draw")
+                elif outcome["winner"] == "Draw":
+                    self.assertEqual(outcome["moves"], 16)
+
+if __name__ == '__main__':
+    unittest.main()
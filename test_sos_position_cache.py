@@ -0,0 +1,98 @@
+import random
+import unittest
+from alphabeta_player import AlphaBetaPlayer
+from game_manager import GameManager
+from position_cache import PositionCache, SymmetricZobrist, canonical_key, get_symmetries, map_cell
+
+def transformed_game(game_manager, symmetry):
+    """Returns a new GameManager whose board is game_manager's board moved by a symmetry."""
+    size = game_manager.board_size
+    clone = game_manager.copy()
+    clone.board = [[' '] * size for _ in range(size)]
+    for cell in range(size * size):
+        image = symmetry[cell]
+        clone.board[image // size][image % size] = game_manager.board[cell // size][cell % size]
+    return clone
+
+class TestPositionCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a 4x4 General game with a few random moves for each test."""
+        rng = random.Random(5)
+        self.game_manager = GameManager(4, "General")
+        self.game_manager.reset_game(4, "General")
+        for row, col in rng.sample(sorted(self.game_manager.legal_moves()), 6):
+            self.game_manager.make_move(row, col, rng.choice("SO"))
+
+    def test_symmetries_are_distinct_permutations(self):
+        """Test that there are eight different symmetries, each a permutation of the cells."""
+        symmetries = get_symmetries(4)
+        self.assertEqual(len(set(symmetries)), 8)
+        self.assertEqual(symmetries[0], tuple(range(16)))
+        for symmetry in symmetries:
+            self.assertEqual(sorted(symmetry), list(range(16)))
+
+    def test_canonical_key_is_shared_by_symmetric_boards(self):
+        """Test that all eight transformed boards get the same canonical key and hash."""
+        key, index = canonical_key(self.game_manager)
+        keys = AlphaBetaPlayer().get_zobrist_keys(4)
+        hasher = SymmetricZobrist(4, keys)
+        canonical_hash = hasher.canonical(hasher.hashes(self.game_manager.board))[0]
+
+        for symmetry in get_symmetries(4):
+            other = transformed_game(self.game_manager, symmetry)
+            self.assertEqual(canonical_key(other)[0], key)
+            self.assertEqual(hasher.canonical(hasher.hashes(other.board))[0], canonical_hash)
+
+        # The canonical board holds each cell's character at its mapped cell
+        cells = key[1]
+        for cell in range(16):
+            row, col = divmod(cell, 4)
+            self.assertEqual(cells[map_cell(4, index, cell)], self.game_manager.board[row][col])
+
+    def test_key_keeps_side_and_score(self):
+        """Test that the side to move and score difference separate otherwise equal positions."""
+        key = canonical_key(self.game_manager)[0]
+        self.game_manager.switch_turn()
+        self.assertNotEqual(canonical_key(self.game_manager)[0], key)
+        self.assertEqual(canonical_key(self.game_manager, include_side=False)[0][:2], key[:2])
+
+    def test_incremental_hashes_match_from_scratch(self):
+        """Test that updating the symmetric hashes move by move matches recomputing them."""
+        hasher = SymmetricZobrist(4, AlphaBetaPlayer().get_zobrist_keys(4))
+        hashes = hasher.hashes(self.game_manager.board)
+        row, col = min(self.game_manager.legal_moves())
+        self.game_manager.make_move(row, col, 'O')
+        self.assertEqual(hasher.update(hashes, row * 4 + col, 'O'),
+                         hasher.hashes(self.game_manager.board))
+
+    def test_lru_eviction_and_stats(self):
+        """Test that the least recently used entry is evicted and lookups are counted."""
+        cache = PositionCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)  # Evicts "b", the least recently used
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 1, "misses": 1, "evictions": 1, "hit_rate": 0.5})
+
+    def test_alphabeta_searches_fewer_nodes_with_the_cache(self):
+        """Test that the symmetry cache cuts the nodes of a fixed-depth search and still finds a win."""
+        plain = AlphaBetaPlayer(time_limit=60.0, max_depth=4, seed=0)
+        cached = AlphaBetaPlayer(time_limit=60.0, max_depth=4, seed=0, position_cache=PositionCache())
+        for player in (plain, cached):
+            game_manager = GameManager(4, "Simple")
+            game_manager.reset_game(4, "Simple")
+            player.choose_move(game_manager)
+        self.assertLess(cached.last_stats["nodes"], plain.last_stats["nodes"])
+        self.assertGreater(cached.last_stats["cache_hit_rate"], 0)
+
+        game_manager = GameManager(3, "Simple")
+        game_manager.reset_game(3, "Simple")
+        game_manager.make_move(2, 0, 'S')
+        game_manager.make_move(1, 1, 'O')
+        self.assertEqual(cached.choose_move(game_manager), (0, 2, 'S'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from game_manager import GameManager
+from self_play import (PLANE_EMPTY, PLANE_O, PLANE_S, PLANE_SIDE, ShardDataset, decode_move, encode_position,
+                       generate)
+
+class TestSelfPlay(unittest.TestCase):
+
+    def setUp(self):
+        """Generate a small General data set with two workers for each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data")
+        self.manifest = generate(self.path, 30, 4, "General", blue="greedy", red="random",
+                                 workers=2, shard_size=100, seed=3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_encode_position(self):
+        """Test the planes of a position with one S, one O and Red to move."""
+        game_manager = GameManager(3, "Simple")
+        game_manager.reset_game(3, "Simple")
+        game_manager.make_move(0, 0, 'S')
+        game_manager.make_move(1, 2, 'O')
+        game_manager.switch_turn()
+        planes = encode_position(game_manager)
+        self.assertEqual(planes.dtype, np.uint8)
+        self.assertEqual(planes[PLANE_S, 0, 0], 1)
+        self.assertEqual(planes[PLANE_O, 1, 2], 1)
+        self.assertEqual(planes[PLANE_S].sum() + planes[PLANE_O].sum() + planes[PLANE_EMPTY].sum(), 9)
+        self.assertEqual(planes[PLANE_SIDE].sum(), 0)
+
+    def test_shards_are_fixed_size_and_per_worker(self):
+        """Test that only each worker's last shard is short and every position is listed."""
+        shards = self.manifest["shards"]
+        self.assertEqual(self.manifest["positions"], 30 * 16)  # General games fill the board
+        self.assertEqual(sorted(os.listdir(self.path)), sorted([shard["file"] for shard in shards] + ["manifest.json"]))
+        for worker in ("shard-000", "shard-001"):
+            counts = [shard["positions"] for shard in shards if shard["file"].startswith(worker)]
+            self.assertTrue(all(count == 100 for count in counts[:-1]))
+            self.assertLessEqual(counts[-1], 100)
+        with self.assertRaises(ValueError):
+            generate(self.path, 1, 4, "General", workers=0)
+
+    def test_examples_replay_as_games(self):
+        """Test that the stored moves replay to the stored positions, outcomes and margins."""
+        dataset = ShardDataset(self.path)
+        shard = next(dataset.shards())
+        self.assertIsInstance(shard, np.memmap)
+        game_manager = GameManager(4, "General")
+        game_manager.reset_game(4, "General")
+        start = 0
+        for example in shard[:64]:  # The first four games of worker 0
+            np.testing.assert_array_equal(example["planes"], encode_position(game_manager))
+            result = game_manager.make_move(*decode_move(4, example["move"]))
+            if result["result"] == "next_turn":
+                game_manager.switch_turn()
+            elif result["result"] == "end":
+                margin = result["blue_score"] - result["red_score"]
+                for past in shard[start:start + 16]:
+                    blue_to_move = past["planes"][PLANE_SIDE].all()
+                    self.assertEqual(past["margin"], margin if blue_to_move else -margin)
+                    self.assertEqual(past["outcome"], np.sign(past["margin"]))
+                start += 16
+                game_manager.reset_game(4, "General")
+
+    def test_batches_cover_every_example(self):
+        """Test that shuffled batches hand out every example exactly once."""
+        dataset = ShardDataset(self.path)
+        batches = list(dataset.batches(batch_size=32, shuffle=True, seed=0))
+        self.assertTrue(all(len(batch["move"]) <= 32 for batch in batches))
+        moves = np.concatenate([batch["move"] for batch in batches])
+        expected = np.concatenate([shard["move"] for shard in dataset.shards()])
+        self.assertEqual(len(moves), len(dataset))
+        np.testing.assert_array_equal(np.sort(moves), np.sort(expected))
+
+if __name__ == '__main__':
+    unittest.main()
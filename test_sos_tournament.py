@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+from tournament import elo_ratings, run_tournament, schedule_games, standings
+
+def game(blue, red, winner):
+    """Returns a minimal game result for the rating functions."""
+    return {"blue": blue, "red": red, "winner": winner}
+
+class TestTournament(unittest.TestCase):
+
+    def test_schedule_alternates_colours(self):
+        """Test that every pair plays each colour equally often in every setting."""
+        schedule = schedule_games(["a", "b", "c"], [3, 4], ["Simple"], 4)
+        self.assertEqual(len(schedule), 2 * 3 * 4)
+        self.assertEqual([entry["game"] for entry in schedule], list(range(24)))
+        blues = [entry["blue"] for entry in schedule if {entry["blue"], entry["red"]} == {"a", "b"}]
+        self.assertEqual(blues.count("a"), blues.count("b"))
+
+    def test_elo_ratings(self):
+        """Test that even results rate players equally and a stronger record rates higher."""
+        even = [game("a", "b", "Blue"), game("b", "a", "Blue"), game("a", "b", "Draw")]
+        ratings = elo_ratings(even, ["a", "b"])
+        self.assertAlmostEqual(ratings["a"], 1500)
+        self.assertAlmostEqual(ratings["b"], 1500)
+
+        # a beats b three times in four, so with the virtual draw scores 3.5 of 5: odds 7:3
+        uneven = [game("a", "b", "Blue"), game("b", "a", "Red"), game("a", "b", "Blue"), game("b", "a", "Blue")]
+        ratings = elo_ratings(uneven, ["a", "b", "idle"])
+        self.assertAlmostEqual(ratings["a"] - ratings["b"], 400 * 0.3679767852945943, places=6)
+        self.assertAlmostEqual(ratings["a"] + ratings["b"], 3000)
+        self.assertEqual(ratings["idle"], 1500)
+        self.assertEqual(standings(uneven, ["a", "b"])["a"], {"wins": 3, "draws": 0, "losses": 1, "games": 4,
+                                                              "score": 3.0})
+
+    def test_interrupted_tournament_resumes_from_checkpoint(self):
+        """Test that a resumed run plays only the missing games and gives the same standings."""
+        players = ["random", "greedy"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tournament.jsonl")
+            full = run_tournament(players, [3], ["Simple", "General"], 4, workers=0, checkpoint=path)
+            self.assertEqual(full["games_played"], 8)
+
+            with open(path) as file:
+                lines = file.readlines()
+            with open(path, "w") as file:
+                file.writelines(lines[:4])
+                file.write(lines[4][:10])  # A line cut short by the interruption
+            resumed = run_tournament(players, [3], ["Simple", "General"], 4, workers=0, checkpoint=path)
+            self.assertEqual(resumed["games_played"], 5)
+            self.assertEqual(resumed["players"], full["players"])
+            with open(path) as file:
+                self.assertEqual(len([json.loads(line) for line in file]), 9)
+
+            with self.assertRaises(ValueError):
+                run_tournament(players, [4], ["Simple"], 4, workers=0, checkpoint=path)
+
+    def test_bad_player_options_are_rejected_before_starting(self):
+        """Test that an unknown player option fails before any game is played or checkpointed."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.jsonl")
+            with self.assertRaisesRegex(ValueError, "no option 'depth'"):
+                run_tournament(["random", "greedy:depth=3"], [3], ["Simple"], 2, workers=0, checkpoint=path)
+            self.assertFalse(os.path.exists(path))
+
+    def test_empty_and_corrupt_checkpoints(self):
+        """Test that an empty checkpoint starts afresh and unreadable lines are reported as such."""
+        players = ["random", "greedy"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tournament.jsonl")
+            open(path, "w").close()
+            report = run_tournament(players, [3], ["Simple"], 2, workers=0, checkpoint=path)
+            self.assertEqual(report["games_played"], 2)
+            with open(path) as file:
+                lines = file.readlines()
+            self.assertIn('"tournament"', lines[0])
+
+            with open(path, "w") as file:
+                file.writelines([lines[0], "{not json\n", lines[2]])
+            with self.assertRaisesRegex(ValueError, "not a readable checkpoint: line 2"):
+                run_tournament(players, [3], ["Simple"], 2, workers=0, checkpoint=path)
+
+    def test_process_pool_plays_every_game(self):
+        """Test that games spread over worker processes are all reported."""
+        report = run_tournament(["random", "greedy", "alphabeta:max_depth=1"], [3], ["General"], 2, workers=2)
+        self.assertEqual(report["games"], 6)
+        self.assertEqual(sum(entry["games"] for entry in report["players"]), 12)
+        self.assertGreater(report["games_per_second"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
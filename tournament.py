@@ -0,0 +1,314 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from players import close_player, create_player, parse_player_spec, play_game
+
+ELO_BASE = 1500  # Rating of an average entrant
+ELO_SCALE = 400  # Rating difference at which the stronger side is expected to score 10:1
+BOOTSTRAP_SAMPLES = 200  # Resampled tournaments behind each confidence interval
+CONFIDENCE = 0.95
+SCORES = {"win": 1.0, "draw": 0.5, "loss": 0.0}
+
+
+def schedule_games(players, sizes, modes, games_per_pair, seed=0):
+    """Returns the round-robin schedule: every pair plays games_per_pair games per board size and mode.
+
+    Colours alternate between the games of a pair, so neither player gets the
+    first move more often. Game ids are positions in the schedule, which makes
+    them stable across runs with the same settings.
+    """
+    schedule = []
+    for board_size, game_mode in itertools.product(sizes, modes):
+        for first, second in itertools.combinations(players, 2):
+            for number in range(games_per_pair):
+                blue, red = (first, second) if number % 2 == 0 else (second, first)
+                game_id = len(schedule)
+                schedule.append({"game": game_id, "blue": blue, "red": red, "board_size": board_size,
+                                 "game_mode": game_mode, "seed": seed * 1000003 + game_id})
+    return schedule
+
+
+def play_scheduled_game(game):
+    """Plays one scheduled game and returns it with its outcome added; executed in worker processes."""
+    blue = create_player(game["blue"], seed=game["seed"])
+    red = create_player(game["red"], seed=game["seed"] + 1)
+    start = time.perf_counter()
+    try:
+        outcome = play_game({"Blue": blue, "Red": red}, game["board_size"], game["game_mode"])
+    finally:
+        close_player(blue)
+        close_player(red)
+    return dict(game, seconds=time.perf_counter() - start, **outcome)
+
+
+def load_checkpoint(path, settings):
+    """Returns {game id: result} from a checkpoint file, or {} if it does not exist yet or holds no complete line.
+
+    A last line without its newline was cut short by an interruption and is
+    ignored. Raises ValueError if a complete line is not valid JSON, or if
+    the checkpoint was written for different settings, since its game ids
+    would then refer to other games.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        lines = file.readlines()
+    if lines and not lines[-1].endswith("\n"):
+        lines.pop()  # Cut short when the run was interrupted
+    if not lines:
+        return {}
+
+    records = []
+    for number, line in enumerate(lines, start=1):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path} is not a readable checkpoint: line {number}: {error}") from None
+    if not isinstance(records[0], dict) or "tournament" not in records[0]:
+        raise ValueError(f"{path} is not a tournament checkpoint")
+    if records[0]["tournament"] != settings:
+        raise ValueError(f"{path} is a checkpoint of a tournament with different settings")
+    return {result["game"]: result for result in records[1:]}
+
+
+def trim_checkpoint(path):
+    """Cuts a checkpoint file back to its last complete line, so games appended after it stay readable."""
+    with open(path, "rb+") as file:
+        data = file.read()
+        file.truncate(data.rfind(b"\n") + 1)
+
+
+def player_score(result, player):
+    """Returns 1, 0.5 or 0 for a player's result in one game."""
+    if result["winner"] == "Draw":
+        return SCORES["draw"]
+    colour = "blue" if result["blue"] == player else "red"
+    return SCORES["win"] if result["winner"].lower() == colour else SCORES["loss"]
+
+
+def standings(results, players):
+    """Returns {player: {"wins", "draws", "losses", "games", "score"}} over every result."""
+    table = {player: {"wins": 0, "draws": 0, "losses": 0, "games": 0, "score": 0.0} for player in players}
+    for result in results:
+        for player in (result["blue"], result["red"]):
+            score = player_score(result, player)
+            row = table[player]
+            row["wins" if score == 1 else "draws" if score == 0.5 else "losses"] += 1
+            row["games"] += 1
+            row["score"] += score
+    return table
+
+
+def pairwise_table(results, players):
+    """Returns {player: {opponent: [wins, draws, losses]}} from each player's point of view."""
+    table = {player: {opponent: [0, 0, 0] for opponent in players if opponent != player} for player in players}
+    for result in results:
+        blue, red = result["blue"], result["red"]
+        for player, opponent in ((blue, red), (red, blue)):
+            score = player_score(result, player)
+            table[player][opponent][0 if score == 1 else 1 if score == 0.5 else 2] += 1
+    return table
+
+
+def elo_ratings(results, players, iterations=1000):
+    """Returns {player: Elo rating} fitted to the results by maximum likelihood.
+
+    Ratings are those of the Bradley-Terry model, computed with the usual
+    minorisation-maximisation updates and counting a draw as half a win. One
+    virtual draw per pairing keeps the ratings finite for players that won
+    or lost every game. The average rating is ELO_BASE.
+    """
+    games = {player: {} for player in players}  # Games played between each pair
+    points = {player: 0.0 for player in players}
+    for result in results:
+        blue, red = result["blue"], result["red"]
+        blue_points = player_score(result, blue)
+        points[blue] += blue_points
+        points[red] += 1 - blue_points
+        games[blue][red] = games[blue].get(red, 0) + 1
+        games[red][blue] = games[red].get(blue, 0) + 1
+    for player, opponents in games.items():
+        for opponent in opponents:
+            opponents[opponent] += 1  # The virtual draw
+            points[player] += 0.5
+
+    strengths = {player: 1.0 for player in players}
+    for _ in range(iterations):
+        largest_change = 0.0
+        for player, opponents in games.items():
+            if not opponents:
+                continue
+            denominator = sum(count / (strengths[player] + strengths[opponent])
+                              for opponent, count in opponents.items())
+            strength = points[player] / denominator
+            largest_change = max(largest_change, abs(strength - strengths[player]) / strengths[player])
+            strengths[player] = strength
+        if largest_change < 1e-10:
+            break
+
+    rated = [player for player in players if games[player]]
+    mean_log = sum(math.log10(strengths[player]) for player in rated) / len(rated) if rated else 0.0
+    return {player: ELO_BASE + ELO_SCALE * (math.log10(strengths[player]) - mean_log) if games[player] else ELO_BASE
+            for player in players}
+
+
+def elo_confidence_intervals(results, players, samples=BOOTSTRAP_SAMPLES, confidence=CONFIDENCE, seed=0):
+    """Returns {player: (low, high)} Elo bounds from ratings refitted to resampled sets of games."""
+    rng = random.Random(seed)
+    sampled = {player: [] for player in players}
+    for _ in range(samples):
+        ratings = elo_ratings(rng.choices(results, k=len(results)), players)
+        for player, rating in ratings.items():
+            sampled[player].append(rating)
+
+    tail = (1 - confidence) / 2
+    intervals = {}
+    for player, ratings in sampled.items():
+        ratings.sort()
+        low = ratings[min(len(ratings) - 1, int(tail * len(ratings)))]
+        high = ratings[max(0, math.ceil((1 - tail) * len(ratings)) - 1)]
+        intervals[player] = (low, high)
+    return intervals
+
+
+def tournament_report(results, players, elapsed, games_played, seed=0):
+    """Returns the standings, Elo ratings with confidence intervals, pairwise results and throughput."""
+    table = standings(results, players)
+    ratings = elo_ratings(results, players)
+    intervals = elo_confidence_intervals(results, players, seed=seed) if results else {}
+    ranking = sorted(players, key=lambda player: -ratings[player])
+    return {
+        "players": [dict(table[player], name=player, elo=ratings[player],
+                         elo_interval=intervals.get(player, (ELO_BASE, ELO_BASE))) for player in ranking],
+        "pairwise": pairwise_table(results, players),
+        "games": len(results),
+        "games_played": games_played,
+        "elapsed": elapsed,
+        "games_per_second": games_played / elapsed if elapsed else 0.0,
+    }
+
+
+def format_report(report):
+    """Formats a tournament report as plain-text tables."""
+    names = [entry["name"] for entry in report["players"]]
+    width = max([len("Player")] + [len(name) for name in names])
+    percent = round(CONFIDENCE * 100)
+    lines = [f"{'Player':<{width}}  {'Elo':>6}  {f'{percent}% interval':>15}  {'W':>5} {'D':>5} {'L':>5}  {'Score':>6}"]
+    for entry in report["players"]:
+        low, high = entry["elo_interval"]
+        lines.append(f"{entry['name']:<{width}}  {entry['elo']:6.0f}  {f'{low:.0f} to {high:.0f}':>15}  "
+                     f"{entry['wins']:5d} {entry['draws']:5d} {entry['losses']:5d}  {entry['score']:6.1f}")
+
+    lines.append("")
+    lines.append("Wins-draws-losses of each row against each column")
+    cell_width = max(width, 11)
+    lines.append(" " * width + "".join(f"  {name[:cell_width]:>{cell_width}}" for name in names))
+    for name in names:
+        cells = []
+        for opponent in names:
+            record = report["pairwise"][name].get(opponent)
+            cells.append("-" if record is None else "-".join(map(str, record)))
+        lines.append(f"{name:<{width}}" + "".join(f"  {cell:>{cell_width}}" for cell in cells))
+
+    lines.append("")
+    lines.append(f"{report['games_played']} games played in {report['elapsed']:.1f}s "
+                 f"({report['games_per_second']:.1f} games/s), {report['games']} in total")
+    return "\n".join(lines)
+
+
+def run_tournament(players, sizes, modes, games_per_pair, workers=None, checkpoint=None, seed=0, progress=None):
+    """Plays a round-robin tournament across a process pool and returns its report.
+
+    With a checkpoint path, every finished game is appended to that file and
+    games already in it are not played again, so an interrupted run picks up
+    where it stopped. workers=0 plays every game in this process. progress,
+    if given, is called with (finished, total) after every game.
+    """
+    if len(set(players)) != len(players) or len(players) < 2:
+        raise ValueError("A tournament needs at least two different players")
+    for spec in players:
+        parse_player_spec(spec)  # Reject bad specs before starting any worker
+
+    settings = {"players": list(players), "sizes": list(sizes), "modes": list(modes),
+                "games_per_pair": games_per_pair, "seed": seed}
+    schedule = schedule_games(players, sizes, modes, games_per_pair, seed)
+    results = load_checkpoint(checkpoint, settings) if checkpoint else {}
+    pending = [game for game in schedule if game["game"] not in results]
+
+    checkpoint_file = None
+    if checkpoint:
+        if os.path.exists(checkpoint):
+            trim_checkpoint(checkpoint)
+        checkpoint_file = open(checkpoint, "a")
+        if checkpoint_file.tell() == 0:  # New, empty or holding only a header cut short
+            checkpoint_file.write(json.dumps({"tournament": settings}) + "\n")
+
+    def finish(result):
+        results[result["game"]] = result
+        if checkpoint_file is not None:
+            checkpoint_file.write(json.dumps(result) + "\n")
+            checkpoint_file.flush()
+        if progress is not None:
+            progress(len(results), len(schedule))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    try:
+        if workers == 0:
+            for game in pending:
+                finish(play_scheduled_game(game))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(play_scheduled_game, game) for game in pending]
+                try:
+                    for future in as_completed(futures):
+                        finish(future.result())
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+    finally:
+        if checkpoint_file is not None:
+            checkpoint_file.close()
+    elapsed = time.perf_counter() - start
+
+    ordered = [results[game["game"]] for game in schedule]
+    return tournament_report(ordered, list(players), elapsed, len(pending), seed)
+
+
+def main(argv=None):
+    """Runs a tournament from the command line and prints its tables."""
+    parser = argparse.ArgumentParser(description="Play a round-robin SOS tournament between computer players.")
+    parser.add_argument("players", nargs="+",
+                        help="player specs such as random, greedy, alphabeta:time_limit=0.2 or mcts:max_playouts=500")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 5])
+    parser.add_argument("--modes", nargs="+", choices=["Simple", "General"], default=["Simple", "General"])
+    parser.add_argument("--games", type=int, default=10, help="games per pair of players, board size and mode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes; 0 plays in this process")
+    parser.add_argument("--checkpoint", help="file recording finished games, used to resume an interrupted run")
+    parser.add_argument("--output", help="also write the report as JSON to this file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    def show_progress(finished, total):
+        print(f"\r{finished}/{total} games", end="", flush=True)
+
+    try:
+        report = run_tournament(args.players, args.sizes, args.modes, args.games, args.workers,
+                                args.checkpoint, args.seed, progress=show_progress)
+    except ValueError as error:
+        parser.error(str(error))
+    print()
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()